@@ -0,0 +1,26 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Only the modules needed by every document are imported here. The Windows modules (winreg, pywin32) and the
+# modules of the optional features (asyncio for AsyncConverter and ConversionServer, multiprocessing for convertBatch,
+# concurrent.futures, logging, argparse...) are imported by the functions using them: importing this package stays
+# fast, and works on the machines without Windows and Office (see NativeBackend).
+
+from .utils import suppress
+from .registry import (
+    allSupportedMSProgram, allSupportedMSProgramExe, defaultRegKeysMarkerPath, appPathsKey, Registry, WindowsRegistry,
+    MemoryRegistry, getDefaultRegistry, prepareRegKeys)
+from .folders import archiveFormats
+from .backends import OfficeBackend, ComBackend, NativeBackend, registerBackend, getBackend
+from .metrics import ExportMetrics, addMetricsSink, removeMetricsSink, LogSink, PrometheusTextfileSink
+from .cache import ConversionCache, IncrementalManifest
+from .pool import ExportTimeout, Quarantine, OpenProfile, defaultOpenProfile, OfficeApplicationPool, getDefaultPool
+from .xlsx import defaultSharedStringsMemory, SheetArrays
+from .documents import (
+    ExportResult, WordDocument, ExcelDocument, PowerPointDocument, wordExtensions, excelExtensions,
+    powerPointExtensions, openDocument)
+from .scheduling import LatencyModel, priorityClasses, JobScheduler
+from .batch import BatchJob, BatchResult, BatchSummary, jobsFromDirectory, jobsFromManifest, convertBatch
+from .converter import AsyncConverter, getDefaultAsyncConverter
+from .server import ConversionServer
+from .cli import main
@@ -0,0 +1,8 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,145 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# The backends starting the Office programs: COM (Windows) or none (native engines only).
+
+import os
+import sys
+import threading
+import signal
+
+from .utils import suppress
+from .registry import allSupportedMSProgram, allSupportedMSProgramExe, defaultRegKeysMarkerPath, getDefaultRegistry, prepareRegKeys
+
+
+class OfficeBackend:
+    """Interface between the document classes and the program that really does the export.
+The application returned by dispatch() must behave like the Microsoft Office automation object."""
+    def prepare(self):
+        """Called once for every document object created with this backend."""
+        pass
+
+    def dispatch(self, progName):
+        """Start a new application instance and return it."""
+        raise NotImplementedError()
+
+    def quit(self, application):
+        """Quit an application instance returned by dispatch()."""
+        application.Application.Quit()
+
+    def kill(self, application):
+        """Terminate an application instance which does not answer anymore (EX. stuck on a dialog box).
+        Called by the watchdog thread while another thread is blocked in a call to the application."""
+        raise NotImplementedError()
+
+    def threadInit(self):
+        """Called by a worker thread (see AsyncConverter) before it uses the backend."""
+        pass
+
+    def threadExit(self):
+        """Called by a worker thread when it stops using the backend."""
+        pass
+
+
+class ComBackend(OfficeBackend):
+    """Backend using the real Microsoft Office programs through COM (Windows only).
+    - registry : The Registry where the Office security values are written (default: the Windows registry, shared by every ComBackend of the process).
+    - markerPath : See prepareRegKeys."""
+    def __init__(self, registry=None, markerPath=defaultRegKeysMarkerPath):
+        self.registry = registry if registry is not None else getDefaultRegistry()
+        self.markerPath = markerPath
+        self._processIds = {}
+        self._dispatchLock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_processIds'], state['_dispatchLock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._processIds = {}
+        self._dispatchLock = threading.Lock()
+
+    def prepare(self):
+        prepareRegKeys(self.registry, self.markerPath)
+
+    def dispatch(self, progName):
+        import win32com.client
+        # The process started is found by comparing the running processes before and after, so kill() can terminate it.
+        with self._dispatchLock:
+            before = _officeProcessIds(progName)
+            # DispatchEx always start a new process, so multiple pooled instances never share the same program.
+            application = win32com.client.DispatchEx(progName)
+            started = _officeProcessIds(progName) - before
+        if len(started) == 1:
+            self._processIds[id(application)] = started.pop()
+        return application
+
+    def quit(self, application):
+        self._processIds.pop(id(application), None)
+        application.Application.Quit()
+
+    def kill(self, application):
+        processId = self._processIds.pop(id(application), None)
+        if processId is None:
+            raise Exception('The process of this Office instance is unknown.')
+        # TerminateProcess on Windows.
+        os.kill(processId, signal.SIGTERM)
+
+    def threadInit(self):
+        import pythoncom
+        # Each worker thread is its own single-threaded apartment, the threading model of Office.
+        pythoncom.CoInitialize()
+
+    def threadExit(self):
+        import pythoncom
+        pythoncom.CoUninitialize()
+
+
+def _officeProcessIds(progName):
+    """Internal magic function: the ids of the running processes of an Office program (Windows only).\n\n*Do not use it, there is an underscore for a reason."""
+    import win32api
+    import win32process
+    try:
+        exeName = allSupportedMSProgramExe[allSupportedMSProgram.index(progName.split('.')[0])]
+    except ValueError:
+        return set()
+    processIds = set()
+    for processId in win32process.EnumProcesses():
+        with suppress(Exception):
+            # 0x1000 : PROCESS_QUERY_LIMITED_INFORMATION
+            handle = win32api.OpenProcess(0x1000, False, processId)
+            try:
+                if os.path.basename(win32process.GetModuleFileNameEx(handle, 0)).lower() == exeName:
+                    processIds.add(processId)
+            finally:
+                win32api.CloseHandle(handle)
+    return processIds
+
+
+class NativeBackend(OfficeBackend):
+    """Backend without any Office program (EX. Linux workers): only the formats having a native engine can be exported."""
+    def dispatch(self, progName):
+        raise Exception('No Office program with the native backend: %s cannot be started. Only the formats having a native engine can be exported.' % progName)
+
+
+_backends = {}
+
+def registerBackend(name, backendClass):
+    """Register an OfficeBackend class (or any callable returning an OfficeBackend) under a name, for getBackend()
+    and the --backend option of the command line."""
+    _backends[name] = backendClass
+
+def getBackend(name=None):
+    """Return a new backend of a name registered by registerBackend ('com', 'native' or your own).
+    If name is None, the default backend: the MSOFFICEFILECONVERTER_BACKEND environment variable if set,
+    otherwise 'com' on Windows and 'native' anywhere else."""
+    if name is None:
+        name = os.environ.get('MSOFFICEFILECONVERTER_BACKEND') or ('com' if sys.platform == 'win32' else 'native')
+    if name not in _backends:
+        raise Exception('Unknown backend: %s (registered: %s)' % (name, ', '.join(sorted(_backends))))
+    return _backends[name]()
+
+registerBackend('com', ComBackend)
+registerBackend('native', NativeBackend)
@@ -0,0 +1,339 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Parallel batch conversion in worker processes.
+
+import os
+import time
+import json
+import queue
+
+from .utils import suppress
+from .backends import getBackend
+from .metrics import addMetricsSink, _metricsSinks
+from .cache import ConversionCache
+from .pool import ExportTimeout, OfficeApplicationPool
+from .documents import _documentClass, ExcelDocument, excelExtensions, openDocument, PowerPointDocument, powerPointExtensions, WordDocument, wordExtensions
+from .scheduling import JobScheduler, LatencyModel, _predictionErrors
+
+
+class BatchJob:
+    """A document to export in a batch.
+    - formats : A format name or a list of format names, exported from a single open.
+    - destination : The export folder (created if needed). If None, the files are exported next to the source.
+    - priority : 'interactive', 'normal' or 'bulk' (see JobScheduler).
+    - skippedFormats : The formats not applying to the type of the document (see jobsFromDirectory)."""
+    def __init__(self, source, formats, destination=None, priority='normal', skippedFormats=()):
+        self.source = source
+        self.formats = [formats] if isinstance(formats, str) else list(formats)
+        self.destination = destination
+        JobScheduler.priorityIndex(priority)
+        self.priority = priority
+        self.skippedFormats = list(skippedFormats)
+
+    def __repr__(self):
+        return 'BatchJob(%r, %r, %r, %r)' % (self.source, self.formats, self.destination, self.priority)
+
+
+class BatchResult:
+    """Result of a BatchJob. error is None if the job succeeded, otherwise a description of the error.
+    With an IncrementalManifest, reasons is a dict of format name -> None if up to date, otherwise the reason to export it."""
+    def __init__(self, job, files, error, seconds, workerPid, cachedFormats=0, reasons=None, attempts=1, predictedSeconds=None):
+        self.job = job
+        self.files = files
+        self.error = error
+        self.seconds = seconds
+        self.workerPid = workerPid
+        self.cachedFormats = cachedFormats
+        self.reasons = reasons
+        self.upToDate = reasons is not None and all(reason is None for reason in reasons.values())
+        self.attempts = attempts
+        self.timedOut = error is not None and error.startswith(ExportTimeout.__name__)
+        self.predictedSeconds = predictedSeconds
+
+
+class BatchSummary:
+    """Results and throughput of a convertBatch() run."""
+    def __init__(self, results, seconds, workerCrashes, dryRun=False):
+        self.results = results
+        self.seconds = seconds
+        self.workerCrashes = workerCrashes
+        self.dryRun = dryRun
+        self.upToDate = [result for result in results if result.upToDate]
+        self.succeeded = [result for result in results if result.error is None]
+        self.failed = [result for result in results if result.error is not None]
+        self.fileCount = sum(len(result.files) for result in self.succeeded)
+        self.cachedFormats = sum(result.cachedFormats for result in self.succeeded)
+        self.skippedFormats = sum(len(result.job.skippedFormats) for result in results)
+        self.retries = sum(result.attempts - 1 for result in results)
+        self.timedOut = [result for result in self.failed if result.timedOut]
+        self.documentsPerSecond = len(results) / seconds if seconds > 0 else 0.0
+        self.predictionError = _predictionErrors([(result.predictedSeconds, result.seconds) for result in self.succeeded
+                                                  if result.predictedSeconds is not None and not result.upToDate])
+
+    def __str__(self):
+        if self.dryRun:
+            lines = ['%d documents, %d up to date, %d to export, %d failed' % (len(self.results), len(self.upToDate),
+                                                                              len(self.succeeded) - len(self.upToDate), len(self.failed))]
+            for result in self.succeeded:
+                for formatName, reason in result.reasons.items():
+                    if reason is not None:
+                        lines.append('WOULD EXPORT %s to %s: %s' % (result.job.source, formatName, reason))
+            for result in self.failed:
+                lines.append('FAILED %s: %s' % (result.job.source, result.error))
+            return '\n'.join(lines)
+        lines = ['%d documents in %.2fs (%.2f documents/s, %d files written)' % (len(self.results), self.seconds, self.documentsPerSecond, self.fileCount),
+                 '%d succeeded, %d failed, %d worker crashes' % (len(self.succeeded), len(self.failed), self.workerCrashes)]
+        if self.cachedFormats:
+            lines.append('%d exports copied from the cache' % self.cachedFormats)
+        if self.skippedFormats:
+            lines.append('%d exports skipped, their format does not apply to the type of the document' % self.skippedFormats)
+        if self.upToDate:
+            lines.append('%d documents up to date, not exported' % len(self.upToDate))
+        if self.retries or self.timedOut:
+            lines.append('%d retries, %d jobs timed out' % (self.retries, len(self.timedOut)))
+        exported = [result for result in self.succeeded if not result.upToDate]
+        if exported:
+            seconds = sorted(result.seconds for result in exported)
+            lines.append('Job time: mean %.3fs, max %.3fs' % (sum(seconds) / len(seconds), seconds[-1]))
+        if self.predictionError['count']:
+            lines.append('Predicted job time: mean absolute error %.3fs over %d jobs' % (self.predictionError['meanAbsoluteError'], self.predictionError['count']))
+        for result in self.failed:
+            lines.append('FAILED %s: %s' % (result.job.source, result.error))
+        return '\n'.join(lines)
+
+
+def jobsFromDirectory(sourceFolder, formats, exportFolder=None, recursive=True):
+    """Return a BatchJob for every Word, Excel and PowerPoint document of a folder, with the formats of its type.
+    - If you specify an export folder, the tree of the source folder is reproduced in it. Otherwise, the files are exported next to their source."""
+    formats = [formatName.lower() for formatName in ([formats] if isinstance(formats, str) else formats)]
+    documentClasses = (WordDocument, ExcelDocument, PowerPointDocument)
+    unknownFormats = [formatName for formatName in formats if not any(formatName in documentClass._formats for documentClass in documentClasses)]
+    if unknownFormats:
+        raise Exception('Unsupported export format: %s (not a format of Word, Excel or PowerPoint documents)' % ', '.join(unknownFormats))
+    sourceFolder = os.path.abspath(sourceFolder)
+    jobs = []
+    for root, folders, names in os.walk(sourceFolder):
+        folders.sort()
+        if not recursive:
+            folders[:] = []
+        for name in sorted(names):
+            extension = os.path.splitext(name)[1].lower()
+            # '~$' files are the lock files created by Office next to opened documents.
+            if name.startswith('~$') or extension not in wordExtensions + excelExtensions + powerPointExtensions:
+                continue
+            destination = None
+            if exportFolder is not None:
+                destination = os.path.join(os.path.abspath(exportFolder), os.path.relpath(root, sourceFolder))
+            documentFormats = _documentClass(name)._formats
+            jobs.append(BatchJob(os.path.join(root, name), [formatName for formatName in formats if formatName in documentFormats], destination,
+                                 skippedFormats=[formatName for formatName in formats if formatName not in documentFormats]))
+    return jobs
+
+
+def jobsFromManifest(manifestPath):
+    """Return the BatchJob of a JSONL manifest, one job per line: {"source": ..., "format": ..., "destination": ..., "priority": ...}.
+    - "format" can be a format name or a list of format names, "destination" and "priority" are optional."""
+    jobs = []
+    with open(manifestPath, encoding='utf-8') as f:
+        for lineNumber, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                jobs.append(BatchJob(entry['source'], entry['format'], entry.get('destination'), entry.get('priority', 'normal')))
+            except Exception as e:
+                raise Exception('Invalid manifest line %d: %s' % (lineNumber, e))
+    return jobs
+
+
+def _batchWorker(backend, poolOptions, cache, metricsSinks, incremental, documentOptions, jobQueue, resultQueue):
+    """Main function of a batch worker process.\n\n*Do not use it, there is an underscore for a reason."""
+    for sink in metricsSinks:
+        if sink not in _metricsSinks:
+            addMetricsSink(sink)
+    pool = OfficeApplicationPool(backend, **poolOptions)
+    try:
+        while True:
+            job = jobQueue.get()
+            if job is None:
+                break
+            start = time.perf_counter()
+            try:
+                if job.destination is not None:
+                    os.makedirs(job.destination, exist_ok=True)
+                document = openDocument(job.source, pool=pool, cache=cache, overwrite=incremental, **documentOptions)
+                results = document.export(job.formats, job.destination)
+                files = [path for result in results.values() for path in result.files]
+                cachedFormats = sum(1 for result in results.values() if result.cached)
+                outputs = None
+                if incremental:
+                    # Recorded in the IncrementalManifest by the main process, the only one writing it.
+                    outputs = {'hash': ConversionCache.hashFile(job.source),
+                               'formats': [(formatName, document._targetPath(formatName, job.destination), result.path, result.folder, result.files)
+                                           for formatName, result in results.items()]}
+                resultQueue.put((os.getpid(), files, None, time.perf_counter() - start, cachedFormats, outputs, results))
+            except Exception as e:
+                resultQueue.put((os.getpid(), [], '%s: %s' % (type(e).__name__, e), time.perf_counter() - start, 0, None, None))
+    finally:
+        pool.close()
+        # The worker processes do not run the atexit functions.
+        for sink in metricsSinks:
+            if hasattr(sink, 'close'):
+                with suppress(Exception):
+                    sink.close()
+
+
+class _BatchWorker:
+    """A batch worker process, with its own job queue and its own Office instances.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, backend, poolOptions, cache, metricsSinks, incremental, documentOptions, resultQueue):
+        import multiprocessing
+        self.jobQueue = multiprocessing.Queue()
+        self.process = multiprocessing.Process(target=_batchWorker, args=(backend, poolOptions, cache, metricsSinks, incremental, documentOptions,
+                                                                          self.jobQueue, resultQueue), daemon=True)
+        self.process.start()
+        self.jobIndex = None
+        self.jobStart = None
+        self.timedOut = False
+
+
+def convertBatch(jobs, workers=None, backend=None, maxUses=50, cache=None, metricsSinks=(), incremental=None, dryRun=False,
+                 timeout=None, retries=0, quarantine=None, openProfile=None, archive=None, compressionLevel=None, latencyModel=None, scheduler=None):
+    """Run BatchJob objects in parallel in worker processes, each one owning its own Office instances. Return a BatchSummary.
+    - workers : The number of worker processes (default: the number of CPUs).
+    - backend, metricsSinks : The OfficeBackend and the metrics sinks of the workers. They must be picklable. The sinks having a close() method are closed when a worker stops.
+    - cache : A ConversionCache shared by the workers.
+    - incremental : An IncrementalManifest. dryRun : Only return what would be exported.
+    - timeout, retries, quarantine : See OfficeApplicationPool. A failed job is run again retries times.
+    - latencyModel, scheduler : The LatencyModel and the JobScheduler ordering the jobs."""
+    jobs = list(jobs)
+    backend = backend if backend is not None else getBackend()
+    poolOptions = {'size': 1, 'maxUses': maxUses, 'timeout': timeout, 'openProfile': openProfile}
+    documentOptions = {'archive': archive, 'compressionLevel': compressionLevel}
+
+    start = time.perf_counter()
+    # Only skipped formats (see jobsFromDirectory): nothing to export.
+    results = [BatchResult(job, [], None, 0.0, None) if not job.formats else None for job in jobs]
+    reasons = {}
+    if incremental is not None:
+        planningPool = OfficeApplicationPool(backend)
+        for index, job in enumerate(jobs):
+            if results[index] is not None:
+                continue
+            try:
+                jobReasons = incremental.plan(openDocument(job.source, pool=planningPool, **documentOptions), job.formats, job.destination)
+            except Exception as e:
+                if dryRun:
+                    results[index] = BatchResult(job, [], '%s: %s' % (type(e).__name__, e), 0.0, None)
+                # Otherwise the worker reports the error.
+                continue
+            staleFormats = [formatName for formatName, reason in jobReasons.items() if reason is not None]
+            if not staleFormats or dryRun:
+                results[index] = BatchResult(job, [], None, 0.0, None, reasons=jobReasons)
+            else:
+                jobs[index] = BatchJob(job.source, staleFormats, job.destination, job.priority, job.skippedFormats)
+            reasons[index] = jobReasons
+        if dryRun:
+            return BatchSummary(results, time.perf_counter() - start, 0, dryRun=True)
+
+    if quarantine is not None:
+        for index, job in enumerate(jobs):
+            with suppress(OSError):
+                if results[index] is None and quarantine.contains(job.source):
+                    error = 'Quarantined: failed %d times, see %s' % (quarantine.maxFailures, quarantine.path or 'the Quarantine')
+                    results[index] = BatchResult(job, [], error, 0.0, None, reasons=reasons.get(index), attempts=0)
+
+    import multiprocessing
+    resultQueue = multiprocessing.Queue()
+    latencyModel = latencyModel if latencyModel is not None else LatencyModel()
+    pending = scheduler if scheduler is not None else JobScheduler()
+    predicted = [None] * len(jobs)
+    learned = [False] * len(jobs)
+    for index, job in enumerate(jobs):
+        if results[index] is None:
+            predicted[index] = latencyModel.estimate(job.source, job.formats)
+            learned[index] = latencyModel.learned(job.source, job.formats)
+            pending.put(index, predicted[index], job.priority)
+    attempts = [0] * len(jobs)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+    byPid = {}
+    workerCrashes = 0
+
+    def finish(worker, pid, files, error, seconds, cachedFormats, exportResults=None):
+        index = worker.jobIndex
+        worker.jobIndex = None
+        attempts[index] += 1
+        if error is not None and attempts[index] <= retries:
+            pending.put(index, predicted[index], jobs[index].priority)
+            return False
+        job = jobs[index]
+        if quarantine is not None:
+            with suppress(OSError):
+                if error is None:
+                    quarantine.release(job.source)
+                else:
+                    quarantine.addFailure(job.source, error)
+        # The predictions from the defaults and the exports copied from the cache would only add noise to the error.
+        observed = learned[index] and error is None and not cachedFormats
+        results[index] = BatchResult(job, files, error, seconds, pid, cachedFormats, reasons.get(index), attempts[index],
+                                     predicted[index] if observed else None)
+        if exportResults is not None:
+            with suppress(OSError):
+                latencyModel.recordResults(job.source, exportResults)
+            if observed:
+                latencyModel.observe(predicted[index], seconds)
+        return error is None
+    for _ in range(workers if pending else 0):
+        worker = _BatchWorker(backend, poolOptions, cache, metricsSinks, incremental is not None, documentOptions, resultQueue)
+        byPid[worker.process.pid] = worker
+
+    try:
+        while pending or any(worker.jobIndex is not None for worker in byPid.values()):
+            for worker in byPid.values():
+                if worker.jobIndex is None and pending:
+                    worker.jobIndex = pending.get(block=False)
+                    worker.jobStart = time.perf_counter()
+                    worker.jobQueue.put(jobs[worker.jobIndex])
+                elif timeout is not None and worker.jobIndex is not None and not worker.timedOut and time.perf_counter() - worker.jobStart > timeout + 30:
+                    # The watchdog of the worker did not stop the job: the worker itself is stuck.
+                    worker.timedOut = True
+                    worker.process.kill()
+
+            try:
+                pid, files, error, seconds, cachedFormats, outputs, exportResults = resultQueue.get(timeout=0.2)
+            except queue.Empty:
+                for pid, worker in list(byPid.items()):
+                    if worker.process.is_alive():
+                        continue
+                    workerCrashes += 1
+                    del byPid[pid]
+                    if worker.jobIndex is not None:
+                        error = 'Worker process died (exit code %s)' % worker.process.exitcode
+                        if worker.timedOut:
+                            error = '%s: The job took more than %ss, the worker process was killed.' % (ExportTimeout.__name__, timeout + 30)
+                        finish(worker, pid, [], error, time.perf_counter() - worker.jobStart, 0)
+                    if pending:
+                        worker = _BatchWorker(backend, poolOptions, cache, metricsSinks, incremental is not None, documentOptions, resultQueue)
+                        byPid[worker.process.pid] = worker
+                continue
+
+            worker = byPid.get(pid)
+            if worker is None or worker.jobIndex is None:
+                # Finished just before being killed.
+                continue
+            job = jobs[worker.jobIndex]
+            if finish(worker, pid, files, error, seconds, cachedFormats, exportResults) and outputs is not None:
+                for formatName, target, path, folder, formatFiles in outputs['formats']:
+                    incremental.record(job.source, formatName, target, path, folder, formatFiles, outputs['hash'])
+            worker.jobIndex = None
+    finally:
+        for worker in byPid.values():
+            worker.jobQueue.put(None)
+        for worker in byPid.values():
+            worker.process.join(30)
+        if incremental is not None:
+            incremental.save()
+        latencyModel.save()
+
+    return BatchSummary(results, time.perf_counter() - start, workerCrashes)
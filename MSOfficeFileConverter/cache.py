@@ -0,0 +1,304 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Content-addressed cache of the exported files, and incremental (make-style) exports.
+
+import os
+import threading
+import time
+import json
+import hashlib
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+from .utils import suppress
+
+
+class ConversionCache:
+    """On-disk cache of exported files, keyed by the content of the source document, the format and the export options.
+
+Usage:
+    cache = ConversionCache('Example\\Path\\To\\CacheFolder', maxBytes=10 * 1024 ** 3)
+    document = WordDocument('Example\\Path\\To\\file.docx', cache=cache)
+    document.toPdf()
+    print(cache.stats())
+
+    - maxBytes : When the cache grows over this size, the least recently used entries are removed.
+    - hardLinks : Restore the files as hard links to the cached files instead of copies.
+
+The total size of the entries is kept in the file "index" of the folder, so adding an entry only lists the whole
+cache when it goes over maxBytes. The processes using the same folder update it one at a time (file "lock")."""
+    staleLockSeconds = 30.0
+
+    def __init__(self, folder, maxBytes=1024 ** 3, hardLinks=False):
+        self.folder = os.path.abspath(folder)
+        self.maxBytes = maxBytes
+        self.hardLinks = hardLinks
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(self.folder, 'tmp'), exist_ok=True)
+        with self._folderLock():
+            if not os.path.isfile(os.path.join(self.folder, 'index')):
+                self._writeIndex(self._entries()[1])
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def stats(self):
+        """Return the hits, misses and evictions of this cache object, and the hit ratio."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                    'hitRatio': self.hits / lookups if lookups else 0.0}
+
+    @staticmethod
+    def hashFile(path):
+        """Return the SHA-256 of the content of a file."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(sourceHash, formatName, options):
+        """Return the cache key of an export. options is a dict of every other thing changing the exported files."""
+        text = json.dumps([sourceHash, formatName, sorted(options.items())])
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _copy(self, source, destination):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.hardLinks:
+            with suppress(OSError):
+                os.link(source, destination)
+                return
+        shutil.copyfile(source, destination)
+
+    def restore(self, key, exportFilePath, multiFilesFolder):
+        """Copy a cached export to exportFilePath, or into multiFilesFolder for the multi-files formats.
+        Return False if the key is not in the cache."""
+        entry = os.path.join(self.folder, key)
+        try:
+            data = os.path.join(entry, 'data')
+            if multiFilesFolder is None:
+                self._copy(data, exportFilePath)
+            else:
+                for root, folders, names in os.walk(data):
+                    destination = os.path.join(multiFilesFolder, os.path.relpath(root, data))
+                    for folder in folders:
+                        os.makedirs(os.path.join(destination, folder), exist_ok=True)
+                    for name in names:
+                        self._copy(os.path.join(root, name), os.path.join(destination, name))
+                if not os.path.isdir(data):
+                    raise OSError('Not in the cache.')
+            # The modification time of an entry is its last use, for the LRU eviction.
+            os.utime(entry)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    @contextmanager
+    def _folderLock(self):
+        """Internal magic function: hold the lock of the cache folder, shared by every process using it.\n\n*Do not use it, there is an underscore for a reason."""
+        path = os.path.join(self.folder, 'lock')
+        while True:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                # Left by a process killed while holding it.
+                with suppress(OSError):
+                    if time.time() - os.path.getmtime(path) > self.staleLockSeconds:
+                        os.remove(path)
+                        continue
+                time.sleep(0.001)
+        try:
+            yield
+        finally:
+            with suppress(OSError):
+                os.remove(path)
+
+    def _entries(self):
+        """Internal magic function: return the (last use, size, path) of every entry, and their total size.\n\n*Do not use it, there is an underscore for a reason."""
+        entries = []
+        total = 0
+        for name in os.listdir(self.folder):
+            entry = os.path.join(self.folder, name)
+            if name in ('tmp', 'index', 'lock'):
+                continue
+            with suppress(OSError, ValueError):
+                with open(os.path.join(entry, 'size')) as f:
+                    size = int(f.read())
+                entries.append((os.path.getmtime(entry), size, entry))
+                total += size
+        return entries, total
+
+    def _readIndex(self):
+        """Internal magic function: return the total size of the entries written in the index file.\n\n*Do not use it, there is an underscore for a reason."""
+        try:
+            with open(os.path.join(self.folder, 'index')) as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            # New cache folder, or written by a version without index.
+            return self._entries()[1]
+
+    def _writeIndex(self, total):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        temporaryPath = os.path.join(self.folder, 'tmp', 'index.%d.%d' % (os.getpid(), threading.get_ident()))
+        with open(temporaryPath, 'w') as f:
+            f.write(str(max(total, 0)))
+        os.replace(temporaryPath, os.path.join(self.folder, 'index'))
+
+    def size(self):
+        """Return the total size of the cached files, from the index file."""
+        with self._folderLock():
+            return self._readIndex()
+
+    def store(self, key, exportFilePath, multiFilesFolder):
+        """Add an export to the cache: the file exportFilePath, or the content of multiFilesFolder for the multi-files formats."""
+        temporary = tempfile.mkdtemp(dir=os.path.join(self.folder, 'tmp'))
+        try:
+            data = os.path.join(temporary, 'data')
+            if multiFilesFolder is None:
+                shutil.copyfile(exportFilePath, data)
+                size = os.path.getsize(data)
+            else:
+                shutil.copytree(multiFilesFolder, data)
+                size = sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(data) for name in names)
+            with open(os.path.join(temporary, 'size'), 'w') as f:
+                f.write(str(size))
+            try:
+                os.rename(temporary, os.path.join(self.folder, key))
+            except OSError:
+                # Another process already added the same export.
+                return
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+        # The index keeps the total size, so only the insertions going over maxBytes list the entries.
+        with self._folderLock():
+            total = self._readIndex() + size
+            self._writeIndex(total)
+        if total > self.maxBytes:
+            self.evict()
+
+    def evict(self):
+        """Remove the least recently used entries until the cache size is under maxBytes."""
+        removed = []
+        with self._folderLock():
+            entries, total = self._entries()
+            entries.sort()
+            for _, size, entry in entries:
+                if total <= self.maxBytes:
+                    break
+                # Moved first so a concurrent restore() never sees a partially removed entry.
+                folder = tempfile.mkdtemp(dir=os.path.join(self.folder, 'tmp'))
+                removed.append(folder)
+                with suppress(OSError):
+                    os.rename(entry, os.path.join(folder, 'entry'))
+                    total -= size
+                    with self._lock:
+                        self.evictions += 1
+            self._writeIndex(total)
+        for folder in removed:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+class IncrementalManifest:
+    """Remember the exports done, to skip the exports still up to date on the next runs (like make).
+
+Usage:
+    with IncrementalManifest('Example\\Path\\To\\manifest.json') as manifest:
+        WordDocument('Example\\Path\\To\\file.docx', incremental=manifest).toPdf()
+
+    - path : The JSON file of the manifest, or None to keep it in memory only."""
+
+    def __init__(self, path, autoSaveInterval=30.0):
+        self.path = path
+        self.autoSaveInterval = autoSaveInterval
+        self.entries = {}
+        self._dirty = False
+        self._lastSave = time.monotonic()
+        self._lock = threading.Lock()
+        if path is not None and os.path.isfile(path):
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def _key(source, formatName, target):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        return '|'.join((os.path.abspath(source), formatName, target))
+
+    def check(self, source, formatName, target):
+        """Return None if the export of source to formatName at the path target is up to date,
+        otherwise the reason to export it again: 'new', 'source changed' or 'output missing'."""
+        with self._lock:
+            entry = self.entries.get(self._key(source, formatName, target))
+        if entry is None:
+            return 'new'
+        if not all(os.path.exists(path) for path in entry['files']):
+            return 'output missing'
+        stat = os.stat(source)
+        if stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime']:
+            return None
+        if stat.st_size == entry['size'] and entry['hash'] is not None and ConversionCache.hashFile(source) == entry['hash']:
+            # Touched or copied again, but not changed.
+            with self._lock:
+                entry['mtime'] = stat.st_mtime_ns
+                self._dirty = True
+            return None
+        return 'source changed'
+
+    def get(self, source, formatName, target):
+        """Return the entry of an export: a dict with the keys 'path', 'folder' and 'files' of its ExportResult, or None."""
+        with self._lock:
+            return self.entries.get(self._key(source, formatName, target))
+
+    def plan(self, document, formats, exportFolder=None, exportFileName=None):
+        """Dry run: return a dict of format name -> None if the export of document is up to date, otherwise the reason to export it again."""
+        return {formatName: self.check(document.documentPath, formatName, document._targetPath(formatName, exportFolder, exportFileName))
+                for formatName in document._formatNames(formats)}
+
+    def record(self, source, formatName, target, path, folder, files, sourceHash=None):
+        """Remember a successful export. sourceHash is the SHA-256 of the source (see ConversionCache.hashFile), computed if None."""
+        stat = os.stat(source)
+        if sourceHash is None:
+            sourceHash = ConversionCache.hashFile(source)
+        with self._lock:
+            self.entries[self._key(source, formatName, target)] = {
+                'source': os.path.abspath(source), 'format': formatName, 'target': target, 'path': path, 'folder': folder,
+                'files': list(files), 'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'hash': sourceHash}
+            self._dirty = True
+            autoSave = time.monotonic() - self._lastSave >= self.autoSaveInterval
+        if autoSave:
+            self.save()
+
+    def save(self):
+        """Write the manifest file, if something changed."""
+        with self._lock:
+            if not self._dirty or self.path is None:
+                return
+            temporaryPath = '%s.%d.tmp' % (self.path, os.getpid())
+            with open(temporaryPath, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            os.replace(temporaryPath, self.path)
+            self._dirty = False
+            self._lastSave = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.save()
@@ -0,0 +1,88 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Command line entry point.
+
+from .folders import archiveFormats
+from .backends import _backends, getBackend
+from .metrics import addMetricsSink, PrometheusTextfileSink
+from .cache import ConversionCache, IncrementalManifest
+from .pool import OpenProfile, Quarantine
+from .scheduling import LatencyModel
+from .batch import convertBatch, jobsFromDirectory, jobsFromManifest
+from .server import ConversionServer
+
+
+def main(argv=None):
+    """Command line entry point. Run 'python -m MSOfficeFileConverter --help' for the usage."""
+    import argparse
+    parser = argparse.ArgumentParser(prog='MSOfficeFileConverter', description='Convert Microsoft Office documents.')
+    commonParser = argparse.ArgumentParser(add_help=False)
+    commonParser.add_argument('-w', '--workers', type=int, help='Number of workers (default: number of CPUs for batch, 2 for serve).')
+    commonParser.add_argument('--backend', choices=sorted(_backends), help='Default: "com" on Windows, "native" anywhere else (native engines only).')
+    commonParser.add_argument('--cache', help='Folder of a ConversionCache, to convert identical documents only once.')
+    commonParser.add_argument('--cache-size', type=float, default=1.0, help='Maximum size of the cache in GB (default: 1).')
+    commonParser.add_argument('--timeout', type=float, help='Maximum seconds of the Office job of a document. Office is killed and restarted after it.')
+    commonParser.add_argument('--office-defaults', action='store_true', help='Open the documents like Office does (recalculation, events, links updated...) '
+                                                                           'instead of read only without recalculation.')
+    commonParser.add_argument('--latency-model', metavar='FILE', help='JSON file of the export times learned from the past runs, to run the shortest jobs first.')
+    commonParser.add_argument('--metrics-file', help='Write export metrics to this Prometheus text file. For batch, use {pid} in the name to get a file per worker.')
+    subparsers = parser.add_subparsers(dest='command')
+    batchParser = subparsers.add_parser('batch', parents=[commonParser], help='Convert a folder of documents, or the jobs of a JSONL manifest, in parallel.')
+    batchParser.add_argument('source', nargs='?', help='Folder containing the documents to convert.')
+    batchParser.add_argument('-m', '--manifest', help='JSONL file of {"source", "format", "destination", "priority"} jobs, instead of a folder.')
+    batchParser.add_argument('-f', '--formats', help='Comma separated format names when converting a folder, EX. pdf,docx.')
+    batchParser.add_argument('-o', '--output', help='Export folder when converting a folder (default: next to each document).')
+    batchParser.add_argument('--incremental', metavar='MANIFEST', help='JSON file remembering the exports, to export only the documents changed since the last run.')
+    batchParser.add_argument('--dry-run', action='store_true', help='With --incremental, only print what would be exported.')
+    batchParser.add_argument('--archive', choices=archiveFormats, help='Write the formats exported in multiple files (EX. html, csv) in one archive per document instead of a folder.')
+    batchParser.add_argument('--compression-level', type=int, choices=range(10), metavar='0-9',
+                             help='Compression of the archives: 0 stores the files, 1 (fastest) to 9 (smallest). Default: 6 for zip, 0 for tar.')
+    batchParser.add_argument('--retries', type=int, default=0, help='Number of times a failed document is tried again (default: 0).')
+    batchParser.add_argument('--quarantine', metavar='FILE', help='JSON file of the documents failing again and again, which are not tried anymore.')
+    serveParser = subparsers.add_parser('serve', parents=[commonParser], help='Run a conversion server keeping Office started (see ConversionServer).')
+    serveParser.add_argument('--host', default='127.0.0.1')
+    serveParser.add_argument('--port', type=int, default=8765)
+    serveParser.add_argument('--unix-socket', help='Listen on this Unix socket instead of TCP.')
+    serveParser.add_argument('--queue-size', type=int, default=100, help='Maximum number of waiting jobs.')
+    serveParser.add_argument('--root', action='append', default=[], help='Folder the JSON requests may read documents from and export to (repeat it for several). '
+                                                                          'Without it, only uploaded documents are converted.')
+    args = parser.parse_args(argv)
+
+    if args.command not in ('batch', 'serve'):
+        parser.print_help()
+        return 2
+    backend = getBackend(args.backend)
+    cache = ConversionCache(args.cache, int(args.cache_size * 1024 ** 3)) if args.cache is not None else None
+    metricsSinks = [PrometheusTextfileSink(args.metrics_file)] if args.metrics_file is not None else []
+    openProfile = OpenProfile.officeDefaults() if args.office_defaults else None
+    latencyModel = LatencyModel(args.latency_model)
+
+    if args.command == 'serve':
+        for sink in metricsSinks:
+            addMetricsSink(sink)
+        server = ConversionServer(args.host, args.port, args.unix_socket, backend, args.workers or 2, args.queue_size, cache=cache, jobTimeout=args.timeout,
+                                  openProfile=openProfile, latencyModel=latencyModel, roots=args.root)
+        print('Serving on %s' % (args.unix_socket or 'http://%s:%d' % (args.host, args.port)))
+        server.serveForever()
+        return 0
+
+    if args.manifest is not None:
+        jobs = jobsFromManifest(args.manifest)
+    elif args.source is not None and args.formats is not None:
+        try:
+            jobs = jobsFromDirectory(args.source, args.formats.split(','), args.output)
+        except Exception as e:
+            batchParser.error(str(e))
+    else:
+        batchParser.error('Specify a source folder and --formats, or --manifest.')
+
+    if args.dry_run and args.incremental is None:
+        batchParser.error('--dry-run requires --incremental.')
+    incremental = IncrementalManifest(args.incremental) if args.incremental is not None else None
+    quarantine = Quarantine(args.quarantine) if args.quarantine is not None else None
+    summary = convertBatch(jobs, args.workers, backend, cache=cache, metricsSinks=metricsSinks, incremental=incremental, dryRun=args.dry_run,
+                           timeout=args.timeout, retries=args.retries, quarantine=quarantine, openProfile=openProfile,
+                           archive=args.archive, compressionLevel=args.compression_level, latencyModel=latencyModel)
+    print(summary)
+    return 1 if summary.failed else 0
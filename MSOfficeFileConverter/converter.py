@@ -0,0 +1,262 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# asyncio API running the exports in worker threads.
+
+import copy
+import threading
+import time
+import atexit
+import collections
+
+from .utils import suppress
+from .backends import getBackend
+from .pool import OfficeApplicationPool
+from .scheduling import JobScheduler, LatencyModel
+
+
+class _AsyncJob:
+    """A job of an AsyncConverter.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, function, loop, deadline=None):
+        self.function = function
+        self.loop = loop
+        self.deadline = deadline
+        self.future = loop.create_future()
+        self.state = 'queued'
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Called by the worker thread. Return False if the job was cancelled while queued."""
+        with self._lock:
+            if self.state != 'queued':
+                return False
+            self.state = 'running'
+            return True
+
+    def cancel(self):
+        """Called by the event loop when the caller stopped waiting (cancellation or timeout)."""
+        with self._lock:
+            if self.state == 'queued':
+                self.state = 'cancelled'
+            elif self.state == 'running':
+                self.state = 'abandoned'
+
+    def finish(self, result, error):
+        """Called by the worker thread with the result or the exception of the job."""
+        with self._lock:
+            if self.state == 'running':
+                self.state = 'done'
+        with suppress(RuntimeError):
+            # RuntimeError: the event loop was closed in the meantime.
+            self.loop.call_soon_threadsafe(self._setResult, result, error)
+
+    def _setResult(self, result, error):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.future.done():
+            return
+        if error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(result)
+
+
+class AsyncConverter:
+    """Run exports from asyncio code, in a fixed set of worker threads owning their own Office instances.
+
+Usage:
+    converter = AsyncConverter(workers=2)
+    result = await WordDocument('Example\\Path\\To\\file.docx').to('pdf', converter=converter, timeout=120)
+    ...
+    converter.close()
+
+    - workers : Number of worker threads, so of documents exported at the same time.
+    - queueSize : Maximum number of jobs waiting for a worker.
+    - maxUses, jobTimeout, openProfile : Passed to the OfficeApplicationPool of each worker.
+      A job running past the timeout of submit() or to() also gets its Office instance killed, so it does not keep its worker busy.
+    - latencyModel, aging, classSeconds : The LatencyModel and the JobScheduler ordering the queued jobs."""
+    def __init__(self, backend=None, workers=2, queueSize=100, maxUses=50, jobTimeout=None, openProfile=None, latencyModel=None,
+                 aging=1.0, classSeconds=3600.0):
+        if workers < 1 or queueSize < 1:
+            raise Exception('The number of workers and the queue size must be at least 1.')
+        self.backend = backend if backend is not None else getBackend()
+        self.queueSize = queueSize
+        self.maxUses = maxUses
+        self.jobTimeout = jobTimeout
+        self.openProfile = openProfile
+        self.latencyModel = latencyModel if latencyModel is not None else LatencyModel()
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self._queue = JobScheduler(aging, classSeconds)
+        self._queued = 0
+        self._running = 0
+        self._waiters = collections.deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._threads = [threading.Thread(target=self._work, name='AsyncConverter-%d' % i, daemon=True) for i in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        self.backend.threadInit()
+        pool = OfficeApplicationPool(self.backend, size=1, maxUses=self.maxUses, timeout=self.jobTimeout, openProfile=self.openProfile)
+        try:
+            while True:
+                job = self._queue.get()
+                if job is None:
+                    break
+                with self._lock:
+                    self._queued -= 1
+                    self._wakeNext()
+                if not job.start():
+                    with self._lock:
+                        self.cancelled += 1
+                    continue
+                with self._lock:
+                    self._running += 1
+                pool.timeout = self._jobTimeout(job)
+                try:
+                    result = job.function(pool)
+                except BaseException as e:
+                    with self._lock:
+                        self._running -= 1
+                        self.failed += 1
+                    if not isinstance(e, Exception):
+                        # SystemExit and the like would stop the event loop of the caller: raise them as an Exception.
+                        error = Exception('The job raised %s: %s' % (type(e).__name__, e))
+                        error.__cause__ = e
+                        e = error
+                    job.finish(None, e)
+                else:
+                    with self._lock:
+                        self._running -= 1
+                        self.completed += 1
+                    job.finish(result, None)
+        finally:
+            pool.close()
+            self.backend.threadExit()
+
+    def _jobTimeout(self, job):
+        """Internal magic function, returning the watchdog timeout of the pool for a job: jobTimeout, or less
+        if the caller stops waiting before.\n\n*Do not use it, there is an underscore for a reason."""
+        if job.deadline is None:
+            return self.jobTimeout
+        remaining = max(0.0, job.deadline - time.monotonic())
+        return remaining if self.jobTimeout is None else min(self.jobTimeout, remaining)
+
+    def _wakeNext(self):
+        """Internal magic function, called with the lock held when a place is freed in the queue.\n\n*Do not use it, there is an underscore for a reason."""
+        while self._waiters:
+            loop, waiter = self._waiters.popleft()
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(self._wake, waiter)
+                return
+
+    @staticmethod
+    def _wake(waiter):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if not waiter.done():
+            waiter.set_result(None)
+
+    async def submit(self, function, timeout=None, seconds=0.0, priority='normal'):
+        """Run function(pool) in a worker thread and return its result. pool is the OfficeApplicationPool of the worker.
+        - timeout : Seconds before raising asyncio.TimeoutError, counted from the submission (the time waiting in the queue is included).
+          A job still running then has its Office instance killed by the watchdog of the pool.
+        - seconds, priority : The predicted seconds of the job and its priority class, to order the queue (see JobScheduler)."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise Exception('The AsyncConverter is closed.')
+                if self._queued < self.queueSize:
+                    self._queued += 1
+                    break
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, None if deadline is None else max(0, deadline - loop.time()))
+            except BaseException:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+                    else:
+                        # Already woken up: give the free place to the next waiter.
+                        self._wakeNext()
+                raise
+
+        job = _AsyncJob(function, loop, None if deadline is None else time.monotonic() + deadline - loop.time())
+        self._queue.put(job, seconds, priority)
+        try:
+            return await asyncio.wait_for(job.future, None if deadline is None else max(0, deadline - loop.time()))
+        except BaseException:
+            job.cancel()
+            raise
+
+    async def export(self, document, formats, exportFolder=None, exportFileName=None, timeout=None, priority='normal'):
+        """Export a document to one or multiple formats (see export() of the document classes) in a worker thread.
+        - priority : 'interactive', 'normal' or 'bulk'. The queued exports are run by priority, then the shortest predicted first."""
+        predicted = self.latencyModel.estimate(document.documentPath, formats)
+        learned = self.latencyModel.learned(document.documentPath, formats)
+        def run(pool):
+            workerDocument = copy.copy(document)
+            workerDocument.pool = pool
+            start = time.perf_counter()
+            results = workerDocument.export(formats, exportFolder, exportFileName)
+            self._learn(document.documentPath, predicted if learned else None, time.perf_counter() - start, results)
+            return results
+        return await self.submit(run, timeout, predicted, priority)
+
+    def _learn(self, documentPath, predicted, seconds, results):
+        """Internal magic function, called by the worker threads after an export.\n\n*Do not use it, there is an underscore for a reason."""
+        if predicted is not None and all(result.engine != 'cache' for result in results.values()):
+            self.latencyModel.observe(predicted, seconds)
+        with suppress(OSError):
+            self.latencyModel.recordResults(documentPath, results)
+
+    def stats(self):
+        """Return the number of queued, running, completed, failed and cancelled jobs, and the error of the predicted export times."""
+        with self._lock:
+            stats = {'queued': self._queued, 'running': self._running, 'completed': self.completed,
+                     'failed': self.failed, 'cancelled': self.cancelled}
+        stats['predictionError'] = self.latencyModel.errorSummary()
+        return stats
+
+    def close(self):
+        """Stop the worker threads once the queued jobs are done, and quit their Office instances."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.close()
+        for thread in self._threads:
+            thread.join()
+        self.latencyModel.save()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        import asyncio
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+_defaultAsyncConverter = None
+_defaultAsyncConverterLock = threading.Lock()
+
+def getDefaultAsyncConverter():
+    """Return the AsyncConverter used by the to() method of the documents when no converter is given (created on first use, closed at exit)."""
+    global _defaultAsyncConverter
+    with _defaultAsyncConverterLock:
+        if _defaultAsyncConverter is None:
+            _defaultAsyncConverter = AsyncConverter()
+            atexit.register(_defaultAsyncConverter.close)
+        return _defaultAsyncConverter
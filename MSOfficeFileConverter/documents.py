@@ -0,0 +1,1475 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# The document classes: WordDocument, ExcelDocument and PowerPointDocument.
+
+import weakref
+import functools
+import threading
+from contextlib import contextmanager
+import os
+import time
+import shutil
+import tempfile
+import io
+
+from .utils import _createStagingFolder, _NativeUnsupported
+from .folders import archiveFormats, _ArchiveReservation, _FolderReservation
+from .metrics import _emitMetrics, ExportMetrics, _metricsLocal, _metricsSinks, _recordPhase
+from .cache import ConversionCache
+from .pool import _applySettings, getDefaultPool, _restoreSettings
+from .xlsx import _columnIndex, _exportNativeCsv, _exportNativeNpz, _partition, _rowValue, _sheetArrays, _sheetIndex, _XlsxReader
+from .docx import _exportNativeTxt, _iterDocxText, _writeNativeTxt
+
+
+# The temporary folders to remove once the document opened by the export running in this thread is closed.
+_closedDocumentLocal = threading.local()
+
+
+def _pageNumbers(numbers, what):
+    """Return the sorted page (or slide) numbers of a selection, EX. range(1, 4), checking them.\n\n*Do not use it, there is an underscore for a reason."""
+    if numbers is None:
+        return None
+    numbers = sorted(set(numbers))
+    if not numbers or not all(isinstance(number, int) and not isinstance(number, bool) and number >= 1 for number in numbers):
+        raise Exception('The %s must be numbers starting at 1.' % what)
+    return numbers
+
+
+def _pageRange(numbers, what):
+    """Return the (first, last) of consecutive page (or slide) numbers, for the From / To of the exports to PDF and XPS.\n\n*Do not use it, there is an underscore for a reason."""
+    if numbers != list(range(numbers[0], numbers[-1] + 1)):
+        raise Exception('The PDF and XPS exports need consecutive %s, EX. %s=range(2, 5).' % (what, what))
+    return numbers[0], numbers[-1]
+
+
+class ExportResult:
+    """Result of the export of a document to one format.
+    - path : The exported file, or the folder (or archive) of the formats exported sheet by sheet.
+    - folder : The folder created for the multi-files formats (EX. 'html', 'csv'), otherwise None.
+    - files : Every file created by the export.
+    - seconds, openSeconds : Time taken by the export, and to open the document.
+    - engine : 'office', 'native', 'cache' or 'upToDate'. cached is True for 'cache'.
+    - sheetSeconds : For the formats exported sheet by sheet, a dict of sheet number -> seconds, otherwise None."""
+    def __init__(self, format, path, folder, seconds, openSeconds, engine='office', sheetSeconds=None):
+        self.format = format
+        self.path = path
+        self.folder = folder
+        self.seconds = seconds
+        self.openSeconds = openSeconds
+        self.engine = engine
+        self.cached = engine == 'cache'
+        self.sheetSeconds = sheetSeconds
+        if folder is None:
+            self.files = [path]
+        else:
+            self.files = sorted(os.path.join(root, name) for root, _, names in os.walk(folder) for name in names)
+
+    def __repr__(self):
+        return 'ExportResult(%r, %r, %.3fs)' % (self.format, self.path, self.seconds)
+
+
+class _OfficeDocument:
+    """Base of the document classes. The subclasses define _progName, and _formats, a dict of
+format name -> (SaveAs enum, name of the export method, folder prefix for multi-files formats or None).\n\n*Do not use it, there is an underscore for a reason."""
+    _progName = None
+    _hideApplication = True
+    _formats = {}
+    _sheetMethods = ()
+    _nativeFormats = {}
+    _nativeStreamFormats = {}
+    _stagingFolder = None
+
+    def __init__(self, documentPath, pool=None, native=True, cache=None, overwrite=False, incremental=None, archive=None, compressionLevel=None):
+        documentPath = os.path.abspath(documentPath)
+        if not os.path.isfile(documentPath):
+            raise Exception('The specified file path does not exist.')
+        if archive is not None and archive not in archiveFormats:
+            raise Exception('The archive must be one of %s, or None.' % ', '.join(archiveFormats))
+        if compressionLevel is not None and compressionLevel not in range(10):
+            raise Exception('The compression level must be between 0 (no compression) and 9.')
+        self.archive = archive
+        self.compressionLevel = compressionLevel
+        self.pool = pool if pool is not None else getDefaultPool()
+        self.native = native
+        self.cache = cache
+        self.incremental = incremental
+        self.overwrite = overwrite or incremental is not None
+        self._prepared = False
+        self.documentPath = documentPath
+        self.defaultExportPath, fullFileName = os.path.split(documentPath)
+        self.fileName, extension = os.path.splitext(fullFileName)
+        self.defaultDocumentExtension = extension[1:]
+
+    @contextmanager
+    def _openDocument(self):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        # Done only when Office is really needed, so the exports done by the native engines do not need Office at all.
+        if not self._prepared:
+            self.pool.backend.prepare()
+            self._prepared = True
+        with self.pool.borrow(self._progName) as application, self._openIn(application, self.pool.openProfile) as document:
+            yield document
+
+    @contextmanager
+    def _openIn(self, application, profile, **arguments):
+        """Internal magic function: open the document in an application with an OpenProfile, then restore the settings of the application.\n\n*Do not use it, there is an underscore for a reason."""
+        program = self._progName.split('.')[0]
+        if self._hideApplication:
+            application.Visible = False
+        previous = []
+        try:
+            previous += _applySettings(application, profile.applicationSettings(program))
+            start = time.perf_counter()
+            document = self._open(application, dict(profile.openArguments(program), **arguments))
+            _recordPhase('open', time.perf_counter() - start)
+            try:
+                previous += _applySettings(application, profile.documentSettings(program))
+                yield document
+            finally:
+                start = time.perf_counter()
+                self._close(document)
+                _recordPhase('close', time.perf_counter() - start)
+        finally:
+            _restoreSettings(application, previous)
+
+    def _close(self, document):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        document.Close(SaveChanges=False)
+
+    def _cacheOptions(self, formatName):
+        """Internal magic function: the options of the document changing the exported file of a format, for the cache keys.\n\n*Do not use it, there is an underscore for a reason."""
+        return {}
+
+    @classmethod
+    def fromBytes(cls, data, fileName, **options):
+        """Create a document from its content instead of a path.
+        - fileName : Name given to the document (its extension gives the file type, EX. 'report.docx').
+        - options : The other arguments of the constructor (pool, native, cache...)."""
+        return cls.fromStream(io.BytesIO(data), fileName, **options)
+
+    @classmethod
+    def fromStream(cls, stream, fileName, **options):
+        """Create a document from a binary file-like object (EX. an uploaded file). See fromBytes."""
+        stagingFolder = _createStagingFolder()
+        try:
+            path = os.path.join(stagingFolder, os.path.basename(fileName))
+            with open(path, 'wb') as f:
+                shutil.copyfileobj(stream, f, 1024 * 1024)
+            document = cls(path, **options)
+        except BaseException:
+            shutil.rmtree(stagingFolder, ignore_errors=True)
+            raise
+        document._stagingFolder = stagingFolder
+        document._finalizer = weakref.finalize(document, shutil.rmtree, stagingFolder, True)
+        return document
+
+    def close(self):
+        """Remove the temporary file of a document created by fromBytes or fromStream. Nothing to do for the other documents."""
+        if self._stagingFolder is not None:
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def toBytes(self, formatName):
+        """Export to one format in memory.
+        Return the bytes of the exported file, or for the multi-files formats (EX. 'html', 'csv') a dict of relative file name -> bytes
+        (the bytes of the archive with the archive option of the document)."""
+        formatName = self._formatNames([formatName])[0]
+        if self._formats.get(formatName, (None, None, None))[2] is None or self.archive is not None:
+            stream = io.BytesIO()
+            self.toStream(formatName, stream)
+            return stream.getvalue()
+        with self._stagedExport(formatName) as result:
+            files = {}
+            for path in result.files:
+                with open(path, 'rb') as f:
+                    files[os.path.relpath(path, result.folder).replace(os.sep, '/')] = f.read()
+            return files
+
+    def toStream(self, formatName, stream):
+        """Export to one format into a binary file-like object (EX. an HTTP response), for the single file formats
+        (and the multi-files formats with the archive option of the document). Return the number of bytes written."""
+        formatName = self._formatNames([formatName])[0]
+        if self._formats[formatName][2] is not None and self.archive is None:
+            raise Exception('The format %s is exported in multiple files, use toBytes() instead.' % formatName)
+        if self.native and self.cache is None and formatName in self._nativeStreamFormats:
+            # Spooled: the native engine may give up in the middle, then Office is used and nothing must be written to the stream yet.
+            with tempfile.SpooledTemporaryFile(max_size=16 * 1024 * 1024) as spool:
+                try:
+                    getattr(self, self._nativeStreamFormats[formatName])(spool, self._formats[formatName][0])
+                except _NativeUnsupported:
+                    pass
+                else:
+                    size = spool.tell()
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, stream, 1024 * 1024)
+                    return size
+        with self._stagedExport(formatName) as result:
+            with open(result.path, 'rb') as f:
+                shutil.copyfileobj(f, stream, 1024 * 1024)
+                return f.tell()
+
+    @contextmanager
+    def _stagedExport(self, formatName):
+        """Internal magic function: export to a temporary folder removed at the end of the with block.\n\n*Do not use it, there is an underscore for a reason."""
+        stagingFolder = _createStagingFolder()
+        try:
+            # Not recorded in the IncrementalManifest: the staging folder is removed at the end.
+            yield self._exportMeasured([formatName], stagingFolder, self.fileName, None)[formatName]
+        finally:
+            shutil.rmtree(stagingFolder, ignore_errors=True)
+
+    async def to(self, formats, exportFolder=None, exportFileName=None, converter=None, timeout=None, priority='normal'):
+        """Asynchronous export, for asyncio code: await document.to('pdf').
+        - converter : The AsyncConverter running the export (default: a shared AsyncConverter with 2 workers).
+        - timeout : Seconds before raising asyncio.TimeoutError. priority : 'interactive', 'normal' or 'bulk'."""
+        from .converter import getDefaultAsyncConverter
+        converter = converter if converter is not None else getDefaultAsyncConverter()
+        results = await converter.export(self, [formats] if isinstance(formats, str) else formats, exportFolder, exportFileName, timeout, priority)
+        return results[formats.lower()] if isinstance(formats, str) else results
+
+    def _validateArgs(self, exportFolder, exportFileName, formatName):
+        """Validate the args of an export function.\n\n*Do not use it, there is an underscore for a reason."""
+        if exportFolder is None:
+            exportFolder = self.defaultExportPath
+        elif not os.path.isdir(exportFolder):
+            raise Exception('The specified output directory does not exist.')
+
+        exportFolder = os.path.abspath(exportFolder)
+
+        if exportFileName is None:
+            exportFileName = self.fileName
+
+        fileExtension = '.' + formatName.split('_')[0]
+
+        if not exportFileName.endswith(fileExtension):
+            exportFileName = exportFileName + fileExtension
+
+        elif len(os.path.normpath(os.path.join(exportFolder, exportFileName))) != len(os.path.join(exportFolder, exportFileName)):
+            raise Exception('The specified file name or the specified export folder contain invalid characters.')
+        return exportFolder, exportFileName
+
+    def _formatNames(self, formats):
+        """Validate and normalize a list of format names.\n\n*Do not use it, there is an underscore for a reason."""
+        if isinstance(formats, str):
+            formats = [formats]
+        formatNames = []
+        for formatName in formats:
+            formatName = formatName.lower()
+            if formatName not in self._formats:
+                raise Exception('Unsupported export format: ' + formatName)
+            if formatName not in formatNames:
+                formatNames.append(formatName)
+        # Saving the sheets one by one changes the opened workbook, so it is done last.
+        formatNames.sort(key=lambda formatName: self._formats[formatName][1] in self._sheetMethods)
+        return formatNames
+
+    def _targetPath(self, formatName, exportFolder=None, exportFileName=None):
+        """Internal magic function: the path of an export, without checking or creating anything.\n\n*Do not use it, there is an underscore for a reason."""
+        exportFolder = os.path.abspath(exportFolder if exportFolder is not None else self.defaultExportPath)
+        exportFileName = exportFileName if exportFileName is not None else self.fileName
+        fileExtension = '.' + formatName.split('_')[0]
+        if not exportFileName.endswith(fileExtension):
+            exportFileName = exportFileName + fileExtension
+        if self.archive is not None and self._formats[formatName][2] is not None:
+            # Not the exact path of the archive, but a folder and an archive of the same export must be different targets.
+            exportFileName = exportFileName + '.' + self.archive
+        return os.path.join(exportFolder, exportFileName)
+
+    def _prepareExport(self, formatName, exportFolder, exportFileName):
+        """Return the path given to Office and the _FolderReservation of the multi-files formats (or None).\n\n*Do not use it, there is an underscore for a reason."""
+        folderPrefix = self._formats[formatName][2]
+        exportFolder, exportFileName = self._validateArgs(exportFolder, exportFileName, formatName)
+        reservation = None
+        if folderPrefix is not None and self.archive is not None:
+            reservation = _ArchiveReservation(exportFolder, folderPrefix, exportFileName, self.overwrite, self.archive, self.compressionLevel)
+            exportFolder = reservation.staging
+        elif folderPrefix is not None:
+            reservation = _FolderReservation(exportFolder, folderPrefix, exportFileName, self.overwrite)
+            exportFolder = reservation.staging
+        return os.path.join(exportFolder, exportFileName), reservation
+
+    def _result(self, formatName, exportFilePath, reservation, seconds, openSeconds, engine, sheetSeconds=None):
+        """Publish the folder of the multi-files formats, then return the ExportResult.\n\n*Do not use it, there is an underscore for a reason."""
+        multiFilesFolder = None
+        if isinstance(reservation, _ArchiveReservation):
+            reservation.publish()
+            exportFilePath = reservation.folder
+        elif isinstance(reservation, _FolderReservation):
+            reservation.publish()
+            exportFilePath = reservation.path(exportFilePath)
+            multiFilesFolder = reservation.folder
+        elif reservation is not None:
+            multiFilesFolder = reservation
+        resultPath = multiFilesFolder if multiFilesFolder is not None and self._formats[formatName][1] in self._sheetMethods else exportFilePath
+        result = ExportResult(formatName, resultPath, multiFilesFolder, seconds, openSeconds, engine, sheetSeconds)
+        metrics = getattr(_metricsLocal, 'metrics', None)
+        if metrics is not None:
+            metrics.addFormat(result)
+        return result
+
+    def _cacheKey(self, sourceHash, formatName, exportFilePath, multiFilesFolder):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        options = {'native': self.native and formatName in self._nativeFormats}
+        options.update(self._cacheOptions(formatName))
+        options.update(self.pool.openProfile.cacheOptions(self._progName.split('.')[0]))
+        if multiFilesFolder is not None and self._formats[formatName][1] not in self._sheetMethods:
+            # The files of a web page reference each other by the name of the page.
+            options['fileName'] = os.path.basename(exportFilePath)
+        if isinstance(multiFilesFolder, _ArchiveReservation):
+            options['archive'] = multiFilesFolder.suffix
+            options['compressionLevel'] = multiFilesFolder.compressionLevel
+        return self.cache.key(sourceHash, formatName, options)
+
+    def export(self, formats, exportFolder=None, exportFileName=None):
+        """Export to one or multiple formats, opening the document only once. Return a dict of format name -> ExportResult.
+        - formats : A format name or a list of format names, EX. ['pdf', 'docx', 'txt'] (the to* method names without 'to').
+        - If you do not specify an export folder, the documents will be created in the same directory as the original document.
+        - If you do not specify an export file name, the documents will have the same name as the original document, only the extension will change."""
+        return self._exportMeasured(formats, exportFolder, exportFileName, self.incremental)
+
+    def _exportMeasured(self, formats, exportFolder, exportFileName, incremental):
+        """Internal magic function: export() with its metrics, recorded in the IncrementalManifest incremental if it is not None.\n\n*Do not use it, there is an underscore for a reason."""
+        if not _metricsSinks:
+            return self._exportFormats(formats, exportFolder, exportFileName, incremental)
+        metrics = ExportMetrics('export', self.documentPath, self._progName, os.path.getsize(self.documentPath))
+        # Restored at the end: an export can run inside another one.
+        previousMetrics = getattr(_metricsLocal, 'metrics', None)
+        _metricsLocal.metrics = metrics
+        start = time.perf_counter()
+        try:
+            return self._exportFormats(formats, exportFolder, exportFileName, incremental)
+        except Exception as e:
+            metrics.error = '%s: %s' % (type(e).__name__, e)
+            raise
+        finally:
+            _metricsLocal.metrics = previousMetrics
+            metrics.seconds = time.perf_counter() - start
+            _emitMetrics(metrics)
+
+    def _exportPrepared(self, prepared, results):
+        """Export the formats returned by _prepareExport, adding their ExportResult to results.\n\n*Do not use it, there is an underscore for a reason."""
+        cacheKeys = {}
+        if self.cache is not None:
+            cacheStart = time.perf_counter()
+            sourceHash = self.cache.hashFile(self.documentPath)
+            notCached = []
+            for formatName, exportFilePath, reservation in prepared:
+                start = time.perf_counter()
+                cacheKeys[formatName] = self._cacheKey(sourceHash, formatName, exportFilePath, reservation)
+                if isinstance(reservation, _ArchiveReservation):
+                    restored = reservation.restore(self.cache, cacheKeys[formatName])
+                else:
+                    restored = self.cache.restore(cacheKeys[formatName], exportFilePath, reservation and reservation.staging)
+                if restored:
+                    results[formatName] = self._result(formatName, exportFilePath, reservation, time.perf_counter() - start, 0.0, 'cache')
+                else:
+                    notCached.append((formatName, exportFilePath, reservation))
+            prepared = notCached
+            _recordPhase('cacheLookup', time.perf_counter() - cacheStart)
+
+        officeExports = []
+        for formatName, exportFilePath, reservation in prepared:
+            if not self.native or formatName not in self._nativeFormats:
+                officeExports.append((formatName, exportFilePath, reservation))
+                continue
+            start = time.perf_counter()
+            try:
+                sheetSeconds = getattr(self, self._nativeFormats[formatName])(exportFilePath, self._formats[formatName][0])
+            except _NativeUnsupported:
+                officeExports.append((formatName, exportFilePath, reservation))
+                continue
+            results[formatName] = self._result(formatName, exportFilePath, reservation, time.perf_counter() - start, 0.0, 'native', sheetSeconds)
+            _recordPhase('native', results[formatName].seconds)
+
+        if officeExports:
+            quarantine = self.pool.quarantine
+            if quarantine is not None and quarantine.contains(self.documentPath):
+                raise Exception('The document is quarantined after failing %d times: %s' % (quarantine.maxFailures, self.documentPath))
+            for attempt in range(self.pool.retries + 1):
+                try:
+                    self._exportOffice(officeExports, results)
+                    break
+                except Exception as e:
+                    if attempt == self.pool.retries:
+                        if quarantine is not None:
+                            quarantine.addFailure(self.documentPath, '%s: %s' % (type(e).__name__, e))
+                        raise
+                    import logging
+                    logging.getLogger('MSOfficeFileConverter').warning('Retrying the export of %s after %s: %s', self.documentPath, type(e).__name__, e)
+                    officeExports = [export for export in officeExports if export[0] not in results]
+            if quarantine is not None:
+                quarantine.release(self.documentPath)
+
+        if self.cache is not None and prepared:
+            cacheStart = time.perf_counter()
+            for formatName, _, _ in prepared:
+                self.cache.store(cacheKeys[formatName], results[formatName].path, results[formatName].folder)
+            _recordPhase('cacheStore', time.perf_counter() - cacheStart)
+
+    def _exportOffice(self, officeExports, results):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        start = time.perf_counter()
+        _closedDocumentLocal.folders = []
+        try:
+            with self._openDocument() as document:
+                openSeconds = time.perf_counter() - start
+                for formatName, exportFilePath, reservation in officeExports:
+                    enumNum, exportMethod, _ = self._formats[formatName]
+                    start = time.perf_counter()
+                    sheetSeconds = getattr(self, exportMethod)(document, exportFilePath, enumNum)
+                    results[formatName] = self._result(formatName, exportFilePath, reservation, time.perf_counter() - start, openSeconds, 'office', sheetSeconds)
+                    _recordPhase('export', results[formatName].seconds)
+        finally:
+            for folder in _closedDocumentLocal.folders:
+                shutil.rmtree(folder, ignore_errors=True)
+            _closedDocumentLocal.folders = []
+
+    def _exportFormats(self, formats, exportFolder, exportFileName, incremental):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        formatNames = self._formatNames(formats)
+        results = {}
+        if incremental is not None:
+            for formatName in formatNames:
+                target = self._targetPath(formatName, exportFolder, exportFileName)
+                if incremental.check(self.documentPath, formatName, target) is None:
+                    entry = incremental.get(self.documentPath, formatName, target)
+                    results[formatName] = self._result(formatName, entry['path'], entry['folder'], 0.0, 0.0, 'upToDate')
+        prepared = []
+        try:
+            for formatName in formatNames:
+                if formatName not in results:
+                    prepared.append((formatName,) + self._prepareExport(formatName, exportFolder, exportFileName))
+            self._exportPrepared(prepared, results)
+        finally:
+            for _, _, reservation in prepared:
+                if reservation is not None:
+                    reservation.discard()
+
+        if incremental is not None:
+            sourceHash = None
+            for formatName, result in results.items():
+                if result.engine != 'upToDate':
+                    sourceHash = sourceHash or ConversionCache.hashFile(self.documentPath)
+                    incremental.record(self.documentPath, formatName, self._targetPath(formatName, exportFolder, exportFileName),
+                                            result.path, result.folder, result.files, sourceHash)
+        return {formatName: results[formatName] for formatName in formatNames}
+
+
+class WordDocument(_OfficeDocument):
+    """Open a Word document from a specified file path, then offer methods to convert it to whatever format you want.
+
+Usage:
+    #Creating the WordDocument object
+    document = WordDocument('Example\\Path\\To\\file.docx')
+    #Exporting to PDF
+    document.toPdf('Example\\Export\\Path','ExampleFileName')
+
+Currently support the export in the following formats:
+    - Docx
+    - Docx (Strict Open XML Document)
+    - Docm
+    - Doc
+    - Dotm
+    - Dot
+    - Pdf
+    - Xps
+    - Mht
+    - Mthml
+    - Html
+    - Html (Filtered)
+    - Htm
+    - Rtf
+    - Txt
+    - Xml
+    - Xml (Macro Enabled)
+    - Xml (2003)
+    - Odt
+
+    - native : Export the Txt of .docx / .docm files without Word when possible. False to always use Word.
+    - pages : The pages to export to PDF and XPS, EX. range(1, 4) (the pages must be consecutive)."""
+    _progName = "Word.Application"
+    _formats = {
+        'docx': (16, '_export', None),
+        'docm': (13, '_export', None),
+        'doc': (0, '_export', None),
+        'dotm': (15, '_export', None),
+        'dot': (1, '_export', None),
+        'pdf': (17, '_exportFixedFormat', None),
+        'xps': (18, '_exportFixedFormat', None),
+        'mht': (9, '_export', None),
+        'mhtml': (9, '_export', None),
+        'html': (8, '_export', 'HtmlFiles_'),
+        'htm': (8, '_export', 'HtmFiles_'),
+        'html_filtered': (10, '_export', 'HtmlFilteredFiles_'),
+        'rtf': (6, '_export', None),
+        'txt': (2, '_export', None),
+        'xml': (12, '_export', None),
+        'xml_macroenabled': (13, '_export', None),
+        'xml_2003': (11, '_export', None),
+        'docx_readonly': (24, '_export', None),
+        'odt': (23, '_export', None),
+    }
+    _nativeFormats = {
+        'txt': '_exportNativeTxt',
+    }
+    _nativeStreamFormats = {
+        'txt': '_streamNativeTxt',
+    }
+
+    def __init__(self, documentPath, pool=None, native=True, cache=None, overwrite=False, incremental=None, pages=None, archive=None, compressionLevel=None):
+        super().__init__(documentPath, pool, native, cache, overwrite, incremental, archive, compressionLevel)
+        self.pages = _pageNumbers(pages, 'pages')
+
+    def _open(self, word, arguments):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        return word.Documents.Open(self.documentPath, **arguments)
+
+    def _cacheOptions(self, formatName):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self._formats[formatName][1] == '_exportFixedFormat' and self.pages is not None:
+            return {'pages': self.pages}
+        return {}
+
+    def _export(self, document, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        document.SaveAs(exportFilePath, enumNum)
+
+    def _exportFixedFormat(self, document, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.pages is None:
+            document.SaveAs(exportFilePath, enumNum)
+            return
+        first, last = _pageRange(self.pages, 'pages')
+        # 3 : wdExportFromTo. Only these pages are rendered.
+        document.ExportAsFixedFormat(OutputFileName=exportFilePath, ExportFormat=enumNum, Range=3, From=first, To=last)
+
+    def _exportNativeTxt(self, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.defaultDocumentExtension.lower() not in ('docx', 'docm'):
+            raise _NativeUnsupported('Only .docx and .docm files are read natively.')
+        _exportNativeTxt(self.documentPath, exportFilePath)
+
+    def _streamNativeTxt(self, stream, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.defaultDocumentExtension.lower() not in ('docx', 'docm'):
+            raise _NativeUnsupported('Only .docx and .docm files are read natively.')
+        _writeNativeTxt(self.documentPath, stream)
+
+    def iterParagraphs(self, headersFooters=False):
+        """Yield the text of the paragraphs of a .docx / .docm document without Word, reading it in small chunks.
+        - A table row is yielded as a single string, its cells separated by tabs."""
+        return _iterDocxText(self.documentPath, headersFooters)
+
+    def toDocx(self, exportFolder=None, exportFileName=None):
+        """Export to Word Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['docx'], exportFolder, exportFileName)['docx']
+
+    def toDocm(self, exportFolder=None, exportFileName=None):
+        """Export to Word Macro-Enabled Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['docm'], exportFolder, exportFileName)['docm']
+
+    def toDoc(self, exportFolder=None, exportFileName=None):
+        """Export to Word 1997-2003 Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['doc'], exportFolder, exportFileName)['doc']
+
+    def toDotm(self, exportFolder=None, exportFileName=None):
+        """Export to Word Macro-Enabled Template.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['dotm'], exportFolder, exportFileName)['dotm']
+
+    def toDot(self, exportFolder=None, exportFileName=None):
+        """Export to Word 1997-2003 Template.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['dot'], exportFolder, exportFileName)['dot']
+
+    def toPdf(self, exportFolder=None, exportFileName=None):
+        """Export to PDF.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pdf'], exportFolder, exportFileName)['pdf']
+
+    def toXps(self, exportFolder=None, exportFileName=None):
+        """Export to XPS Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xps'], exportFolder, exportFileName)['xps']
+
+    def toMht(self, exportFolder=None, exportFileName=None):
+        """Export to Single File Web Page (*.mht).
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['mht'], exportFolder, exportFileName)['mht']
+
+    def toMhtml(self, exportFolder=None, exportFileName=None):
+        """Export to Single File Web Page (*.mhtml).
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['mhtml'], exportFolder, exportFileName)['mhtml']
+
+    def toHtml(self, exportFolder=None, exportFileName=None):
+        """Export to Web Page (*.html).
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['html'], exportFolder, exportFileName)['html']
+
+    def toHtm(self, exportFolder=None, exportFileName=None):
+        """Export to Web Page (*.htm).
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['htm'], exportFolder, exportFileName)['htm']
+
+    def toHtml_Filtered(self, exportFolder=None, exportFileName=None):
+        """Export to Web Page, Filtered (*.htm; *.html).
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['html_filtered'], exportFolder, exportFileName)['html_filtered']
+
+    def toRtf(self, exportFolder=None, exportFileName=None):
+        """Export to Rich Text Format.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['rtf'], exportFolder, exportFileName)['rtf']
+
+    def toTxt(self, exportFolder=None, exportFileName=None):
+        """Export to Plain Text.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['txt'], exportFolder, exportFileName)['txt']
+
+    def toXml(self, exportFolder=None, exportFileName=None):
+        """Export to Word XML Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xml'], exportFolder, exportFileName)['xml']
+
+    def toXml_MacroEnabled(self, exportFolder=None, exportFileName=None):
+        """Export to Word XML Document with macro enabled.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xml_macroenabled'], exportFolder, exportFileName)['xml_macroenabled']
+
+    def toXml_2003(self, exportFolder=None, exportFileName=None):
+        """Export to Word 2003 XML Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xml_2003'], exportFolder, exportFileName)['xml_2003']
+
+    def toDocx_ReadOnly(self, exportFolder=None, exportFileName=None):
+        """Export to Strict Open XML Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['docx_readonly'], exportFolder, exportFileName)['docx_readonly']
+
+    def toOdt(self, exportFolder=None, exportFileName=None):
+        """Export to OpenDocument Text.
+        - If you do not specify an export folder, the document will be created in the same directory as the original Word directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['odt'], exportFolder, exportFileName)['odt']
+
+
+class ExcelDocument(_OfficeDocument):
+    """Open a Excel document from a specified file path, then offer methods to convert it to whatever format you want.
+
+Usage:
+    #Creating the ExcelDocument object
+    document = ExcelDocument('Example\\Path\\To\\file.xlsx')
+    #Exporting to PDF
+    document.toPdf('Example\\Export\\Path','ExampleFileName')
+
+Currently support the export in the following formats:
+    - Xlsx
+    - Xlsm
+    - Xlsb
+    - Xls
+    - Xml (Data)
+    - Mht
+    - Mhtml
+    - Xltx
+    - Xltm
+    - Xlt
+    - Txt (Windows)
+    - Txt (Macintosh)
+    - Txt (Unicode)
+    - Txt (MSDOS)
+    - Csv (UTF-8)
+    - Csv (Windows)
+    - Csv (Macintosh)
+    - Csv (Unicode)
+    - Csv (MSDOS)
+    - Xml (Spreadsheet 2003)
+    - Xls (Excel 5.0/95 Workbook)
+    - Prn
+    - Dif
+    - Slk
+    - Xlam
+    - Xla
+    - Pdf
+    - Xps
+    - Xlsx (Strict Open XML Spreadsheet)
+    - Ods
+    - Npz (NumPy arrays of the columns of each sheet, see toArrays)
+
+    - native : Export the CSV formats of .xlsx / .xlsm files without Excel when possible. False to always use Excel.
+    - sheetWorkers : Number of workers exporting the sheets of the formats exported sheet by sheet (EX. Csv) at the same time.
+    - sharedStringsMemory : Bytes of shared strings the native engine keeps in memory, the rest goes to a temporary file.
+    - sheets : The sheet names or numbers (1-based) to export to the formats exported sheet by sheet, PDF and XPS.
+    - activeSheetOnly : If True, only the sheet active when the workbook was saved is exported.
+    - pages : The pages to export to PDF and XPS, EX. range(1, 4) (the pages must be consecutive).
+    """
+    _progName = "Excel.Application"
+    _formats = {
+        'xlsx': (51, '_exportAll', None),
+        'xlsm': (52, '_exportAll', None),
+        'xlsb': (50, '_exportAll', None),
+        'xls': (56, '_exportAll', None),
+        'csv_utf8': (62, '_exportAllSheets', 'CSV_UTF8_Files_'),
+        'xml': (46, '_exportAll', None),
+        'mht': (45, '_exportAll', None),
+        'mhtml': (45, '_exportAll', None),
+        'xltm': (53, '_exportAll', None),
+        'xlt': (17, '_exportAll', None),
+        'txt_windows': (20, '_exportAllSheets', 'TXT_Windows_Files_'),
+        'txt_unicode': (42, '_exportAllSheets', 'TXT_Unicode_Files_'),
+        'xls_95workbook': (39, '_exportAll', None),
+        'csv': (6, '_exportAllSheets', 'CSV_Files_'),
+        'csv_windows': (23, '_exportAllSheets', 'CSV_Windows_Files_'),
+        'prn': (36, '_exportAllSheets', 'PRN_Files_'),
+        'txt_macintosh': (19, '_exportAllSheets', 'TXT_Macintosh_Files_'),
+        'txt_msdos': (21, '_exportAllSheets', 'TXT_MSDOS_Files_'),
+        'csv_macintosh': (22, '_exportAllSheets', 'CSV_Macintosh_Files_'),
+        'csv_msdos': (24, '_exportAllSheets', 'CSV_MSDOS_Files_'),
+        'dif': (9, '_exportAll', None),
+        'slk': (2, '_exportAllSheets', 'SLK_Files_'),
+        'xlam': (55, '_exportAll', None),
+        'xla': (18, '_exportAll', None),
+        'pdf': (0, '_exportFixedFormat', None),
+        'xps': (1, '_exportFixedFormat', None),
+        'xlsx_readonly': (61, '_exportAll', None),
+        'ods': (60, '_exportAll', None),
+        'npz': (51, '_exportSheetArrays', 'NPZ_Files_'),
+    }
+    _sheetMethods = ('_exportAllSheets', '_exportSheetArrays')
+    _nativeFormats = {
+        'npz': '_exportNativeNpz',
+        'csv': '_exportNativeCsv',
+        'csv_utf8': '_exportNativeCsv',
+        'csv_windows': '_exportNativeCsv',
+        'csv_msdos': '_exportNativeCsv',
+        'csv_macintosh': '_exportNativeCsv',
+    }
+
+    def __init__(self, documentPath, pool=None, native=True, cache=None, sheetWorkers=1, overwrite=False, incremental=None, sharedStringsMemory=None,
+                 sheets=None, activeSheetOnly=False, pages=None, archive=None, compressionLevel=None):
+        super().__init__(documentPath, pool, native, cache, overwrite, incremental, archive, compressionLevel)
+        self.sheetWorkers = sheetWorkers
+        self.sharedStringsMemory = sharedStringsMemory
+        if sheets is not None:
+            sheets = list(sheets)
+            if not all(isinstance(sheet, str) or (isinstance(sheet, int) and not isinstance(sheet, bool) and sheet >= 1) for sheet in sheets):
+                raise Exception('The sheets must be names or numbers starting at 1.')
+        self.sheets = sheets
+        self.activeSheetOnly = activeSheetOnly
+        self.pages = _pageNumbers(pages, 'pages')
+
+    def _cacheOptions(self, formatName):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        exportMethod = self._formats[formatName][1]
+        options = {}
+        if exportMethod in self._sheetMethods or exportMethod == '_exportFixedFormat':
+            if self.activeSheetOnly:
+                options['activeSheetOnly'] = True
+            elif self.sheets is not None:
+                options['sheets'] = self.sheets
+        if exportMethod == '_exportFixedFormat' and self.pages is not None:
+            options['pages'] = self.pages
+        return options
+
+    def _selectedSheets(self, sheetNames, activeSheetName):
+        """Internal magic function: the numbers (1-based) of the worksheets to export.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.activeSheetOnly:
+            if activeSheetName not in sheetNames:
+                raise Exception('The active sheet of the workbook is not a worksheet.')
+            return [sheetNames.index(activeSheetName) + 1]
+        if self.sheets is None:
+            return list(range(1, len(sheetNames) + 1))
+        return sorted(set(_sheetIndex(sheetNames, sheet) + 1 for sheet in self.sheets))
+
+    def _workbookSheets(self, workbook):
+        """Internal magic function: the numbers (1-based) of the worksheets to export, from the opened workbook.\n\n*Do not use it, there is an underscore for a reason."""
+        return self._selectedSheets([worksheet.Name for worksheet in workbook.Worksheets], workbook.ActiveSheet.Name)
+
+    def _nativeSheets(self, path):
+        """Internal magic function: the numbers (1-based) of the worksheets to export, read without Excel.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.sheets is None and not self.activeSheetOnly:
+            return None
+        with _XlsxReader(path) as reader:
+            return self._selectedSheets([name for name, _ in reader.sheets], reader.activeSheetName)
+
+    def _open(self, excel, arguments):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        return excel.Workbooks.Open(self.documentPath, **arguments)
+
+    def _exportAll(self, workbook, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        workbook.SaveAs(exportFilePath, enumNum)
+
+    def _exportFixedFormat(self, workbook, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        pageRange = {}
+        if self.pages is not None:
+            first, last = _pageRange(self.pages, 'pages')
+            pageRange = {'From': first, 'To': last}
+        if self.activeSheetOnly:
+            workbook.ActiveSheet.ExportAsFixedFormat(enumNum, exportFilePath, **pageRange)
+            return
+        if self.sheets is None:
+            workbook.ExportAsFixedFormat(enumNum, exportFilePath, **pageRange)
+            return
+        # The hidden sheets are not exported: the other sheets are hidden during the export, then shown again
+        # (the workbook is never saved, but the next formats are exported from it).
+        selected = set(self._workbookSheets(workbook))
+        hidden = []
+        try:
+            for number, worksheet in enumerate(workbook.Worksheets, 1):
+                # -1 : xlSheetVisible, 0 : xlSheetHidden.
+                if number not in selected and worksheet.Visible == -1:
+                    worksheet.Visible = 0
+                    hidden.append(worksheet)
+            workbook.ExportAsFixedFormat(enumNum, exportFilePath, **pageRange)
+        finally:
+            for worksheet in hidden:
+                worksheet.Visible = -1
+
+    def _exportNativeCsv(self, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.defaultDocumentExtension.lower() not in ('xlsx', 'xlsm'):
+            raise _NativeUnsupported('Only .xlsx and .xlsm files are read natively.')
+        folderName, fileName = os.path.split(exportFilePath)
+        return _exportNativeCsv(self.documentPath, folderName, os.path.splitext(fileName)[1], enumNum, self.sheetWorkers, self.sharedStringsMemory,
+                                self._nativeSheets(self.documentPath))
+
+    def _exportNativeNpz(self, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.defaultDocumentExtension.lower() not in ('xlsx', 'xlsm'):
+            raise _NativeUnsupported('Only .xlsx and .xlsm files are read natively.')
+        return _exportNativeNpz(self.documentPath, os.path.dirname(exportFilePath), self.sharedStringsMemory, self._nativeSheets(self.documentPath))
+
+    def _exportSheetArrays(self, workbook, exportFilePath, enumNum):
+        """Internal magic function: the workbooks not read natively (EX. .xls) are saved as .xlsx by Excel, then read natively.\n\n*Do not use it, there is an underscore for a reason."""
+        copyFolder = _createStagingFolder()
+        # The copy stays opened by Excel until the workbook is closed: removed by _exportOffice.
+        _closedDocumentLocal.folders.append(copyFolder)
+        copyPath = os.path.join(copyFolder, self.fileName + '.xlsx')
+        sheetNumbers = self._workbookSheets(workbook)
+        workbook.SaveAs(copyPath, enumNum)
+        return _exportNativeNpz(copyPath, os.path.dirname(exportFilePath), self.sharedStringsMemory, sheetNumbers)
+
+    def _exportAllSheets(self, workbook, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        import concurrent.futures
+        folderName, fileName = os.path.split(exportFilePath)
+        extension = os.path.splitext(fileName)[1]
+        parts = _partition(self._workbookSheets(workbook), self.sheetWorkers)
+        # The first part is exported with the workbook already opened, the others by helper threads opening it again.
+        futures = [helper.submit(functools.partial(self._exportSheetsCopy, part, folderName, extension, enumNum))
+                   for helper, part in zip(self.pool.helperThreads(len(parts) - 1), parts[1:])]
+        try:
+            sheetSeconds = self._exportSheets(workbook, set(parts[0]), folderName, extension, enumNum)
+        finally:
+            concurrent.futures.wait(futures)
+        for future in futures:
+            sheetSeconds.update(future.result())
+        return dict(sorted(sheetSeconds.items()))
+
+    def _exportSheets(self, workbook, sheetNumbers, folderName, extension, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        sheetSeconds = {}
+        for index, item in enumerate(workbook.Worksheets):
+            if index + 1 in sheetNumbers:
+                start = time.perf_counter()
+                item.SaveAs(os.path.join(folderName, str(index + 1) + extension), enumNum)
+                sheetSeconds[index + 1] = time.perf_counter() - start
+        return sheetSeconds
+
+    def _exportSheetsCopy(self, sheetNumbers, folderName, extension, enumNum, pool):
+        """Internal magic function, run by a helper thread.\n\n*Do not use it, there is an underscore for a reason."""
+        # Read only whatever the profile: the workbook is already opened by another Excel instance.
+        with pool.borrow(self._progName) as excel, self._openIn(excel, pool.openProfile, ReadOnly=True) as workbook:
+            return self._exportSheets(workbook, set(sheetNumbers), folderName, extension, enumNum)
+
+    def toXlsx(self, exportFolder=None, exportFileName=None):
+        """Export to Excel Workbook.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xlsx'], exportFolder, exportFileName)['xlsx']
+
+    def toXlsm(self, exportFolder=None, exportFileName=None):
+        """Export to Excel Macro-Enabled Workbook.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xlsm'], exportFolder, exportFileName)['xlsm']
+
+    def toXlsb(self, exportFolder=None, exportFileName=None):
+        """Export to Excel Binary Workbook.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xlsb'], exportFolder, exportFileName)['xlsb']
+
+    def toXls(self, exportFolder=None, exportFileName=None):
+        """Export to Excel 1997-2003 Workbook.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xls'], exportFolder, exportFileName)['xls']
+
+    def toCsv_UTF8(self, exportFolder=None, exportFileName=None):
+        """Export to CSV UTF-8 (Comma delimited).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['csv_utf8'], exportFolder, exportFileName)['csv_utf8']
+
+    def toXml(self, exportFolder=None, exportFileName=None):
+        """Export to XML Data.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xml'], exportFolder, exportFileName)['xml']
+
+    def toMht(self, exportFolder=None, exportFileName=None):
+        """Export to Single File Web Page (*.mht).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['mht'], exportFolder, exportFileName)['mht']
+
+    def toMhtml(self, exportFolder=None, exportFileName=None):
+        """Export to Single File Web Page (*.html).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['mhtml'], exportFolder, exportFileName)['mhtml']
+
+    def toXltm(self, exportFolder=None, exportFileName=None):
+        """Export to Excel Macro-Enabled Template.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xltm'], exportFolder, exportFileName)['xltm']
+
+    def toXlt(self, exportFolder=None, exportFileName=None):
+        """Export to Excel 1997-2003 Template.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xlt'], exportFolder, exportFileName)['xlt']
+
+    def toTxt_Windows(self, exportFolder=None, exportFileName=None):
+        """Export to Text (Windows).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['txt_windows'], exportFolder, exportFileName)['txt_windows']
+
+    def toTxt_Unicode(self, exportFolder=None, exportFileName=None):
+        """Export to Unicode Text.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['txt_unicode'], exportFolder, exportFileName)['txt_unicode']
+
+    def toXls_95Workbook(self, exportFolder=None, exportFileName=None):
+        """Export to Excel 5.0/95 Workbook.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xls_95workbook'], exportFolder, exportFileName)['xls_95workbook']
+
+    def toCsv(self, exportFolder=None, exportFileName=None):
+        """Export to CSV (Comma delimited).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['csv'], exportFolder, exportFileName)['csv']
+
+    def toCsv_Windows(self, exportFolder=None, exportFileName=None):
+        """Export to CSV (Windows).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['csv_windows'], exportFolder, exportFileName)['csv_windows']
+
+    def toPrn(self, exportFolder=None, exportFileName=None):
+        """Export to Formatted Text (Space delimited).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['prn'], exportFolder, exportFileName)['prn']
+
+    def toTxt_Macintosh(self, exportFolder=None, exportFileName=None):
+        """Export to Text (Macintosh).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['txt_macintosh'], exportFolder, exportFileName)['txt_macintosh']
+
+    def toTxt_MSDOS(self, exportFolder=None, exportFileName=None):
+        """Export to Text (MS-DOS).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['txt_msdos'], exportFolder, exportFileName)['txt_msdos']
+
+    def toCsv_Macintosh(self, exportFolder=None, exportFileName=None):
+        """Export to CSV (Macintosh).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['csv_macintosh'], exportFolder, exportFileName)['csv_macintosh']
+
+    def toCsv_MSDOS(self, exportFolder=None, exportFileName=None):
+        """Export to CSV (MS-DOS).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['csv_msdos'], exportFolder, exportFileName)['csv_msdos']
+
+    def toDif(self, exportFolder=None, exportFileName=None):
+        """Export to DIF (Data Interchange Format).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['dif'], exportFolder, exportFileName)['dif']
+
+    def toSlk(self, exportFolder=None, exportFileName=None):
+        """Export to SYLK (Symbolic Link).
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['slk'], exportFolder, exportFileName)['slk']
+
+    def toXlam(self, exportFolder=None, exportFileName=None):
+        """Export to Excel Add-in.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xlam'], exportFolder, exportFileName)['xlam']
+
+    def toXla(self, exportFolder=None, exportFileName=None):
+        """Export to Excel 1997-2003 Add-in.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xla'], exportFolder, exportFileName)['xla']
+
+    def toPdf(self, exportFolder=None, exportFileName=None):
+        """Export to PDF.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pdf'], exportFolder, exportFileName)['pdf']
+
+    def toXps(self, exportFolder=None, exportFileName=None):
+        """Export to XPS Document.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xps'], exportFolder, exportFileName)['xps']
+
+    def toXlsx_ReadOnly(self, exportFolder=None, exportFileName=None):
+        """Export to Scrict Open XML Spreadsheet.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xlsx_readonly'], exportFolder, exportFileName)['xlsx_readonly']
+
+    def toOds(self, exportFolder=None, exportFileName=None):
+        """Export to OpenDocument Spreadsheet.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['ods'], exportFolder, exportFileName)['ods']
+
+    def toNpz(self, exportFolder=None, exportFileName=None):
+        """Export every worksheet to a NumPy .npz file of its columns (see toArrays and SheetArrays.fromNpz), in a folder like toCsv. Require numpy.
+        - If you do not specify an export folder, the document will be created in the same directory as the Excel directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['npz'], exportFolder, exportFileName)['npz']
+
+    def toArrays(self, sheets=None, header=True):
+        """Read the worksheets into NumPy arrays, one array per column. Require numpy.
+        - sheets : A list of sheet numbers (1-based) or sheet names (default: the sheets of the constructor).
+        - header : If True, the first row gives the column names. Otherwise, the columns are named by their letters.
+        Return a dict of sheet name -> SheetArrays."""
+        if self.native and self.defaultDocumentExtension.lower() in ('xlsx', 'xlsm'):
+            return self._readArrays(self.documentPath, sheets, header)
+        copyFolder = _createStagingFolder()
+        try:
+            copyPath = os.path.join(copyFolder, self.fileName + '.xlsx')
+            with self._openDocument() as workbook:
+                workbook.SaveAs(copyPath, self._formats['npz'][0])
+            return self._readArrays(copyPath, sheets, header)
+        finally:
+            shutil.rmtree(copyFolder, ignore_errors=True)
+
+    def iterRows(self, sheet=1, columns=None, start=None, stop=None):
+        """Yield the rows of a worksheet as tuples, read from the file in small chunks as they are consumed.
+        - sheet : The sheet number (1-based) or name.
+        - columns : A list of column letters (EX. ['A', 'C']) or numbers (1-based). If None, every column.
+        - start, stop : Like a slice of the rows, EX. iterRows(stop=100) yields the first 100 rows.
+        The arguments are checked by the call itself, not when the first row is read."""
+        start = start or 0
+        if start < 0 or (stop is not None and stop < 0):
+            raise Exception('start and stop must be positive or None.')
+        if columns is not None:
+            columns = [_columnIndex(column.upper()) if isinstance(column, str) else column for column in columns]
+            if not all(isinstance(column, int) and column >= 1 for column in columns):
+                raise Exception('The columns must be letters or numbers starting at 1.')
+        if self.native and self.defaultDocumentExtension.lower() in ('xlsx', 'xlsm'):
+            with _XlsxReader(self.documentPath, self.sharedStringsMemory) as reader:
+                _sheetIndex([name for name, _ in reader.sheets], sheet)
+            return self._iterRows(self.documentPath, sheet, columns, start, stop)
+        return self._iterOfficeRows(sheet, columns, start, stop)
+
+    # Same name as the row iterators of the other spreadsheet libraries.
+    iter_rows = iterRows
+
+    def _iterOfficeRows(self, sheet, columns, start, stop):
+        """Internal magic function: the rows of a workbook opened by Excel, read from an .xlsx copy.\n\n*Do not use it, there is an underscore for a reason."""
+        copyFolder = _createStagingFolder()
+        try:
+            copyPath = os.path.join(copyFolder, self.fileName + '.xlsx')
+            with self._openDocument() as workbook:
+                workbook.SaveAs(copyPath, self._formats['npz'][0])
+            yield from self._iterRows(copyPath, sheet, columns, start, stop)
+        finally:
+            shutil.rmtree(copyFolder, ignore_errors=True)
+
+    def _iterRows(self, path, sheet, columns, start, stop):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        with _XlsxReader(path, self.sharedStringsMemory) as reader:
+            sheetIndex = _sheetIndex([name for name, _ in reader.sheets], sheet)
+            dimension = reader.dimension(sheetIndex)
+            # The empty rows at the end of the sheet are yielded up to the last row of its <dimension>, when there is one.
+            lastRow = dimension[2] if dimension else 0
+            if stop is not None:
+                lastRow = min(lastRow, stop)
+            width = len(columns) if columns is not None else (dimension[3] if dimension else 0)
+            positions = {column: position for position, column in enumerate(columns)} if columns is not None else None
+            date1904 = reader.date1904
+            emptyRow = (None,) * width
+            nextRow = start + 1
+            if stop is not None and nextRow > stop:
+                return
+            for rowNumber, cells in reader.iterRows(sheetIndex, set(columns) if columns is not None else None, nextRow):
+                if rowNumber < nextRow:
+                    continue
+                if stop is not None and rowNumber > stop:
+                    break
+                for _ in range(rowNumber - nextRow):
+                    yield emptyRow
+                nextRow = rowNumber + 1
+                if positions is not None:
+                    row = [None] * width
+                    for column, kind, value in cells:
+                        row[positions[column]] = _rowValue(kind, value, date1904)
+                else:
+                    row = [None] * max(width, cells[-1][0] if cells else 0)
+                    for column, kind, value in cells:
+                        row[column - 1] = _rowValue(kind, value, date1904)
+                yield tuple(row)
+            for _ in range(lastRow - nextRow + 1):
+                yield emptyRow
+
+    def _readArrays(self, path, sheets, header):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        with _XlsxReader(path, self.sharedStringsMemory) as reader:
+            sheetNames = [name for name, _ in reader.sheets]
+            if sheets is not None:
+                sheetIndexes = [_sheetIndex(sheetNames, sheet) for sheet in sheets]
+            else:
+                sheetIndexes = [number - 1 for number in self._selectedSheets(sheetNames, reader.activeSheetName)]
+            return {sheetNames[index]: _sheetArrays(reader, index, header) for index in sheetIndexes}
+
+
+class PowerPointDocument(_OfficeDocument):
+    """Open a PowerPoint presentation from a specified file path, then offer methods to convert it to whatever format you want.
+
+Usage:
+    #Creating the PowerPointDocument object
+    document = PowerPointDocument('Example\\Path\\To\\file.pptx')
+    #Exporting to PDF
+    document.toPdf('Example\\Export\\Path','ExampleFileName')
+
+Currently support the export in the following formats:
+    - Pptx
+    - Pptm
+    - Ppt
+    - Potx
+    - Potm
+    - Pot
+    - Ppsx
+    - Ppsm
+    - Pps
+    - Pptx (Strict Open XML Presentation)
+    - Xml
+    - Odp
+    - Rtf (Outline)
+    - Mht
+    - Pdf
+    - Xps
+    - Png, Jpg, Gif, Bmp, Tif (one image per slide, in a folder like the CSV formats of ExcelDocument)
+
+    - slides : The slide numbers (1-based) to export to the image formats, PDF and XPS, EX. range(1, 4).
+    - imageWidth : Width in pixels of the images. If None, PowerPoint chooses the size.
+    """
+    _progName = "PowerPoint.Application"
+    # PowerPoint raises an error when its window is hidden: the presentations are opened without window instead.
+    _hideApplication = False
+    _formats = {
+        'pptx': (24, '_exportAll', None),
+        'pptm': (25, '_exportAll', None),
+        'ppt': (1, '_exportAll', None),
+        'potx': (26, '_exportAll', None),
+        'potm': (27, '_exportAll', None),
+        'pot': (5, '_exportAll', None),
+        'ppsx': (28, '_exportAll', None),
+        'ppsm': (29, '_exportAll', None),
+        'pps': (7, '_exportAll', None),
+        'pptx_readonly': (38, '_exportAll', None),
+        'xml': (34, '_exportAll', None),
+        'odp': (35, '_exportAll', None),
+        'rtf': (6, '_exportAll', None),
+        'mht': (20, '_exportAll', None),
+        'pdf': (2, '_exportFixedFormat', None),
+        'xps': (1, '_exportFixedFormat', None),
+        'png': ('PNG', '_exportSlides', 'PNG_Files_'),
+        'jpg': ('JPG', '_exportSlides', 'JPG_Files_'),
+        'gif': ('GIF', '_exportSlides', 'GIF_Files_'),
+        'bmp': ('BMP', '_exportSlides', 'BMP_Files_'),
+        'tif': ('TIF', '_exportSlides', 'TIF_Files_'),
+    }
+    _sheetMethods = ('_exportSlides',)
+
+    def __init__(self, documentPath, pool=None, native=True, cache=None, overwrite=False, incremental=None, slides=None, imageWidth=None,
+                 archive=None, compressionLevel=None):
+        super().__init__(documentPath, pool, native, cache, overwrite, incremental, archive, compressionLevel)
+        self.slides = _pageNumbers(slides, 'slides')
+        self.imageWidth = imageWidth
+
+    def _open(self, powerPoint, arguments):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        return powerPoint.Presentations.Open(self.documentPath, WithWindow=False, **arguments)
+
+    def _close(self, presentation):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        presentation.Close()
+
+    def _cacheOptions(self, formatName):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        exportMethod = self._formats[formatName][1]
+        options = {}
+        if exportMethod in ('_exportFixedFormat', '_exportSlides') and self.slides is not None:
+            options['slides'] = self.slides
+        if exportMethod == '_exportSlides' and self.imageWidth is not None:
+            options['imageWidth'] = self.imageWidth
+        return options
+
+    def _slideNumbers(self, presentation):
+        """Internal magic function: the selected slides of the presentation.\n\n*Do not use it, there is an underscore for a reason."""
+        slideCount = presentation.Slides.Count
+        if self.slides is None:
+            return list(range(1, slideCount + 1))
+        slides = [slide for slide in self.slides if slide <= slideCount]
+        if not slides:
+            raise Exception('The presentation has only %d slides, none of the selected slides exists.' % slideCount)
+        return slides
+
+    def _exportAll(self, presentation, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        presentation.SaveAs(exportFilePath, enumNum)
+
+    def _exportFixedFormat(self, presentation, exportFilePath, enumNum):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.slides is None:
+            presentation.ExportAsFixedFormat(exportFilePath, enumNum)
+            return
+        first, last = _pageRange(self._slideNumbers(presentation), 'slides')
+        ranges = presentation.PrintOptions.Ranges
+        ranges.ClearAll()
+        # 4 : ppPrintSlideRange.
+        presentation.ExportAsFixedFormat(exportFilePath, enumNum, PrintRange=ranges.Add(first, last), RangeType=4)
+
+    def _exportSlides(self, presentation, exportFilePath, filterName):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        folderName, fileName = os.path.split(exportFilePath)
+        extension = os.path.splitext(fileName)[1]
+        size = ()
+        if self.imageWidth is not None:
+            pageSetup = presentation.PageSetup
+            size = (self.imageWidth, round(self.imageWidth * pageSetup.SlideHeight / pageSetup.SlideWidth))
+        slideSeconds = {}
+        for slideNumber in self._slideNumbers(presentation):
+            start = time.perf_counter()
+            presentation.Slides(slideNumber).Export(os.path.join(folderName, str(slideNumber) + extension), filterName, *size)
+            slideSeconds[slideNumber] = time.perf_counter() - start
+        return slideSeconds
+
+    def toPptx(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint Presentation.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pptx'], exportFolder, exportFileName)['pptx']
+
+    def toPptm(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint Macro-Enabled Presentation.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pptm'], exportFolder, exportFileName)['pptm']
+
+    def toPpt(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint 97-2003 Presentation.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['ppt'], exportFolder, exportFileName)['ppt']
+
+    def toPotx(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint Template.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['potx'], exportFolder, exportFileName)['potx']
+
+    def toPotm(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint Macro-Enabled Template.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['potm'], exportFolder, exportFileName)['potm']
+
+    def toPot(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint 97-2003 Template.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pot'], exportFolder, exportFileName)['pot']
+
+    def toPpsx(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint Show.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['ppsx'], exportFolder, exportFileName)['ppsx']
+
+    def toPpsm(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint Macro-Enabled Show.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['ppsm'], exportFolder, exportFileName)['ppsm']
+
+    def toPps(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint 97-2003 Show.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pps'], exportFolder, exportFileName)['pps']
+
+    def toPptx_ReadOnly(self, exportFolder=None, exportFileName=None):
+        """Export to Strict Open XML Presentation.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pptx_readonly'], exportFolder, exportFileName)['pptx_readonly']
+
+    def toXml(self, exportFolder=None, exportFileName=None):
+        """Export to PowerPoint XML Presentation.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xml'], exportFolder, exportFileName)['xml']
+
+    def toOdp(self, exportFolder=None, exportFileName=None):
+        """Export to OpenDocument Presentation.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['odp'], exportFolder, exportFileName)['odp']
+
+    def toRtf(self, exportFolder=None, exportFileName=None):
+        """Export to Outline/RTF (the text of the slides).
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['rtf'], exportFolder, exportFileName)['rtf']
+
+    def toMht(self, exportFolder=None, exportFileName=None):
+        """Export to Single File Web Page (*.mht).
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['mht'], exportFolder, exportFileName)['mht']
+
+    def toPdf(self, exportFolder=None, exportFileName=None):
+        """Export to PDF (only the selected slides, see the slides argument of the constructor).
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['pdf'], exportFolder, exportFileName)['pdf']
+
+    def toXps(self, exportFolder=None, exportFileName=None):
+        """Export to XPS Document (only the selected slides, see the slides argument of the constructor).
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['xps'], exportFolder, exportFileName)['xps']
+
+    def toPng(self, exportFolder=None, exportFileName=None):
+        """Export to PNG images, one per slide.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['png'], exportFolder, exportFileName)['png']
+
+    def toJpg(self, exportFolder=None, exportFileName=None):
+        """Export to JPEG images, one per slide.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['jpg'], exportFolder, exportFileName)['jpg']
+
+    def toGif(self, exportFolder=None, exportFileName=None):
+        """Export to GIF images, one per slide.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['gif'], exportFolder, exportFileName)['gif']
+
+    def toBmp(self, exportFolder=None, exportFileName=None):
+        """Export to BMP images, one per slide.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['bmp'], exportFolder, exportFileName)['bmp']
+
+    def toTif(self, exportFolder=None, exportFileName=None):
+        """Export to TIFF images, one per slide.
+        - If you do not specify an export folder, the document will be created in the same directory as the original PowerPoint directory.
+        - If you do not specify an export file name, the document will have the same name as the original document, only the extension will change."""
+        return self.export(['tif'], exportFolder, exportFileName)['tif']
+
+
+wordExtensions = ['.doc', '.docx', '.docm', '.dot', '.dotx', '.dotm', '.rtf', '.odt']
+excelExtensions = ['.xls', '.xlsx', '.xlsm', '.xlsb', '.xlt', '.xltx', '.xltm', '.ods']
+powerPointExtensions = ['.ppt', '.pptx', '.pptm', '.pot', '.potx', '.potm', '.pps', '.ppsx', '.ppsm', '.odp']
+
+def _documentClass(documentPath):
+    """Internal magic function: WordDocument, ExcelDocument, PowerPointDocument or None, depending of the extension of the file.\n\n*Do not use it, there is an underscore for a reason."""
+    extension = os.path.splitext(documentPath)[1].lower()
+    if extension in wordExtensions:
+        return WordDocument
+    if extension in excelExtensions:
+        return ExcelDocument
+    if extension in powerPointExtensions:
+        return PowerPointDocument
+    return None
+
+
+def openDocument(documentPath, pool=None, cache=None, overwrite=False, incremental=None, archive=None, compressionLevel=None):
+    """Return a WordDocument, an ExcelDocument or a PowerPointDocument, depending of the extension of the file."""
+    documentClass = _documentClass(documentPath)
+    if documentClass is None:
+        raise Exception('Unsupported document type: ' + documentPath)
+    return documentClass(documentPath, pool=pool, cache=cache, overwrite=overwrite, incremental=incremental, archive=archive, compressionLevel=compressionLevel)
+
+
+def _nativeFormatNames(documentPath):
+    """Internal magic function: the formats of a document usually exported without Office.\n\n*Do not use it, there is an underscore for a reason."""
+    extension = os.path.splitext(documentPath)[1].lower()
+    if extension in ('.docx', '.docm'):
+        return WordDocument._nativeFormats
+    if extension in ('.xlsx', '.xlsm'):
+        return ExcelDocument._nativeFormats
+    return {}
+
+
+def _documentProgram(documentPath):
+    """Internal magic function: 'Word', 'Excel' or 'PowerPoint', depending of the extension of the file.\n\n*Do not use it, there is an underscore for a reason."""
+    extension = os.path.splitext(documentPath)[1].lower()
+    if extension in excelExtensions:
+        return 'Excel'
+    if extension in powerPointExtensions:
+        return 'PowerPoint'
+    return 'Word'
@@ -0,0 +1,202 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Native engine of the Word documents: plain text export of .docx files without Word.
+
+import os
+import zipfile
+import io
+from xml.etree import ElementTree
+
+from .utils import _NativeUnsupported, suppress
+from .xlsx import _packageRelationshipNamespace
+
+
+_wordNamespace = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_markupCompatibilityNamespace = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+
+def _numberedWordStyles(archive):
+    """Return the ids of the paragraph styles adding list numbers / bullets to their paragraphs.\n\n*Do not use it, there is an underscore for a reason."""
+    if 'word/styles.xml' not in archive.namelist():
+        return set()
+    numbered = {}
+    basedOn = {}
+    root = ElementTree.fromstring(archive.read('word/styles.xml'))
+    for style in root.iter(_wordNamespace + 'style'):
+        styleId = style.get(_wordNamespace + 'styleId')
+        numberId = style.find('%spPr/%snumPr/%snumId' % ((_wordNamespace,) * 3))
+        if numberId is not None:
+            numbered[styleId] = numberId.get(_wordNamespace + 'val') != '0'
+        parent = style.find(_wordNamespace + 'basedOn')
+        if parent is not None:
+            basedOn[styleId] = parent.get(_wordNamespace + 'val')
+
+    def isNumbered(styleId, depth=0):
+        if styleId in numbered or depth > 20:
+            return numbered.get(styleId, False)
+        return styleId in basedOn and isNumbered(basedOn[styleId], depth + 1)
+    return set(styleId for styleId in set(numbered) | set(basedOn) if isNumbered(styleId))
+
+
+class _DocxTextTarget:
+    """Parser target appending the text lines of a Word XML part to its lines attribute, without building any element tree.\n\n*Do not use it, there is an underscore for a reason."""
+    _w = _wordNamespace
+    _breakTags = set([_w + 'br', _w + 'cr'])
+    _unsupportedTags = set([_w + 'txbxContent', _w + 'footnoteReference', _w + 'endnoteReference', _w + 'sym'])
+    _skippedTags = set([_w + 'moveFrom', _w + 'del', _markupCompatibilityNamespace + 'Fallback'])
+
+    def __init__(self, strict, numberedStyles):
+        self.strict = strict
+        self.numberedStyles = numberedStyles
+        self.lines = []
+        self.cells = []
+        self.paragraph = None
+        # The paragraphs of a textbox are inside the paragraph anchoring it.
+        self.outerParagraphs = []
+        self.text = None
+        self.inRun = 0
+        self.inRunProperties = False
+        self.hiddenRun = False
+        self.skipped = 0
+
+    def _emit(self, line):
+        if self.cells:
+            self.cells[-1][-1].append(line)
+        else:
+            self.lines.append(line)
+
+    def start(self, tag, attributes):
+        w = self._w
+        if self.skipped:
+            if tag in self._skippedTags:
+                self.skipped += 1
+            return
+        if tag == w + 't':
+            if self.inRun and not self.hiddenRun:
+                self.text = []
+        elif tag == w + 'r':
+            self.inRun += 1
+            self.hiddenRun = False
+        elif tag == w + 'p':
+            self.outerParagraphs.append(self.paragraph)
+            self.paragraph = []
+        elif tag == w + 'tab':
+            if self.inRun and not self.hiddenRun:
+                self.paragraph.append('\t')
+        elif tag in self._breakTags:
+            if self.inRun and not self.hiddenRun:
+                self.paragraph.append('\r\n')
+        elif tag == w + 'noBreakHyphen':
+            self.paragraph.append('-')
+        elif tag == w + 'rPr':
+            self.inRunProperties = self.inRun > 0
+        elif tag == w + 'vanish':
+            if self.inRunProperties:
+                self.hiddenRun = attributes.get(w + 'val', 'true') not in ('0', 'false', 'off')
+        elif tag == w + 'tr':
+            self.cells.append([])
+        elif tag == w + 'tc':
+            self.cells[-1].append([])
+        elif tag in self._skippedTags:
+            self.skipped = 1
+        elif self.strict:
+            if tag in self._unsupportedTags:
+                raise _NativeUnsupported('Unsupported Word content: ' + tag[len(w):])
+            if tag == w + 'numId' and attributes.get(w + 'val') != '0':
+                raise _NativeUnsupported('List numbers and bullets are exported by Word.')
+            if tag == w + 'pStyle' and attributes.get(w + 'val') in self.numberedStyles:
+                raise _NativeUnsupported('List numbers and bullets are exported by Word.')
+
+    def data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+
+    def end(self, tag):
+        w = self._w
+        if self.skipped:
+            if tag in self._skippedTags:
+                self.skipped -= 1
+            return
+        if tag == w + 't':
+            if self.text is not None:
+                self.paragraph.extend(self.text)
+                self.text = None
+        elif tag == w + 'r':
+            self.inRun -= 1
+            self.hiddenRun = False
+        elif tag == w + 'rPr':
+            self.inRunProperties = False
+        elif tag == w + 'p':
+            self._emit(''.join(self.paragraph))
+            self.paragraph = self.outerParagraphs.pop()
+        elif tag == w + 'tr':
+            row = self.cells.pop()
+            self._emit('\t'.join('\r\n'.join(cell) for cell in row))
+
+    def close(self):
+        pass
+
+
+def _iterDocxText(documentPath, headersFooters=False, strict=False):
+    """Yield the text lines (paragraphs and table rows) of a .docx / .docm file, with its headers and footers if headersFooters.\n\n*Do not use it, there is an underscore for a reason."""
+    try:
+        archive = zipfile.ZipFile(documentPath)
+    except (zipfile.BadZipFile, OSError):
+        raise _NativeUnsupported('Not an Office Open XML file: ' + documentPath)
+    with archive:
+        parts = ['word/document.xml']
+        try:
+            if headersFooters:
+                relationships = ElementTree.fromstring(archive.read('word/_rels/document.xml.rels'))
+                targets = {'header': [], 'footer': []}
+                for relationship in relationships.iter(_packageRelationshipNamespace + 'Relationship'):
+                    kind = relationship.get('Type', '').split('/')[-1]
+                    if kind in targets:
+                        target = relationship.get('Target')
+                        targets[kind].append(target[1:] if target.startswith('/') else 'word/' + target)
+                parts = sorted(targets['header']) + parts + sorted(targets['footer'])
+            numberedStyles = _numberedWordStyles(archive) if strict else set()
+        except (KeyError, ElementTree.ParseError) as e:
+            raise _NativeUnsupported('Cannot read the document: %s' % e)
+
+        for part in parts:
+            target = _DocxTextTarget(strict, numberedStyles)
+            parser = ElementTree.XMLParser(target=target)
+            try:
+                with archive.open(part) as f:
+                    while True:
+                        chunk = f.read(65536)
+                        if not chunk:
+                            break
+                        parser.feed(chunk)
+                        lines, target.lines = target.lines, []
+                        for line in lines:
+                            yield line
+                parser.close()
+            except (KeyError, ElementTree.ParseError) as e:
+                raise _NativeUnsupported('Cannot read the document: %s' % e)
+
+
+def _writeNativeTxt(documentPath, binaryStream):
+    """Write the text of a .docx / .docm file to a binary stream like Word SaveAs wdFormatText does, or raise _NativeUnsupported.\n\n*Do not use it, there is an underscore for a reason."""
+    # Word uses the ANSI code page of Windows: the Western European one is used here.
+    stream = io.TextIOWrapper(binaryStream, encoding='cp1252', errors='replace', newline='')
+    try:
+        for line in _iterDocxText(documentPath, strict=True):
+            stream.write(line + '\r\n')
+        stream.flush()
+    finally:
+        # Leave the binary stream open for the caller.
+        stream.detach()
+
+
+def _exportNativeTxt(documentPath, exportFilePath):
+    """Export the text of a .docx / .docm file like Word SaveAs wdFormatText does, or raise _NativeUnsupported.\n\n*Do not use it, there is an underscore for a reason."""
+    try:
+        with open(exportFilePath, 'wb') as stream:
+            _writeNativeTxt(documentPath, stream)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(exportFilePath)
+        raise
@@ -0,0 +1,303 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# FakeBackend: an in-process stand-in for Microsoft Office, used by the tests and by benchmark.py on any platform.
+# It is not imported by the package: use "from MSOfficeFileConverter.fakeoffice import FakeBackend".
+import os
+import re
+import shutil
+import threading
+import time
+import zipfile
+
+from .backends import OfficeBackend
+
+
+class FakeBackend(OfficeBackend):
+    """In-process stand-in for Microsoft Office, usable on any platform.
+
+Every "export" writes a small text file describing the source document and the format enum used, except the exports
+to the extension of the source document (EX. a .xlsx saved as .xlsx), which copy it.
+    - startupDelay : Seconds slept for each dispatch(), to simulate the Office cold start.
+    - saveDelay : Seconds slept for each SaveAs / ExportAsFixedFormat call.
+    - openDelay : Seconds slept for each opened document.
+    - secondsPerMegabyte : Seconds added to each open and each save for every MB of the source document, so large documents are slower
+                           (a sheet by sheet save adds its share of the workbook size).
+    - failOn : Exports of the documents whose path contain one of these strings raise an exception.
+    - crashOn : Exports of the documents whose path contain one of these strings kill the whole process, like a crashing Office would kill a batch worker.
+    - hangOn : Exports of the documents whose path contain one of these strings never return, like Office stuck on a dialog box,
+               until the instance is killed (see the timeout of OfficeApplicationPool).
+
+The opened attribute lists every document opened (in this process), with the arguments given to Open (EX. ReadOnly)
+and the settings of the application at that time (EX. DisplayAlerts), to check an OpenProfile."""
+    def __init__(self, startupDelay=0.0, saveDelay=0.0, failOn=(), crashOn=(), openDelay=0.0, secondsPerMegabyte=0.0, hangOn=()):
+        self.startupDelay = startupDelay
+        self.saveDelay = saveDelay
+        self.openDelay = openDelay
+        self.secondsPerMegabyte = secondsPerMegabyte
+        self.failOn = tuple(failOn)
+        self.crashOn = tuple(crashOn)
+        self.hangOn = tuple(hangOn)
+        self.dispatchCount = 0
+        self.quitCount = 0
+        self.killCount = 0
+        self.opened = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def dispatch(self, progName):
+        time.sleep(self.startupDelay)
+        with self._lock:
+            self.dispatchCount += 1
+        return _FakeApplication(self, progName)
+
+    def quit(self, application):
+        with self._lock:
+            self.quitCount += 1
+        application.Application.Quit()
+
+    def kill(self, application):
+        with self._lock:
+            self.killCount += 1
+        application.killed.set()
+
+
+class _FakeApplication:
+    """Fake Office application object.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, backend, progName):
+        self.backend = backend
+        self.progName = progName
+        self.Visible = True
+        self.ScreenUpdating = True
+        self.DisplayAlerts = {'Word': -1, 'PowerPoint': 2}.get(progName.split('.')[0], True)
+        self.EnableEvents = True
+        self.CalculateBeforeSave = True
+        self.Options = _FakeOptions()
+        self.closed = False
+        self.killed = threading.Event()
+        self.openDocuments = []
+        self._calculation = -4105
+        self.Documents = _FakeCollection(self)
+        self.Workbooks = self.Documents
+        self.Presentations = self.Documents
+
+    @property
+    def Application(self):
+        return self
+
+    @property
+    def Calculation(self):
+        return self._calculation
+
+    @Calculation.setter
+    def Calculation(self, value):
+        # Like Excel, the calculation mode cannot be changed without an open workbook.
+        if not self.openDocuments:
+            raise Exception('Unable to set the Calculation property of the Application class.')
+        self._calculation = value
+
+    def Quit(self):
+        self._check()
+        self.closed = True
+
+    def _check(self):
+        if self.killed.is_set():
+            raise Exception('The RPC server is unavailable.')
+
+
+class _FakeOpen:
+    """A document opened by a FakeBackend: its path, the arguments of Open and the settings of the application at that time.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, application, path, arguments):
+        self.progName = application.progName
+        self.path = path
+        self.arguments = dict(arguments)
+        self.settings = {'ScreenUpdating': application.ScreenUpdating, 'DisplayAlerts': application.DisplayAlerts,
+                         'EnableEvents': application.EnableEvents, 'Options.Pagination': application.Options.Pagination,
+                         'Options.UpdateLinksAtOpen': application.Options.UpdateLinksAtOpen}
+
+    def __repr__(self):
+        return '_FakeOpen(%r, %r, %r)' % (self.path, self.arguments, self.settings)
+
+
+class _FakeOptions:
+    """Fake Word Options.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self):
+        self.Pagination = True
+        self.UpdateLinksAtOpen = True
+
+
+class _FakeCollection:
+    """Fake Documents / Workbooks collection.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, application):
+        self.application = application
+
+    def __call__(self, index):
+        return self.application.openDocuments[index - 1]
+
+    def Open(self, path, *args, **kwargs):
+        self.application._check()
+        if self.application.closed:
+            raise Exception('The application has been closed.')
+        if not os.path.isfile(path):
+            raise Exception('The specified file path does not exist.')
+        documentClass = {'Word': _FakeWordDocument, 'PowerPoint': _FakePresentation}.get(self.application.progName.split('.')[0], _FakeDocument)
+        document = documentClass(self.application, path)
+        with self.application.backend._lock:
+            self.application.backend.opened.append(_FakeOpen(self.application, path, kwargs))
+        time.sleep(self.application.backend.openDelay + document.sizeDelay)
+        self.application.openDocuments.append(document)
+        return document
+
+
+class _FakeDocument:
+    """Fake Document / Workbook.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, application, path):
+        self.application = application
+        self.path = path
+        sheetNames = []
+        activeTab = 0
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                if 'xl/workbook.xml' in archive.namelist():
+                    workbook = archive.read('xl/workbook.xml').decode('utf-8')
+                    sheetNames = re.findall(r'<sheet [^>]*name="([^"]*)"', workbook)
+                    activeTab = int((re.findall(r'activeTab="([0-9]+)"', workbook) or [0])[0])
+        sheetNames = sheetNames or ['Sheet1']
+        self.Worksheets = [_FakeWorksheet(self, i + 1, name) for i, name in enumerate(sheetNames)]
+        self.ActiveSheet = self.Worksheets[min(activeTab, len(sheetNames) - 1)]
+        self.sizeDelay = os.path.getsize(path) / (1024 * 1024) * application.backend.secondsPerMegabyte
+
+    def _write(self, exportFilePath, enumNum, what, share=1.0):
+        backend = self.application.backend
+        if any(pattern in self.path for pattern in backend.crashOn):
+            os._exit(3)
+        if any(pattern in self.path for pattern in backend.failOn):
+            raise Exception('Simulated export failure of ' + self.path)
+        if any(pattern in self.path for pattern in backend.hangOn):
+            self.application.killed.wait()
+        self.application._check()
+        time.sleep(backend.saveDelay + self.sizeDelay * share)
+        if os.path.splitext(exportFilePath)[1].lower() == os.path.splitext(self.path)[1].lower():
+            shutil.copyfile(self.path, exportFilePath)
+            return
+        with open(exportFilePath, 'w') as f:
+            f.write('%s of %s with format %s\n' % (what, self.path, enumNum))
+
+    def SaveAs(self, exportFilePath, enumNum):
+        self._write(exportFilePath, enumNum, 'SaveAs')
+
+    def ExportAsFixedFormat(self, enumNum, exportFilePath, From=None, To=None, **options):
+        what = 'ExportAsFixedFormat'
+        # The hidden sheets are not exported.
+        visible = [worksheet.Name for worksheet in self.Worksheets if worksheet.Visible == -1]
+        if len(visible) < len(self.Worksheets):
+            what += ' of the sheets ' + ', '.join(visible)
+        if From is not None:
+            what += ' of the pages %d to %d' % (From, To)
+        self._write(exportFilePath, enumNum, what)
+
+    def Close(self, SaveChanges=False):
+        self.application._check()
+        self.application.openDocuments.remove(self)
+
+
+class _FakeWordDocument(_FakeDocument):
+    """Fake Word Document, whose ExportAsFixedFormat has the arguments of Word.\n\n*Do not use it, there is an underscore for a reason."""
+    def ExportAsFixedFormat(self, OutputFileName, ExportFormat, OpenAfterExport=False, OptimizeFor=0, Range=0, From=1, To=1, **options):
+        what = 'ExportAsFixedFormat'
+        # 3 : wdExportFromTo.
+        if Range == 3:
+            what += ' of the pages %d to %d' % (From, To)
+        self._write(OutputFileName, ExportFormat, what)
+
+
+class _FakePresentation(_FakeDocument):
+    """Fake Presentation, with one slide per ppt/slides/slideN.xml of the .pptx file.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, application, path):
+        super().__init__(application, path)
+        slideCount = 1
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                slideCount = max(1, sum(1 for name in archive.namelist() if re.match(r'ppt/slides/slide[0-9]+\.xml$', name)))
+        self.Slides = _FakeSlides([_FakeSlide(self, i + 1) for i in range(slideCount)])
+        self.PageSetup = _FakePageSetup()
+        self.PrintOptions = _FakePrintOptions()
+
+    def ExportAsFixedFormat(self, Path, FixedFormatType, PrintRange=None, RangeType=1, **options):
+        what = 'ExportAsFixedFormat'
+        # 4 : ppPrintSlideRange.
+        if RangeType == 4:
+            what += ' of the slides %d to %d' % PrintRange
+        self._write(Path, FixedFormatType, what)
+
+    def Close(self):
+        self.application._check()
+        self.application.openDocuments.remove(self)
+
+
+class _FakeSlides:
+    """Fake Slides collection.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, slides):
+        self.slides = slides
+        self.Count = len(slides)
+
+    def __call__(self, index):
+        return self.slides[index - 1]
+
+
+class _FakeSlide:
+    """Fake Slide.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, presentation, index):
+        self.presentation = presentation
+        self.SlideIndex = index
+
+    def Export(self, FileName, FilterName, ScaleWidth=0, ScaleHeight=0):
+        self.presentation._write(FileName, FilterName, 'Slide %d Export %dx%d' % (self.SlideIndex, ScaleWidth, ScaleHeight),
+                                 1.0 / self.presentation.Slides.Count)
+
+
+class _FakePageSetup:
+    """Fake PageSetup, of a 16:9 presentation (sizes in points).\n\n*Do not use it, there is an underscore for a reason."""
+    SlideWidth = 960.0
+    SlideHeight = 540.0
+
+
+class _FakePrintOptions:
+    """Fake PrintOptions, also standing for its Ranges collection.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self):
+        self.Ranges = self
+        self.ranges = []
+
+    def ClearAll(self):
+        self.ranges = []
+
+    def Add(self, Start, End):
+        self.ranges.append((Start, End))
+        return self.ranges[-1]
+
+
+class _FakeWorksheet:
+    """Fake Worksheet.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, workbook, index, name):
+        self.workbook = workbook
+        self.Index = index
+        self.Name = name
+        # -1 : xlSheetVisible.
+        self.Visible = -1
+
+    def SaveAs(self, exportFilePath, enumNum):
+        self.workbook._write(exportFilePath, enumNum, 'Sheet ' + str(self.Index) + ' SaveAs', 1.0 / len(self.workbook.Worksheets))
+
+    def ExportAsFixedFormat(self, enumNum, exportFilePath, From=None, To=None, **options):
+        what = 'Sheet %d ExportAsFixedFormat' % self.Index
+        if From is not None:
+            what += ' of the pages %d to %d' % (From, To)
+        self.workbook._write(exportFilePath, enumNum, what, 1.0 / len(self.workbook.Worksheets))
@@ -0,0 +1,168 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Atomic reservation of the folders and archives of the multi-files exports.
+
+import os
+import threading
+import zipfile
+import re
+import shutil
+import tempfile
+
+from .utils import _createStagingFolder, suppress
+
+
+_folderIndexes = {}
+_folderIndexesLock = threading.Lock()
+
+
+class _FolderReservation:
+    """The folder of a multi-files export (EX. HtmlFiles_file.html, or HtmlFiles_1_file.html if it exists), reserved by an
+exclusive mkdir and written in a hidden staging folder until publish().\n\n*Do not use it, there is an underscore for a reason."""
+    suffix = ''
+
+    def __init__(self, exportFolder, folderPrefix, exportFileName, overwrite):
+        self.overwrite = overwrite
+        self.folder = os.path.join(exportFolder, folderPrefix + exportFileName + self.suffix)
+        if not overwrite:
+            self.folder = self._reserve(exportFolder, folderPrefix, exportFileName)
+        self.staging = self._createStaging(exportFolder, folderPrefix + exportFileName)
+        self.published = False
+
+    def _createStaging(self, exportFolder, name):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        return tempfile.mkdtemp(prefix='.' + name + '.', suffix='.tmp', dir=exportFolder)
+
+    def _create(self, path):
+        """Internal magic function: create the reserved path, raise FileExistsError if it exists.\n\n*Do not use it, there is an underscore for a reason."""
+        os.mkdir(path)
+
+    def _reserve(self, exportFolder, folderPrefix, exportFileName):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        key = (exportFolder, folderPrefix, exportFileName + self.suffix)
+        with _folderIndexesLock:
+            index = _folderIndexes.get(key)
+        if index is None:
+            with suppress(FileExistsError):
+                self._create(self.folder)
+                return self.folder
+            pattern = re.compile(re.escape(folderPrefix) + r'(\d+)_' + re.escape(exportFileName + self.suffix) + '$')
+            with os.scandir(exportFolder) as entries:
+                index = max((int(match.group(1)) for match in map(pattern.match, (entry.name for entry in entries)) if match), default=0) + 1
+        while True:
+            folder = os.path.join(exportFolder, folderPrefix + str(index) + '_' + exportFileName + self.suffix)
+            try:
+                self._create(folder)
+            except FileExistsError:
+                # Taken by another process, or by the user.
+                index += 1
+                continue
+            with _folderIndexesLock:
+                if len(_folderIndexes) >= 10000:
+                    _folderIndexes.clear()
+                _folderIndexes[key] = max(index + 1, _folderIndexes.get(key, 0))
+            return folder
+
+    def path(self, stagedPath):
+        """Return the final path of a path of the staging folder."""
+        return os.path.join(self.folder, os.path.relpath(stagedPath, self.staging))
+
+    def publish(self):
+        """Move the export from the staging folder to the reserved folder."""
+        if self.published:
+            return
+        previous = None
+        if self.overwrite and os.path.lexists(self.folder):
+            previous = tempfile.mkdtemp(prefix='.' + os.path.basename(self.folder) + '.', suffix='.old', dir=os.path.dirname(self.folder))
+            os.replace(self.folder, os.path.join(previous, 'folder'))
+        try:
+            # Replace the empty reserved folder. Windows does not replace folders, so it is removed first there.
+            os.replace(self.staging, self.folder)
+        except OSError:
+            with suppress(FileNotFoundError):
+                os.rmdir(self.folder)
+            os.rename(self.staging, self.folder)
+        self.published = True
+        if previous is not None:
+            shutil.rmtree(previous, ignore_errors=True)
+
+    def discard(self):
+        """Remove the staging folder and free the reserved folder, if not published."""
+        if self.published:
+            return
+        shutil.rmtree(self.staging, ignore_errors=True)
+        if not self.overwrite:
+            with suppress(OSError):
+                os.rmdir(self.folder)
+
+
+archiveFormats = ('zip', 'tar')
+
+class _ArchiveReservation(_FolderReservation):
+    """The archive of a multi-files export (EX. CSV_Files_file.csv.zip), reserved like a _FolderReservation.
+    - archive : 'zip' or 'tar'.
+    - compressionLevel : 0 (stored) to 9. The default is 6 for zip and 0 for tar.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, exportFolder, folderPrefix, exportFileName, overwrite, archive, compressionLevel=None):
+        if compressionLevel is None:
+            compressionLevel = 6 if archive == 'zip' else 0
+        self.archive = archive
+        self.compressionLevel = compressionLevel
+        self.suffix = '.zip' if archive == 'zip' else ('.tar.gz' if compressionLevel else '.tar')
+        self.restored = False
+        super().__init__(exportFolder, folderPrefix, exportFileName, overwrite)
+        descriptor, self.archivePath = tempfile.mkstemp(prefix='.' + os.path.basename(self.folder) + '.', suffix='.tmp', dir=exportFolder)
+        os.close(descriptor)
+
+    def _createStaging(self, exportFolder, name):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        return _createStagingFolder()
+
+    def _create(self, path):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+
+    def path(self, stagedPath):
+        """Return the archive: the files of the staging folder are all in it."""
+        return self.folder
+
+    def restore(self, cache, key):
+        """Copy the archive from a ConversionCache. Return False if the key is not in the cache."""
+        self.restored = cache.restore(key, self.archivePath, None)
+        return self.restored
+
+    def _write(self):
+        """Internal magic function: write the files of the staging folder in the hidden archive.\n\n*Do not use it, there is an underscore for a reason."""
+        paths = sorted(os.path.join(root, name) for root, _, names in os.walk(self.staging) for name in names)
+        if self.archive == 'zip':
+            compression = zipfile.ZIP_DEFLATED if self.compressionLevel else zipfile.ZIP_STORED
+            with zipfile.ZipFile(self.archivePath, 'w', compression, compresslevel=self.compressionLevel or None) as archive:
+                for path in paths:
+                    archive.write(path, os.path.relpath(path, self.staging).replace(os.sep, '/'))
+        else:
+            import tarfile
+            options = {'compresslevel': self.compressionLevel} if self.compressionLevel else {}
+            with tarfile.open(self.archivePath, 'w:gz' if self.compressionLevel else 'w', **options) as archive:
+                for path in paths:
+                    archive.add(path, os.path.relpath(path, self.staging).replace(os.sep, '/'))
+
+    def publish(self):
+        """Write the archive (unless restored from a cache) and move it to the reserved path."""
+        if self.published:
+            return
+        if not self.restored:
+            self._write()
+        os.replace(self.archivePath, self.folder)
+        self.published = True
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+    def discard(self):
+        """Remove the staging folder and the hidden archive, and free the reserved archive, if not published."""
+        shutil.rmtree(self.staging, ignore_errors=True)
+        if self.published:
+            return
+        with suppress(OSError):
+            os.remove(self.archivePath)
+        if not self.overwrite:
+            with suppress(OSError):
+                os.remove(self.folder)
@@ -0,0 +1,175 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Per-phase timings of the exports, sent to pluggable metrics sinks.
+
+import os
+import threading
+import time
+import atexit
+import json
+import weakref
+
+from .utils import suppress
+
+
+class ExportMetrics:
+    """Measures of one export() call, given to every metrics sink (see addMetricsSink).
+    - event : 'export', or 'pool' for an Office start / quit done outside of an export.
+    - formats : dict of format name -> {'engine': ..., 'seconds': ..., 'outputBytes': ...}.
+    - phases : dict of phase name ('dispatch', 'open', 'export', 'close', 'quit', 'kill', 'native', 'cacheLookup', 'cacheStore') -> seconds.
+    - error : None, or the description of the exception raised by the export."""
+    def __init__(self, event, document=None, program=None, inputBytes=0):
+        self.event = event
+        self.document = document
+        self.program = program
+        self.inputBytes = inputBytes
+        self.formats = {}
+        self.phases = {}
+        self.seconds = 0.0
+        self.error = None
+        self.pid = os.getpid()
+        self.time = time.time()
+
+    def addPhase(self, phase, seconds):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def addFormat(self, result):
+        self.formats[result.format] = {'engine': result.engine, 'seconds': result.seconds,
+                                       'outputBytes': sum(os.path.getsize(path) for path in result.files if os.path.isfile(path))}
+
+    def asDict(self):
+        return {'event': self.event, 'document': self.document, 'program': self.program, 'inputBytes': self.inputBytes,
+                'formats': self.formats, 'phases': self.phases, 'seconds': self.seconds, 'error': self.error,
+                'pid': self.pid, 'time': self.time}
+
+    def __repr__(self):
+        return 'ExportMetrics(%r)' % self.asDict()
+
+
+_metricsSinks = []
+_metricsLocal = threading.local()
+
+def addMetricsSink(sink):
+    """Call sink(metrics) with an ExportMetrics after every export of this process. A sink can be any function,
+    a LogSink or a PrometheusTextfileSink. Without sink, nothing is measured."""
+    _metricsSinks.append(sink)
+
+def removeMetricsSink(sink):
+    """Stop calling a sink added with addMetricsSink."""
+    with suppress(ValueError):
+        _metricsSinks.remove(sink)
+
+def _emitMetrics(metrics):
+    """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+    for sink in list(_metricsSinks):
+        # A broken sink must never break the exports.
+        with suppress(Exception):
+            sink(metrics)
+
+def _recordPhase(phase, seconds):
+    """Internal magic function: add a phase to the export running in this thread.\n\n*Do not use it, there is an underscore for a reason."""
+    metrics = getattr(_metricsLocal, 'metrics', None)
+    if metrics is not None:
+        metrics.addPhase(phase, seconds)
+    elif _metricsSinks:
+        metrics = ExportMetrics('pool')
+        metrics.addPhase(phase, seconds)
+        metrics.seconds = seconds
+        _emitMetrics(metrics)
+
+
+class LogSink:
+    """Metrics sink writing each ExportMetrics as a JSON line to a logging logger (default: the 'MSOfficeFileConverter' logger).
+    - level : The logging level of the lines (default: logging.INFO)."""
+    def __init__(self, loggerName='MSOfficeFileConverter', level=None):
+        self.loggerName = loggerName
+        self.level = level
+
+    def __call__(self, metrics):
+        import logging
+        logging.getLogger(self.loggerName).log(logging.INFO if self.level is None else self.level, json.dumps(metrics.asDict()))
+
+
+# The PrometheusTextfileSink objects still used, written at exit by a single atexit function.
+_textfileSinks = weakref.WeakSet()
+_textfileSinksAtExit = False
+
+def _flushTextfileSinks():
+    """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+    for sink in list(_textfileSinks):
+        if sink._counters:
+            sink.flush()
+
+
+class PrometheusTextfileSink:
+    """Metrics sink keeping counters of the exports, written in the Prometheus text format (EX. for the textfile collector of node_exporter).
+    - path : The written file. '{pid}' is replaced by the process id, to give its own file to each batch worker.
+    - minInterval : Minimum seconds between two writes of the file. The file is also written by close(), and at exit if the sink is still used."""
+    def __init__(self, path, minInterval=5.0):
+        global _textfileSinksAtExit
+        self.path = path
+        self.minInterval = minInterval
+        self._counters = {}
+        self._lastWrite = 0.0
+        self._lock = threading.Lock()
+        _textfileSinks.add(self)
+        if not _textfileSinksAtExit:
+            _textfileSinksAtExit = True
+            atexit.register(_flushTextfileSinks)
+
+    def __getstate__(self):
+        return {'path': self.path, 'minInterval': self.minInterval}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['minInterval'])
+
+    def _add(self, name, labels, value):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        key = (name, tuple(sorted(labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def __call__(self, metrics):
+        with self._lock:
+            if metrics.event == 'export':
+                self._add('msofficefileconverter_jobs_total', {'program': metrics.program}, 1)
+                self._add('msofficefileconverter_job_seconds_total', {'program': metrics.program}, metrics.seconds)
+                self._add('msofficefileconverter_input_bytes_total', {'program': metrics.program}, metrics.inputBytes)
+                if metrics.error is not None:
+                    self._add('msofficefileconverter_job_errors_total', {'program': metrics.program}, 1)
+            for name, measure in metrics.formats.items():
+                labels = {'format': name, 'engine': measure['engine']}
+                self._add('msofficefileconverter_exports_total', labels, 1)
+                self._add('msofficefileconverter_export_seconds_total', labels, measure['seconds'])
+                self._add('msofficefileconverter_output_bytes_total', labels, measure['outputBytes'])
+            for phase, seconds in metrics.phases.items():
+                self._add('msofficefileconverter_phase_seconds_total', {'phase': phase}, seconds)
+                self._add('msofficefileconverter_phase_count_total', {'phase': phase}, 1)
+            if time.monotonic() - self._lastWrite < self.minInterval:
+                return
+        self.flush()
+
+    def close(self):
+        """Write the file, and stop writing it at exit."""
+        _textfileSinks.discard(self)
+        self.flush()
+
+    def flush(self):
+        """Write the file now."""
+        with self._lock:
+            self._lastWrite = time.monotonic()
+            lines = []
+            lastName = None
+            for (name, labels), value in sorted(self._counters.items()):
+                if name != lastName:
+                    lines.append('# TYPE %s counter' % name)
+                    lastName = name
+                labelText = ','.join('%s="%s"' % (label, str(labelValue).replace('\\', '\\\\').replace('"', '\\"')) for label, labelValue in labels)
+                lines.append('%s{%s} %s' % (name, labelText, repr(float(value))))
+            path = self.path.replace('{pid}', str(os.getpid()))
+            temporaryPath = path + '.tmp'
+            with suppress(OSError):
+                with open(temporaryPath, 'w') as f:
+                    f.write('\n'.join(lines) + '\n')
+                # Renamed so Prometheus never reads a half written file.
+                os.replace(temporaryPath, path)
@@ -0,0 +1,468 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Pool of reusable Office instances, with a watchdog for the hung ones and a quarantine of the failing documents.
+
+import itertools
+import functools
+from contextlib import contextmanager
+import os
+import threading
+import time
+import atexit
+import json
+import queue
+
+from .utils import suppress
+from .backends import getBackend
+from .metrics import _recordPhase
+from .cache import ConversionCache
+
+
+class ExportTimeout(Exception):
+    """Raised when an Office job took more than the timeout of its OfficeApplicationPool. The Office instance was killed."""
+    pass
+
+
+class _Watchdog:
+    """A thread calling functions when their deadline is passed, to stop the Office calls which never return.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self):
+        self._watched = {}
+        self._running = set()
+        self._tokens = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._pid = None
+
+    def watch(self, seconds, callback):
+        """Call callback() from the watchdog thread in seconds, unless unwatch() is called before. Return the token given to unwatch()."""
+        with self._condition:
+            token = next(self._tokens)
+            self._watched[token] = (time.monotonic() + seconds, callback)
+            # The thread does not survive a fork (EX. batch workers).
+            if self._thread is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='OfficeWatchdog', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return token
+
+    def unwatch(self, token):
+        """Cancel a callback. If it is already running, wait until it returns."""
+        with self._condition:
+            self._watched.pop(token, None)
+            while token in self._running:
+                self._condition.wait()
+
+    def _run(self):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                expired = [token for token, (deadline, _) in self._watched.items() if deadline <= now]
+                callbacks = [(token, self._watched.pop(token)[1]) for token in expired]
+                if not callbacks:
+                    nextDeadline = min((deadline for deadline, _ in self._watched.values()), default=None)
+                    self._condition.wait(None if nextDeadline is None else nextDeadline - now)
+                    continue
+                # unwatch() waits for these, so a job finishing during its callback never outlives it.
+                self._running.update(token for token, _ in callbacks)
+            for token, callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    import logging
+                    logging.getLogger('MSOfficeFileConverter').exception('The watchdog could not stop a job.')
+                finally:
+                    with self._condition:
+                        self._running.discard(token)
+                        self._condition.notify_all()
+
+_watchdog = _Watchdog()
+
+
+class Quarantine:
+    """Refuse the documents whose Office jobs failed too many times, so they stop wasting the workers.
+
+Usage:
+    pool = OfficeApplicationPool(timeout=120, retries=1, quarantine=Quarantine('Example\\Path\\To\\quarantine.json'))
+
+    - path : JSON file keeping the quarantined documents between runs, or None to keep them in memory only.
+    - maxFailures : Number of failed jobs (after their retries) after which a document is quarantined."""
+    def __init__(self, path=None, maxFailures=2):
+        self.path = path
+        self.maxFailures = maxFailures
+        self.entries = {}
+        self._lock = threading.Lock()
+        if path is not None and os.path.isfile(path):
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def contains(self, documentPath):
+        """Return True if the document is quarantined."""
+        if not self.entries:
+            return False
+        with self._lock:
+            entry = self.entries.get(ConversionCache.hashFile(documentPath))
+            return entry is not None and entry['failures'] >= self.maxFailures
+
+    def addFailure(self, documentPath, error):
+        """Count a failed job of the document. Return True if the document is now quarantined."""
+        key = ConversionCache.hashFile(documentPath)
+        with self._lock:
+            entry = self.entries.setdefault(key, {'failures': 0})
+            entry.update(path=os.path.abspath(documentPath), failures=entry['failures'] + 1, error=str(error), time=time.time())
+            self._save()
+            return entry['failures'] >= self.maxFailures
+
+    def release(self, documentPath):
+        """Forget the failures of the document, taking it out of the quarantine."""
+        if not self.entries:
+            return
+        with self._lock:
+            if self.entries.pop(ConversionCache.hashFile(documentPath), None) is not None:
+                self._save()
+
+    def quarantined(self):
+        """Return the entries ({'path', 'failures', 'error', 'time'}) of the quarantined documents."""
+        with self._lock:
+            return [dict(entry) for entry in self.entries.values() if entry['failures'] >= self.maxFailures]
+
+    def _save(self):
+        """Internal magic function, called with the lock held.\n\n*Do not use it, there is an underscore for a reason."""
+        if self.path is None:
+            return
+        temporaryPath = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(temporaryPath, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(temporaryPath, self.path)
+
+
+class OpenProfile:
+    """How Office opens the documents, and how the program is set while they are open (restored once they are closed).
+    - readOnly, updateLinks, addToRecentFiles : The options of Open.
+    - calculation : 'manual' (export the values saved in the file) or 'automatic' (let Excel recalculate the formulas).
+    - events, screenUpdating, displayAlerts, pagination : The Office settings while a document is open.
+None leaves the option as Office sets it, OpenProfile.officeDefaults() sets nothing."""
+    def __init__(self, readOnly=True, updateLinks=False, addToRecentFiles=False, calculation='manual', events=False,
+                 screenUpdating=False, displayAlerts=False, pagination=False):
+        if calculation not in ('manual', 'automatic', None):
+            raise Exception("The calculation must be 'manual', 'automatic' or None.")
+        self.readOnly = readOnly
+        self.updateLinks = updateLinks
+        self.addToRecentFiles = addToRecentFiles
+        self.calculation = calculation
+        self.events = events
+        self.screenUpdating = screenUpdating
+        self.displayAlerts = displayAlerts
+        self.pagination = pagination
+
+    @classmethod
+    def officeDefaults(cls):
+        """A profile changing nothing: the documents are opened like in Office."""
+        return cls(None, None, None, None, None, None, None, None)
+
+    def openArguments(self, program):
+        """The keyword arguments of Documents.Open / Workbooks.Open / Presentations.Open of a program ('Word', 'Excel' or 'PowerPoint')."""
+        arguments = {}
+        if self.readOnly is not None:
+            arguments['ReadOnly'] = self.readOnly
+        if program == 'Word' and self.addToRecentFiles is not None:
+            arguments['AddToRecentFiles'] = self.addToRecentFiles
+        elif program == 'Excel':
+            if self.addToRecentFiles is not None:
+                arguments['AddToMru'] = self.addToRecentFiles
+            if self.updateLinks is not None:
+                # 3 : update the external references, 0 : do not.
+                arguments['UpdateLinks'] = 3 if self.updateLinks else 0
+        return arguments
+
+    def applicationSettings(self, program):
+        """The (property, value) settings of the program set before opening a document. The properties of the
+        sub-objects are dotted (EX. 'Options.Pagination')."""
+        settings = []
+        if self.screenUpdating is not None and program != 'PowerPoint':
+            settings.append(('ScreenUpdating', self.screenUpdating))
+        if self.displayAlerts is not None:
+            # Word : wdAlertsAll (-1) / wdAlertsNone (0), PowerPoint : ppAlertsAll (2) / ppAlertsNone (1), Excel : a boolean.
+            settings.append(('DisplayAlerts', {'Word': (0, -1), 'PowerPoint': (1, 2)}.get(program, (False, True))[bool(self.displayAlerts)]))
+        if program == 'Word':
+            if self.pagination is not None:
+                settings.append(('Options.Pagination', self.pagination))
+            if self.updateLinks is not None:
+                settings.append(('Options.UpdateLinksAtOpen', self.updateLinks))
+        elif program == 'Excel' and self.events is not None:
+            settings.append(('EnableEvents', self.events))
+        return settings
+
+    def documentSettings(self, program):
+        """The (property, value) settings of the program set once a document is open (Excel refuses to change
+        the calculation mode without an open workbook)."""
+        if program != 'Excel' or self.calculation is None:
+            return []
+        # xlCalculationManual (-4135) / xlCalculationAutomatic (-4105). A manual workbook is not recalculated by SaveAs either.
+        if self.calculation == 'manual':
+            return [('Calculation', -4135), ('CalculateBeforeSave', False)]
+        return [('Calculation', -4105)]
+
+    def cacheOptions(self, program):
+        """The options changing the exported files, for the keys of a ConversionCache."""
+        options = {}
+        if program == 'Excel' and self.calculation != 'manual':
+            options['calculation'] = self.calculation
+        if self.updateLinks:
+            options['updateLinks'] = True
+        return options
+
+    def __repr__(self):
+        return 'OpenProfile(%s)' % ', '.join('%s=%r' % item for item in sorted(vars(self).items()))
+
+defaultOpenProfile = OpenProfile()
+
+
+def _applySettings(application, settings):
+    """Internal magic function: set (property, value) settings of an Office program, return the previous values.\n\n*Do not use it, there is an underscore for a reason."""
+    previous = []
+    for name, value in settings:
+        target = application
+        path = name.split('.')
+        for part in path[:-1]:
+            target = getattr(target, part)
+        oldValue = getattr(target, path[-1])
+        if oldValue != value:
+            setattr(target, path[-1], value)
+            previous.append((name, oldValue))
+    return previous
+
+def _restoreSettings(application, previous):
+    """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+    for name, value in reversed(previous):
+        # Excel refuses to set its calculation mode once the workbook is closed: the next workbook opened sets it anyway.
+        # A failure must not hide the exception of the export either.
+        with suppress(Exception):
+            _applySettings(application, [(name, value)])
+
+
+class _PooledApplication:
+    """An application instance owned by an OfficeApplicationPool.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, progName, application):
+        self.progName = progName
+        self.application = application
+        self.uses = 0
+        self.lastUsed = time.monotonic()
+        self.killed = False
+
+
+class _OfficeThread:
+    """A thread owning its own OfficeApplicationPool, to use more Office instances in parallel (COM objects belong to the thread that created them).\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, backend, maxUses, idleTimeout, timeout=None, openProfile=None):
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._work, args=(backend, maxUses, idleTimeout, timeout, openProfile), name='OfficeThread', daemon=True)
+        self._thread.start()
+
+    def _work(self, backend, maxUses, idleTimeout, timeout, openProfile):
+        backend.threadInit()
+        pool = OfficeApplicationPool(backend, 1, maxUses, idleTimeout, timeout, openProfile=openProfile)
+        try:
+            while True:
+                job = self._jobs.get()
+                if job is None:
+                    break
+                future, function = job
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(function(pool))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            pool.close()
+            backend.threadExit()
+
+    def submit(self, function):
+        """Run function(pool) in the thread. Return a concurrent.futures.Future."""
+        import concurrent.futures
+        future = concurrent.futures.Future()
+        self._jobs.put((future, function))
+        return future
+
+    def close(self):
+        self._jobs.put(None)
+        self._thread.join()
+
+
+class OfficeApplicationPool:
+    """Keep started Office applications alive between exports, so only the first export pays the Office cold start.
+
+Usage:
+    pool = OfficeApplicationPool(size=2, maxUses=50)
+    document = WordDocument('Example\\Path\\To\\file.docx', pool=pool)
+    document.toPdf()
+    ...
+    pool.close()
+
+    - backend : The OfficeBackend used to start the applications (default: getBackend()).
+    - size : Maximum number of live instances for each application type (Word, Excel...).
+    - maxUses : An instance is quit and replaced after this number of exports.
+    - idleTimeout : An idle instance is quit after this number of seconds without being used.
+    - timeout : Maximum seconds of an Office job. A busy instance is then killed and the job raises ExportTimeout.
+    - retries : Number of times a failed Office job is tried again, with a new instance.
+    - quarantine : A Quarantine refusing the documents failing again and again.
+    - openProfile : The OpenProfile used to open the documents (default: defaultOpenProfile).
+COM objects belong to the thread that created them: use one pool per thread."""
+    def __init__(self, backend=None, size=1, maxUses=50, idleTimeout=300, timeout=None, retries=0, quarantine=None, openProfile=None):
+        if size < 1:
+            raise Exception('The pool size must be at least 1.')
+        self.backend = backend if backend is not None else getBackend()
+        self.size = size
+        self.maxUses = maxUses
+        self.idleTimeout = idleTimeout
+        self.timeout = timeout
+        self.retries = retries
+        self.quarantine = quarantine
+        self.openProfile = openProfile if openProfile is not None else defaultOpenProfile
+        self._condition = threading.Condition()
+        self._idle = {}
+        self._liveCount = {}
+        self._helpers = []
+        self._closed = False
+
+    @contextmanager
+    def borrow(self, progName):
+        """Borrow an application instance for the duration of a with block.
+        - If the block raises an exception, the instance is considered broken: it is quit instead of being reused.
+        - If the block takes more than timeout seconds, the instance is killed and the block raises ExportTimeout."""
+        pooled = self._acquire(progName)
+        token = None
+        if self.timeout is not None:
+            token = _watchdog.watch(self.timeout, functools.partial(self._kill, pooled))
+        try:
+            yield pooled.application
+        except BaseException as e:
+            _watchdog.unwatch(token)
+            self._discard(pooled)
+            if pooled.killed:
+                raise ExportTimeout('The Office job took more than %ss, the %s instance was killed.' % (self.timeout, progName)) from e
+            raise
+        else:
+            _watchdog.unwatch(token)
+            if pooled.killed:
+                self._discard(pooled)
+            else:
+                self._release(pooled)
+
+    def _kill(self, pooled):
+        """Internal magic function, called by the watchdog thread.\n\n*Do not use it, there is an underscore for a reason."""
+        pooled.killed = True
+        import logging
+        logging.getLogger('MSOfficeFileConverter').warning('Killing a %s instance busy for more than %ss.', pooled.progName, self.timeout)
+        start = time.perf_counter()
+        self.backend.kill(pooled.application)
+        _recordPhase('kill', time.perf_counter() - start)
+
+    def _acquire(self, progName):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        self.evictIdle()
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise Exception('The pool is closed.')
+                idle = self._idle.setdefault(progName, [])
+                if idle:
+                    return idle.pop()
+                if self._liveCount.get(progName, 0) < self.size:
+                    self._liveCount[progName] = self._liveCount.get(progName, 0) + 1
+                    break
+                self._condition.wait()
+        try:
+            start = time.perf_counter()
+            application = self.backend.dispatch(progName)
+            _recordPhase('dispatch', time.perf_counter() - start)
+            return _PooledApplication(progName, application)
+        except BaseException:
+            with self._condition:
+                self._liveCount[progName] -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, pooled):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        pooled.uses += 1
+        if self.maxUses is not None and pooled.uses >= self.maxUses:
+            self._discard(pooled)
+            return
+        pooled.lastUsed = time.monotonic()
+        with self._condition:
+            if not self._closed:
+                self._idle.setdefault(pooled.progName, []).append(pooled)
+                self._condition.notify()
+                return
+        self._discard(pooled)
+
+    def _discard(self, pooled):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        with self._condition:
+            self._liveCount[pooled.progName] -= 1
+            self._condition.notify()
+        if pooled.killed:
+            return
+        with suppress(Exception):
+            start = time.perf_counter()
+            self.backend.quit(pooled.application)
+            _recordPhase('quit', time.perf_counter() - start)
+
+    def evictIdle(self):
+        """Quit every instance idle for more than idleTimeout seconds.
+        - Eviction is done by the thread using the pool (COM objects cannot be quit from another thread), so it is also done on each borrow()."""
+        if self.idleTimeout is None:
+            return
+        limit = time.monotonic() - self.idleTimeout
+        with self._condition:
+            expired = []
+            for idle in self._idle.values():
+                expired.extend(pooled for pooled in idle if pooled.lastUsed < limit)
+                idle[:] = [pooled for pooled in idle if pooled.lastUsed >= limit]
+        for pooled in expired:
+            self._discard(pooled)
+
+    def helperThreads(self, count):
+        """Return count threads each owning its own instances, to export in parallel (EX. the sheets of a workbook, see ExcelDocument).
+        - The threads are started on first use, kept for the next exports and stopped by close()."""
+        with self._condition:
+            while len(self._helpers) < count:
+                self._helpers.append(_OfficeThread(self.backend, self.maxUses, self.idleTimeout, self.timeout, self.openProfile))
+            return self._helpers[:count]
+
+    def close(self):
+        """Quit every idle instance. Borrowed instances are quit when given back, and borrow() raises from now on."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            idle = [pooled for instances in self._idle.values() for pooled in instances]
+            self._idle = {}
+            helpers = self._helpers
+            self._helpers = []
+        for pooled in idle:
+            self._discard(pooled)
+        for helper in helpers:
+            helper.close()
+
+
+_defaultPool = None
+
+def getDefaultPool():
+    """Return the pool used by documents created without a pool (created on first use, closed at exit)."""
+    global _defaultPool
+    if _defaultPool is None:
+        _defaultPool = OfficeApplicationPool()
+        atexit.register(_defaultPool.close)
+    return _defaultPool
@@ -0,0 +1,184 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# The Office security values written in the registry, once per process.
+
+import itertools
+import os
+import threading
+import json
+import tempfile
+
+from .utils import suppress
+
+
+allSupportedMSProgram = ['Excel', 'PowerPoint', 'Word']
+allSupportedMSProgramExe = ['excel.exe','powerpnt.exe','winword.exe']
+
+defaultRegKeysMarkerPath = os.path.join(tempfile.gettempdir(), 'MSOfficeFileConverter_RegKeys.json')
+
+appPathsKey = 'SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\App Paths'
+
+
+class Registry:
+    """Access to the registry values used by _createRegKeys. Hives are named 'HKLM' or 'HKCU'.
+    scans is the number of times the registry was really scanned and written (see prepareRegKeys)."""
+    def __init__(self):
+        self.scans = 0
+        self.prepared = False
+
+    def subkeys(self, hive, path):
+        """Return the names of the subkeys of a key."""
+        raise NotImplementedError()
+
+    def queryValue(self, hive, path, name):
+        """Return a value of a key, or None if the key or the value does not exist."""
+        raise NotImplementedError()
+
+    def setDword(self, hive, path, name, value):
+        """Set a DWORD value of an existing key."""
+        raise NotImplementedError()
+
+    def fileVersion(self, filePath):
+        """Return the (major, minor, build, revision) version of an executable, or (0, 0, 0, 0)."""
+        raise NotImplementedError()
+
+    def fileStamp(self, filePath):
+        """Return something changing when an executable is updated, or None if it does not exist."""
+        with suppress(OSError):
+            stat = os.stat(filePath)
+            return [stat.st_size, stat.st_mtime]
+        return None
+
+
+class WindowsRegistry(Registry):
+    """The real Windows registry."""
+    def _hive(self, hive):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        import winreg
+        return winreg.HKEY_LOCAL_MACHINE if hive == 'HKLM' else winreg.HKEY_CURRENT_USER
+
+    def subkeys(self, hive, path):
+        import winreg
+        names = []
+        with suppress(OSError), winreg.OpenKey(self._hive(hive), path, 0, winreg.KEY_READ) as k:
+            for i in itertools.count():
+                names.append(winreg.EnumKey(k, i))
+        return names
+
+    def queryValue(self, hive, path, name):
+        import winreg
+        with suppress(OSError), winreg.OpenKey(self._hive(hive), path, 0, winreg.KEY_READ) as k:
+            return winreg.QueryValueEx(k, name)[0]
+        return None
+
+    def setDword(self, hive, path, name, value):
+        import winreg
+        with winreg.OpenKey(self._hive(hive), path, 0, winreg.KEY_ALL_ACCESS) as k:
+            winreg.SetValueEx(k, name, 0, winreg.REG_DWORD, value)
+
+    def fileVersion(self, filePath):
+        try:
+            from win32api import GetFileVersionInfo, LOWORD, HIWORD
+            info = GetFileVersionInfo (filePath, "\\")
+            ms = info['FileVersionMS']
+            ls = info['FileVersionLS']
+            return HIWORD (ms), LOWORD (ms), HIWORD (ls), LOWORD (ls)
+        except:
+            return 0,0,0,0
+
+
+class MemoryRegistry(Registry):
+    """In-memory registry, to test the registry code on any platform. Paths are compared case insensitively.
+    - keys : dict of (hive, path) -> dict of value name -> value.
+    - fileVersions, fileStamps : dict of executable path -> version tuple, or -> stamp (see Registry.fileStamp)."""
+    def __init__(self, keys=None, fileVersions=None, fileStamps=None):
+        super().__init__()
+        self.keys = {(hive, path.lower()): dict(values) for (hive, path), values in (keys or {}).items()}
+        self._paths = [(hive, path) for hive, path in (keys or {})]
+        self.fileVersions = {path.lower(): version for path, version in (fileVersions or {}).items()}
+        self.fileStamps = {path.lower(): stamp for path, stamp in (fileStamps or {}).items()}
+
+    def subkeys(self, hive, path):
+        prefix = path.lower() + '\\'
+        names = set()
+        for keyHive, keyPath in self._paths:
+            if keyHive == hive and keyPath.lower().startswith(prefix):
+                names.add(keyPath[len(prefix):].split('\\')[0])
+        return sorted(names)
+
+    def queryValue(self, hive, path, name):
+        return self.keys.get((hive, path.lower()), {}).get(name)
+
+    def setDword(self, hive, path, name, value):
+        if (hive, path.lower()) not in self.keys:
+            raise OSError('Registry key not found: ' + path)
+        self.keys[(hive, path.lower())][name] = value
+
+    def fileVersion(self, filePath):
+        return self.fileVersions.get(filePath.lower(), (0, 0, 0, 0))
+
+    def fileStamp(self, filePath):
+        return self.fileStamps.get(filePath.lower())
+
+
+def _createRegKeys(registry):
+    """
+    Create DWORD values to registry allowing the module\nto create macros into Microsoft Office documents without Microsoft annoying prompts / block.\n\n*Do not use it, there is an underscore for a reason.
+    """
+    registry.scans += 1
+    for key in registry.subkeys('HKLM', appPathsKey):
+        if key.lower() in allSupportedMSProgramExe:
+            filePath = registry.queryValue('HKLM', appPathsKey + '\\' + key, 'Path')
+            version = registry.fileVersion(filePath + '\\' + key)
+            version = str(version[0]) + '.' + str(version[1])
+            writePath = "Software\\Microsoft\\Office\\" + version
+            officeProductName = allSupportedMSProgram[allSupportedMSProgramExe.index(key.lower())]
+            registry.setDword('HKCU', writePath + '\\' + officeProductName + '\\Security', "AccessVBOM", 1)
+            registry.setDword('HKCU', writePath + '\\' + officeProductName + '\\Security', "VBAWarnings", 1)
+
+
+def _officeFingerprint(registry):
+    """
+    Return a cheap description of the installed Office programs, changing when Office is installed or updated.\n\n*Do not use it, there is an underscore for a reason.
+    """
+    fingerprint = []
+    for exe in allSupportedMSProgramExe:
+        filePath = registry.queryValue('HKLM', appPathsKey + '\\' + exe, 'Path')
+        fingerprint.append([exe, filePath, registry.fileStamp(filePath + '\\' + exe) if filePath else None])
+    return fingerprint
+
+
+_regKeysLock = threading.Lock()
+_defaultRegistry = None
+
+def getDefaultRegistry():
+    """Return the WindowsRegistry shared by the ComBackend objects of the process."""
+    global _defaultRegistry
+    with _regKeysLock:
+        if _defaultRegistry is None:
+            _defaultRegistry = WindowsRegistry()
+        return _defaultRegistry
+
+def prepareRegKeys(registry, markerPath=defaultRegKeysMarkerPath):
+    """Run _createRegKeys once for a Registry object.
+    - markerPath : JSON file remembering the installed Office versions the values were written for, so other processes
+                   skip the scan until Office is installed or updated. None to not use a marker file."""
+    with _regKeysLock:
+        if registry.prepared:
+            return
+        fingerprint = _officeFingerprint(registry) if markerPath is not None else None
+        marker = None
+        if markerPath is not None:
+            with suppress(OSError, ValueError):
+                with open(markerPath) as f:
+                    marker = json.load(f)
+        if marker is None or marker != fingerprint:
+            _createRegKeys(registry)
+            if markerPath is not None:
+                with suppress(OSError):
+                    temporaryPath = '%s.%d.tmp' % (markerPath, os.getpid())
+                    with open(temporaryPath, 'w') as f:
+                        json.dump(fingerprint, f)
+                    os.replace(temporaryPath, markerPath)
+        registry.prepared = True
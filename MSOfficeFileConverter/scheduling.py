@@ -0,0 +1,219 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Prediction of the export times and ordering of the queued jobs.
+
+import itertools
+import heapq
+import os
+import threading
+import time
+import json
+import queue
+import collections
+
+from .documents import _documentProgram, _nativeFormatNames
+
+
+class LatencyModel:
+    """Predict the time of an export from the size of the document, learned from the past exports.
+
+Usage:
+    model = LatencyModel('Example\\Path\\To\\latencies.json')
+    seconds = model.estimate('Example\\Path\\To\\file.xlsx', ['pdf', 'csv'])
+    addMetricsSink(model)
+    ...
+    model.save()
+
+    - path : JSON file keeping the model between runs, or None to keep it in memory only.
+    - decay : Weight kept by the past exports at each new export of the same program and format."""
+    # (fixed seconds, seconds per MB) used before any export of a program and format.
+    defaultOpen = (1.0, 0.2)
+    defaultFormat = (0.2, 0.3)
+    # The formats exported without Office (EX. csv of a .xlsx) do not open Office and take milliseconds.
+    defaultNative = (0.005, 0.05)
+
+    def __init__(self, path=None, decay=0.99):
+        self.path = path
+        self.decay = decay
+        self.entries = {}
+        self._errors = collections.deque(maxlen=10000)
+        self._lock = threading.Lock()
+        if path is not None and os.path.isfile(path):
+            with open(path, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def predict(self, program, formatName, inputBytes, native=False):
+        """Return the predicted seconds of the export of a format ('open' for the opening) of a document of inputBytes bytes.
+        native is True if the format is exported without Office."""
+        megabytes = inputBytes / (1024 * 1024)
+        fixed, perMegabyte = self.defaultOpen if formatName == 'open' else self.defaultNative if native else self.defaultFormat
+        with self._lock:
+            entry = self.entries.get(program + '/' + formatName)
+        if entry is not None:
+            weight, sumX, sumY, sumXX, sumXY = entry
+            meanX, meanY = sumX / weight, sumY / weight
+            variance = sumXX / weight - meanX * meanX
+            if variance > 1e-9:
+                perMegabyte = max(0.0, (sumXY / weight - meanX * meanY) / variance)
+            # Too few sizes to fit a slope: the default slope around the mean of the exports.
+            fixed = meanY - perMegabyte * meanX
+        return max(0.0, fixed + perMegabyte * megabytes)
+
+    def estimate(self, documentPath, formats):
+        """Return the predicted seconds of the export of a document to a format name or a list of format names (opening included)."""
+        program = _documentProgram(documentPath)
+        try:
+            inputBytes = os.path.getsize(documentPath)
+        except OSError:
+            inputBytes = 0
+        formats = [formatName.lower() for formatName in ([formats] if isinstance(formats, str) else formats)]
+        nativeFormats = _nativeFormatNames(documentPath)
+        seconds = sum(self.predict(program, formatName, inputBytes, formatName in nativeFormats) for formatName in formats)
+        if any(formatName not in nativeFormats for formatName in formats):
+            seconds += self.predict(program, 'open', inputBytes)
+        return seconds
+
+    def learned(self, documentPath, formats):
+        """Return True if every export of estimate(documentPath, formats) is predicted from past exports, not from the defaults."""
+        program = _documentProgram(documentPath)
+        formats = [formatName.lower() for formatName in ([formats] if isinstance(formats, str) else formats)]
+        nativeFormats = _nativeFormatNames(documentPath)
+        keys = [program + '/' + formatName for formatName in formats]
+        if any(formatName not in nativeFormats for formatName in formats):
+            keys.append(program + '/open')
+        with self._lock:
+            return all(key in self.entries for key in keys)
+
+    def record(self, program, formatName, inputBytes, seconds):
+        """Learn the time of an export of a format ('open' for the opening)."""
+        megabytes = inputBytes / (1024 * 1024)
+        key = program + '/' + formatName
+        with self._lock:
+            entry = self.entries.get(key, [0.0, 0.0, 0.0, 0.0, 0.0])
+            entry = [value * self.decay for value in entry]
+            entry[0] += 1.0
+            entry[1] += megabytes
+            entry[2] += seconds
+            entry[3] += megabytes * megabytes
+            entry[4] += megabytes * seconds
+            self.entries[key] = entry
+
+    def recordResults(self, documentPath, results):
+        """Learn the times of the ExportResult of an export() call (a dict of format name -> ExportResult)."""
+        program = _documentProgram(documentPath)
+        inputBytes = os.path.getsize(documentPath)
+        openSeconds = [result.openSeconds for result in results.values() if result.engine == 'office']
+        if openSeconds:
+            self.record(program, 'open', inputBytes, max(openSeconds))
+        for formatName, result in results.items():
+            if result.engine in ('office', 'native'):
+                self.record(program, formatName, inputBytes, result.seconds)
+
+    def __call__(self, metrics):
+        """Metrics sink (see addMetricsSink): learn the times of every export of the process."""
+        if metrics.event != 'export' or metrics.error is not None:
+            return
+        program = metrics.program.split('.')[0]
+        if 'open' in metrics.phases:
+            self.record(program, 'open', metrics.inputBytes, metrics.phases['open'])
+        for formatName, measure in metrics.formats.items():
+            if measure['engine'] in ('office', 'native'):
+                self.record(program, formatName, metrics.inputBytes, measure['seconds'])
+
+    def observe(self, predicted, actual):
+        """Remember a prediction and the actual time of the job, for errorSummary(). Only observe the predictions of learned() jobs."""
+        with self._lock:
+            self._errors.append((predicted, actual))
+
+    def errorSummary(self):
+        """Return the count and the mean absolute error in seconds of the last 10000 observed predictions."""
+        with self._lock:
+            errors = list(self._errors)
+        return _predictionErrors(errors)
+
+    def save(self):
+        """Write the model file, if the model has a path."""
+        if self.path is None:
+            return
+        with self._lock:
+            temporaryPath = '%s.%d.tmp' % (self.path, os.getpid())
+            with open(temporaryPath, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            os.replace(temporaryPath, self.path)
+
+def _predictionErrors(errors):
+    """Internal magic function: summary of (predicted, actual) seconds.\n\n*Do not use it, there is an underscore for a reason."""
+    if not errors:
+        return {'count': 0, 'meanAbsoluteError': None}
+    return {'count': len(errors), 'meanAbsoluteError': sum(abs(predicted - actual) for predicted, actual in errors) / len(errors)}
+
+
+priorityClasses = ('interactive', 'normal', 'bulk')
+
+class JobScheduler:
+    """Thread-safe queue running the most urgent jobs first: by priority class, then the shortest predicted job first.
+
+Usage:
+    scheduler = JobScheduler()
+    scheduler.put(job, seconds=model.estimate(path, ['pdf']), priority='bulk')
+    job = scheduler.get()
+
+    - aging : Seconds of rank won by a job for every second it waits, so a long job is never starved.
+    - classSeconds : Rank between two priority classes ('interactive', 'normal', 'bulk'), in seconds."""
+    def __init__(self, aging=1.0, classSeconds=3600.0):
+        self.aging = aging
+        self.classSeconds = classSeconds
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @staticmethod
+    def priorityIndex(priority):
+        """Return the index of a priority class name or index."""
+        if priority in priorityClasses:
+            return priorityClasses.index(priority)
+        if isinstance(priority, int) and not isinstance(priority, bool) and 0 <= priority < len(priorityClasses):
+            return priority
+        raise Exception('Unknown priority: %r (use one of %s)' % (priority, ', '.join(priorityClasses)))
+
+    def put(self, item, seconds=0.0, priority='normal'):
+        """Queue an item, with its predicted seconds and its priority class."""
+        rank = self.priorityIndex(priority) * self.classSeconds + seconds + self.aging * time.monotonic()
+        with self._condition:
+            if self._closed:
+                raise Exception('The JobScheduler is closed.')
+            heapq.heappush(self._heap, (rank, next(self._counter), item))
+            self._condition.notify()
+
+    def get(self, block=True, timeout=None):
+        """Remove and return the most urgent item. Raise queue.Empty if there is none (without block or after timeout).
+        Once closed, return None when the queue is empty."""
+        with self._condition:
+            if block and not self._condition.wait_for(lambda: self._heap or self._closed, timeout):
+                raise queue.Empty
+            if self._heap:
+                return heapq.heappop(self._heap)[2]
+            if self._closed:
+                return None
+            raise queue.Empty
+
+    def close(self):
+        """Refuse the new items. get() returns None once the queued items are gone."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __len__(self):
+        with self._condition:
+            return len(self._heap)
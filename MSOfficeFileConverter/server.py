@@ -0,0 +1,279 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Resident conversion server with a local HTTP API.
+
+import os
+import threading
+import time
+import json
+import collections
+import shutil
+import tempfile
+
+from .utils import suppress
+from .documents import openDocument, _documentClass
+from .scheduling import priorityClasses
+from .converter import AsyncConverter
+
+
+class _RequestBody:
+    """The body of a request, read from the connection only when needed.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, reader, length):
+        self.reader = reader
+        self.remaining = length
+
+    async def blocks(self):
+        """Yield the body not read yet, one block at a time."""
+        import asyncio
+        while self.remaining:
+            block = await self.reader.read(min(self.remaining, 1024 * 1024))
+            if not block:
+                raise asyncio.IncompleteReadError(b'', self.remaining)
+            self.remaining -= len(block)
+            yield block
+
+    async def read(self):
+        """Return the body not read yet."""
+        return b''.join([block async for block in self.blocks()])
+
+    async def copyTo(self, f):
+        """Write the body not read yet to a binary file."""
+        async for block in self.blocks():
+            f.write(block)
+
+    async def discard(self):
+        """Skip the body not read yet, so the next request of the connection can be read."""
+        async for _ in self.blocks():
+            pass
+
+
+class ConversionServer:
+    """Resident conversion server keeping warm Office instances, with a small local HTTP API.
+
+Usage:
+    ConversionServer(port=8765, workers=2).serveForever()
+
+    - host, port : TCP address to listen on (port 0 picks a free port). unixSocket : Listen on a Unix socket instead.
+    - backend, workers, queueSize, maxUses, jobTimeout, openProfile, latencyModel : Passed to the AsyncConverter.
+    - roots : Folders the JSON requests may read their source from and export to. Without roots, only uploads are accepted.
+
+API:
+    POST /convert with a JSON body {"source", "format", "destination", "fileName", "timeout", "priority"}
+    POST /convert?format=pdf&name=file.docx with the document bytes as body (streamed to a temporary file, up to maxBodyBytes)
+    GET /stats
+    GET /health"""
+    maxBodyBytes = 256 * 1024 * 1024
+    maxJsonBytes = 1024 * 1024
+
+    def __init__(self, host='127.0.0.1', port=8765, unixSocket=None, backend=None, workers=2, queueSize=100, maxUses=50, cache=None, jobTimeout=None,
+                 openProfile=None, latencyModel=None, roots=()):
+        self.host = host
+        self.port = port
+        self.unixSocket = unixSocket
+        self.cache = cache
+        self.roots = [os.path.realpath(root) for root in roots]
+        self.converter = AsyncConverter(backend, workers, queueSize, maxUses, jobTimeout, openProfile, latencyModel)
+        self.requests = 0
+        self.errors = 0
+        self._latencies = collections.deque(maxlen=1000)
+        self._startTime = time.monotonic()
+        self._server = None
+        self._loop = None
+        self._thread = None
+        self._started = threading.Event()
+
+    async def serve(self):
+        """Serve until the task is cancelled or stop() is called."""
+        import asyncio
+        self._loop = asyncio.get_running_loop()
+        if self.unixSocket is not None:
+            self._server = await asyncio.start_unix_server(self._handle, self.unixSocket)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port)
+            self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            await self._loop.run_in_executor(None, self.converter.close)
+
+    def serveForever(self):
+        """Serve in the current thread until interrupted (Ctrl+C)."""
+        import asyncio
+        with suppress(KeyboardInterrupt):
+            asyncio.run(self.serve())
+
+    def start(self):
+        """Serve in a background thread. Return once the server accepts connections."""
+        import asyncio
+        self._thread = threading.Thread(target=lambda: asyncio.run(self.serve()), name='ConversionServer', daemon=True)
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self):
+        """Stop a server started with start() or serve(), once the running exports are done."""
+        if self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+        if self._thread is not None:
+            self._thread.join()
+
+    def stats(self):
+        """Return the queue depth, the number of requests and the export latencies (in seconds) of the last 1000 jobs."""
+        stats = self.converter.stats()
+        latencies = sorted(self._latencies)
+        stats.update({'requests': self.requests, 'errors': self.errors, 'uptime': time.monotonic() - self._startTime})
+        for name, percent in (('p50', 50), ('p95', 95), ('p99', 99)):
+            stats['latency' + name.upper()] = latencies[min(len(latencies) - 1, len(latencies) * percent // 100)] if latencies else None
+        stats['latencyMax'] = latencies[-1] if latencies else None
+        return stats
+
+    async def _handle(self, reader, writer):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        import asyncio
+        try:
+            while True:
+                requestLine = await reader.readline()
+                if not requestLine.strip():
+                    break
+                method, target, _ = requestLine.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                if length > self.maxBodyBytes:
+                    await self._respond(writer, 413, {'error': 'Request body too large.'})
+                    break
+                body = _RequestBody(reader, length)
+                self.requests += 1
+                status, payload, cleanup = await self._route(method, target, body)
+                try:
+                    await body.discard()
+                    if status >= 400:
+                        self.errors += 1
+                    await self._respond(writer, status, payload)
+                finally:
+                    if cleanup is not None:
+                        shutil.rmtree(cleanup, ignore_errors=True)
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _respond(self, writer, status, payload):
+        """Internal magic function: payload is a dict sent as JSON, or the path of a file streamed as is.\n\n*Do not use it, there is an underscore for a reason."""
+        reasons = {200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 413: 'Payload Too Large', 500: 'Internal Server Error', 504: 'Gateway Timeout'}
+        if isinstance(payload, dict):
+            data = json.dumps(payload).encode('utf-8')
+            contentType, length = 'application/json', len(data)
+        else:
+            contentType, length = 'application/octet-stream', os.path.getsize(payload)
+        writer.write(('HTTP/1.1 %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n\r\n' % (status, reasons[status], contentType, length)).encode('latin-1'))
+        if isinstance(payload, dict):
+            writer.write(data)
+        else:
+            with open(payload, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    writer.write(block)
+                    await writer.drain()
+        await writer.drain()
+
+    async def _route(self, method, target, body):
+        """Internal magic function: return (status, payload, folder to remove once answered).\n\n*Do not use it, there is an underscore for a reason."""
+        import asyncio
+        import urllib.parse
+        url = urllib.parse.urlsplit(target)
+        if method == 'GET' and url.path == '/health':
+            return 200, {'status': 'ok'}, None
+        if method == 'GET' and url.path == '/stats':
+            return 200, self.stats(), None
+        if method != 'POST' or url.path != '/convert':
+            return 404, {'error': 'Unknown request: %s %s' % (method, url.path)}, None
+
+        query = dict(urllib.parse.parse_qsl(url.query))
+        temporaryFolder = None
+        try:
+            if 'format' in query:
+                # The document is uploaded: convert it in a temporary folder and answer the exported file.
+                name = os.path.basename(query.get('name', 'document.docx'))
+                formatName = query['format'].lower()
+                documentClass = _documentClass(name)
+                if documentClass is None or formatName not in documentClass._formats:
+                    return 400, {'error': 'Unsupported document type or export format: %s to %s.' % (name, formatName)}, None
+                if documentClass._formats[formatName][2] is not None:
+                    return 400, {'error': 'Multi-files formats cannot be uploaded, use a JSON request with a destination.'}, None
+                timeout = float(query['timeout']) if 'timeout' in query else None
+                temporaryFolder = tempfile.mkdtemp(prefix='MSOfficeFileConverter_')
+                source = os.path.join(temporaryFolder, name)
+                with open(source, 'wb') as f:
+                    await body.copyTo(f)
+                results = await self._convert(source, [formatName], temporaryFolder, None, timeout, query.get('priority', 'normal'))
+                return 200, results[formatName].path, temporaryFolder
+
+            if body.remaining > self.maxJsonBytes:
+                return 413, {'error': 'Request body too large.'}, None
+            job = json.loads((await body.read()).decode('utf-8'))
+            formats = [job['format']] if isinstance(job['format'], str) else job['format']
+            fileName = job.get('fileName')
+            if fileName is not None and (os.path.basename(fileName) != fileName or fileName in ('', '.', '..')):
+                raise ValueError('the fileName must be a file name, not a path')
+            source = os.path.realpath(job['source'])
+            destination = None if job.get('destination') is None else os.path.realpath(job['destination'])
+            if not all(self._insideRoots(path) for path in (source, destination) if path is not None):
+                return 403, {'error': 'The source and the destination must be inside the roots of the server.'}, None
+            results = await self._convert(source, formats, destination, fileName, job.get('timeout'), job.get('priority', 'normal'))
+            return 200, {'results': {name: {'path': result.path, 'files': result.files, 'seconds': result.seconds, 'cached': result.cached}
+                                     for name, result in results.items()}}, None
+        except asyncio.TimeoutError:
+            status, payload = 504, {'error': 'The export timed out.'}
+        except asyncio.IncompleteReadError:
+            # The client went away: _handle closes the connection.
+            if temporaryFolder is not None:
+                shutil.rmtree(temporaryFolder, ignore_errors=True)
+            raise
+        except (ValueError, KeyError, TypeError) as e:
+            status, payload = 400, {'error': 'Invalid request: %s' % e}
+        except Exception as e:
+            status, payload = 500, {'error': '%s: %s' % (type(e).__name__, e)}
+        if temporaryFolder is not None:
+            shutil.rmtree(temporaryFolder, ignore_errors=True)
+        return status, payload, None
+
+    def _insideRoots(self, path):
+        """Internal magic function: True if a resolved path is one of the roots or inside one of them.\n\n*Do not use it, there is an underscore for a reason."""
+        for root in self.roots:
+            # ValueError: not on the same drive.
+            with suppress(ValueError):
+                if os.path.commonpath([root, path]) == root:
+                    return True
+        return False
+
+    async def _convert(self, source, formats, destination, fileName, timeout, priority):
+        """Internal magic function.\n\n*Do not use it, there is an underscore for a reason."""
+        if priority not in priorityClasses:
+            raise ValueError('the priority must be one of %s' % ', '.join(priorityClasses))
+        predicted = self.converter.latencyModel.estimate(source, formats)
+        learned = self.converter.latencyModel.learned(source, formats)
+        def run(pool):
+            if destination is not None:
+                os.makedirs(destination, exist_ok=True)
+            exportStart = time.perf_counter()
+            results = openDocument(source, pool=pool, cache=self.cache).export(formats, destination, fileName)
+            self.converter._learn(source, predicted if learned else None, time.perf_counter() - exportStart, results)
+            return results
+        start = time.perf_counter()
+        results = await self.converter.submit(run, timeout, predicted, priority)
+        self._latencies.append(time.perf_counter() - start)
+        return results
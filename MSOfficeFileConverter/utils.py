@@ -0,0 +1,27 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Helpers shared by the modules of the package.
+
+from contextlib import contextmanager
+import os
+import tempfile
+
+
+@contextmanager
+def suppress(*exceptions):
+    try:
+        yield
+    except exceptions:
+        pass
+
+
+class _NativeUnsupported(Exception):
+    """Raised by the native engines when a document cannot be exported exactly like Office: Office is used instead.\n\n*Do not use it, there is an underscore for a reason."""
+    pass
+
+
+def _createStagingFolder():
+    """Create a temporary folder for the files Office needs on disk, in memory (/dev/shm) when possible.\n\n*Do not use it, there is an underscore for a reason."""
+    root = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+    return tempfile.mkdtemp(prefix='MSOfficeFileConverter_', dir=root)
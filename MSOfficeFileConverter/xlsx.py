@@ -0,0 +1,778 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Native engines of the workbooks: streaming .xlsx reader, CSV and NumPy exports without Excel.
+
+import array
+import mmap
+import os
+import time
+import zipfile
+import collections
+import re
+import tempfile
+import io
+import csv
+import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from xml.etree import ElementTree
+
+from .utils import _NativeUnsupported, suppress
+
+
+class _InvalidDimension(Exception):
+    """Raised when a sheet contains cells outside of its <dimension>.\n\n*Do not use it, there is an underscore for a reason."""
+    pass
+
+
+_spreadsheetNamespace = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_officeRelationshipNamespace = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_packageRelationshipNamespace = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Built-in number formats displaying a date and / or a time.
+_builtinDateFormats = set(range(14, 23)) | {45, 46, 47}
+
+
+def _columnIndex(cellReference):
+    """Return the 1-based column index of a cell reference, EX. 'AB12' -> 28.\n\n*Do not use it, there is an underscore for a reason."""
+    index = 0
+    for character in cellReference:
+        if 'A' <= character <= 'Z':
+            index = index * 26 + ord(character) - 64
+        else:
+            break
+    return index
+
+
+def _columnLetters(index):
+    """Return the letters of a 1-based column index, EX. 28 -> 'AB'.\n\n*Do not use it, there is an underscore for a reason."""
+    letters = ''
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cellPosition(cellReference):
+    """Return the 1-based (row, column) of a cell reference, EX. 'AB12' -> (12, 28).\n\n*Do not use it, there is an underscore for a reason."""
+    column = _columnIndex(cellReference)
+    return int(cellReference.lstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ')), column
+
+
+def _isDateFormatCode(formatCode):
+    """Return True if a custom number format code display a date or a time.\n\n*Do not use it, there is an underscore for a reason."""
+    # Quoted texts, escaped characters and [...] sections (colors, locales) cannot contain date tokens.
+    code = re.sub(r'"[^"]*"|\\.|\[[^\]]*\]', '', formatCode.split(';')[0])
+    return any(token in code.lower() for token in 'ymdhs')
+
+
+def _scientificNumber(value, negative):
+    """Return (text, significant digits) of a number in the scientific notation of the Excel General format.\n\n*Do not use it, there is an underscore for a reason."""
+    scientificDigits = 5 - negative
+    mantissa, exponent = ('%.*E' % (scientificDigits, value)).split('E')
+    if len(exponent) > 3:
+        mantissa, exponent = ('%.*E' % (scientificDigits - 1, value)).split('E')
+    if '.' in mantissa:
+        mantissa = mantissa.rstrip('0').rstrip('.')
+    return mantissa + 'E' + exponent, len(mantissa.lstrip('-').replace('.', ''))
+
+
+def _generalNumber(value):
+    """Return a number as displayed by Excel with the General number format in a standard width cell (11 characters).\n\n*Do not use it, there is an underscore for a reason."""
+    if value == 0:
+        return '0'
+    negative = value < 0
+    absolute = abs(value)
+    if absolute >= 1e11:
+        return _scientificNumber(value, negative)[0]
+    if value.is_integer():
+        integer = str(int(value))
+        if len(integer) <= 11:
+            return integer
+
+    decimals = max(0, 10 - len(str(int(absolute))) - negative)
+    fraction = repr(absolute).partition('.')[2]
+    if 'e' in fraction or fraction[decimals:].rstrip('0') == '5':
+        # Excel rounds half away from zero, Python string formatting rounds half to even.
+        decimal = format(Decimal(repr(value)).quantize(Decimal(1).scaleb(-decimals), rounding=ROUND_HALF_UP), 'f')
+    else:
+        decimal = '%.*f' % (decimals, value)
+    if '.' in decimal:
+        decimal = decimal.rstrip('0').rstrip('.')
+    significantDecimal = len(decimal.lstrip('-0.').replace('.', ''))
+    if len(decimal) <= 11 and significantDecimal >= 6 - negative:
+        return decimal
+    scientific, significantScientific = _scientificNumber(value, negative)
+    if len(decimal) > 11 or significantDecimal == 0 or significantDecimal < significantScientific:
+        return scientific
+    return decimal
+
+
+# Size (in bytes) of the shared strings of a workbook kept in memory. Above it, they are read from a temporary file (see _SharedStrings).
+defaultSharedStringsMemory = 64 * 1024 * 1024
+
+
+class _SharedStrings:
+    """The shared strings of a workbook, packed in one UTF-8 buffer (moved to a temporary file over maxMemory bytes)
+and parsed only when needed.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, texts=(), maxMemory=None, cacheSize=4096):
+        self.maxMemory = defaultSharedStringsMemory if maxMemory is None else maxMemory
+        self.cacheSize = cacheSize
+        self._texts = iter(texts)
+        self._offsets = array.array('q', [0])
+        self._buffer = bytearray()
+        self._file = None
+        self._map = None
+        self._cache = collections.OrderedDict()
+
+    def _append(self, text):
+        data = text.encode('utf-8')
+        self._offsets.append(self._offsets[-1] + len(data))
+        if self._file is not None:
+            self._file.write(data)
+            return
+        self._buffer += data
+        if len(self._buffer) > self.maxMemory:
+            self._file = tempfile.TemporaryFile(prefix='MSOfficeFileConverter_')
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+
+    def _read(self, index=None):
+        """Take the texts until the one of index is available, or all of them if index is None."""
+        if self._texts is None:
+            return
+        count = len(self._offsets) - 1
+        # The strings are mostly used in order: take them by batches.
+        stop = None if index is None else index + 1024
+        for text in self._texts:
+            self._append(text)
+            count += 1
+            if count == stop:
+                break
+        else:
+            self._texts = None
+        if self._file is not None and (self._map is None or len(self._map) < self._offsets[-1]):
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def spilled(self):
+        """True if the strings are read from a temporary file."""
+        return self._file is not None
+
+    def __len__(self):
+        self._read()
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        cache = self._cache
+        text = cache.get(index)
+        if text is not None:
+            cache.move_to_end(index)
+            return text
+        if index >= len(self._offsets) - 1:
+            self._read(index)
+        if not 0 <= index < len(self._offsets) - 1:
+            raise IndexError('Shared string index out of range: %d' % index)
+        start, end = self._offsets[index], self._offsets[index + 1]
+        text = (self._map if self._map is not None else self._buffer)[start:end].decode('utf-8')
+        cache[index] = text
+        if len(cache) > self.cacheSize:
+            cache.popitem(last=False)
+        return text
+
+    def close(self):
+        self._cache.clear()
+        if hasattr(self._texts, 'close'):
+            self._texts.close()
+        self._texts = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _XlsxReader:
+    """Streaming reader of the cells of .xlsx / .xlsm files, yielded as (column, kind, value). kind is 's' (text), 'n' (General
+number), 'd' (date serial), 'f' (other number format), 'b' (boolean) or 'e' (error).\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, path, sharedStringsMemory=None):
+        self.sharedStringsMemory = defaultSharedStringsMemory if sharedStringsMemory is None else sharedStringsMemory
+        try:
+            self.archive = zipfile.ZipFile(path)
+        except (zipfile.BadZipFile, OSError):
+            raise _NativeUnsupported('Not an Office Open XML file: ' + path)
+        try:
+            self.sheets = self._readSheets()
+            self.styleKinds = self._readStyleKinds()
+        except (KeyError, ElementTree.ParseError) as e:
+            self.archive.close()
+            raise _NativeUnsupported('Cannot read the workbook: %s' % e)
+        self._sharedStrings = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.archive.close()
+        if self._sharedStrings is not None:
+            self._sharedStrings.close()
+
+    def _readSheets(self):
+        """Return the (name, archive path) of the worksheets, in the workbook order (chart sheets and macro sheets excluded)."""
+        relationships = {}
+        root = ElementTree.fromstring(self.archive.read('xl/_rels/workbook.xml.rels'))
+        for relationship in root.iter(_packageRelationshipNamespace + 'Relationship'):
+            target = relationship.get('Target')
+            target = target[1:] if target.startswith('/') else 'xl/' + target
+            relationships[relationship.get('Id')] = target
+
+        sheets = []
+        root = ElementTree.fromstring(self.archive.read('xl/workbook.xml'))
+        properties = root.find(_spreadsheetNamespace + 'workbookPr')
+        # The serial dates of the 1904 date system (old Mac workbooks) count the days since 1904-01-01.
+        self.date1904 = properties is not None and properties.get('date1904') in ('1', 'true')
+        # activeTab is the index of the active sheet among all the sheets, chart sheets included.
+        view = root.find(_spreadsheetNamespace + 'bookViews/' + _spreadsheetNamespace + 'workbookView')
+        activeTab = int(view.get('activeTab', 0)) if view is not None else 0
+        self.activeSheetName = None
+        for index, sheet in enumerate(root.iter(_spreadsheetNamespace + 'sheet')):
+            if index == activeTab:
+                self.activeSheetName = sheet.get('name')
+            target = relationships.get(sheet.get(_officeRelationshipNamespace + 'id'), '')
+            if target.startswith('xl/worksheets/'):
+                sheets.append((sheet.get('name'), target))
+        return sheets
+
+    def _readStyleKinds(self):
+        """Return the kind ('n', 'd' or 'f') of the numbers of each cell style."""
+        if 'xl/styles.xml' not in self.archive.namelist():
+            return []
+        root = ElementTree.fromstring(self.archive.read('xl/styles.xml'))
+        customFormats = {}
+        for numberFormat in root.iter(_spreadsheetNamespace + 'numFmt'):
+            customFormats[int(numberFormat.get('numFmtId'))] = numberFormat.get('formatCode', '')
+
+        kinds = []
+        cellFormats = root.find(_spreadsheetNamespace + 'cellXfs')
+        for cellFormat in (cellFormats if cellFormats is not None else []):
+            formatId = int(cellFormat.get('numFmtId', 0))
+            if formatId in customFormats:
+                code = customFormats[formatId]
+                if code.lower() in ('general', '@'):
+                    kinds.append('n')
+                else:
+                    kinds.append('d' if _isDateFormatCode(code) else 'f')
+            elif formatId in (0, 49):
+                kinds.append('n')
+            else:
+                kinds.append('d' if formatId in _builtinDateFormats else 'f')
+        return kinds
+
+    def _richText(self, element):
+        """Return the text of a <si> or <is> element, without the phonetic runs."""
+        text = element.find(_spreadsheetNamespace + 't')
+        if text is not None:
+            return text.text or ''
+        return ''.join(run.findtext(_spreadsheetNamespace + 't') or '' for run in element.iter(_spreadsheetNamespace + 'r'))
+
+    @property
+    def sharedStrings(self):
+        """The shared strings of the workbook, as a _SharedStrings reading xl/sharedStrings.xml as the strings are used."""
+        if self._sharedStrings is None:
+            self._sharedStrings = _SharedStrings(self._iterSharedStrings(), self.sharedStringsMemory)
+        return self._sharedStrings
+
+    def _iterSharedStrings(self):
+        """Yield the texts of xl/sharedStrings.xml, reading it in small chunks."""
+        if 'xl/sharedStrings.xml' not in self.archive.namelist():
+            return
+        with self.archive.open('xl/sharedStrings.xml') as f:
+            root = None
+            for event, element in ElementTree.iterparse(f, events=('start', 'end')):
+                if root is None:
+                    root = element
+                elif event == 'end' and element.tag == _spreadsheetNamespace + 'si':
+                    yield self._richText(element)
+                    root.clear()
+
+    def dimension(self, sheetIndex):
+        """Return the (firstRow, firstColumn, lastRow, lastColumn) declared by the <dimension> of a sheet, or None."""
+        with self.archive.open(self.sheets[sheetIndex][1]) as f:
+            for event, element in ElementTree.iterparse(f, events=('start',)):
+                if element.tag == _spreadsheetNamespace + 'dimension':
+                    reference = element.get('ref', '').split(':')
+                    first = _cellPosition(reference[0])
+                    last = _cellPosition(reference[-1])
+                    return first[0], first[1], last[0], last[1]
+                if element.tag == _spreadsheetNamespace + 'sheetData':
+                    return None
+        return None
+
+    def scanDimension(self, sheetIndex):
+        """Return the (firstRow, firstColumn, lastRow, lastColumn) of the cells of a sheet, by reading all of them."""
+        firstRow = firstColumn = None
+        lastRow = lastColumn = 0
+        for row, cells in self.iterRows(sheetIndex):
+            if not cells:
+                continue
+            firstRow = row if firstRow is None else firstRow
+            lastRow = row
+            firstColumn = min(cells[0][0], firstColumn or cells[0][0])
+            lastColumn = max(cells[-1][0], lastColumn)
+        if firstRow is None:
+            return 1, 1, 1, 1
+        return firstRow, firstColumn, lastRow, lastColumn
+
+    def readColumns(self, sheetIndex):
+        """Return the raw cells of a sheet, column by column (see _SheetColumnsTarget)."""
+        target = _SheetColumnsTarget(self)
+        parser = ElementTree.XMLParser(target=target)
+        with self.archive.open(self.sheets[sheetIndex][1]) as f:
+            while True:
+                chunk = f.read(65536)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+        parser.close()
+        return target.columns
+
+    def iterRows(self, sheetIndex, columns=None, firstRow=1):
+        """Yield the (row number, [(column, kind, value), ...]) of the rows of a sheet. Rows without cells may be skipped.
+        - columns : A set of column indexes, the other cells are skipped. firstRow : The rows before it are skipped."""
+        target = _SheetRowsTarget(self, columns, firstRow)
+        parser = ElementTree.XMLParser(target=target)
+        with self.archive.open(self.sheets[sheetIndex][1]) as f:
+            while True:
+                chunk = f.read(65536)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+                rows, target.rows = target.rows, []
+                for row in rows:
+                    yield row
+        parser.close()
+
+
+class _SheetRowsTarget:
+    """Parser target building the rows of a worksheet XML, without building any element tree.\n\n*Do not use it, there is an underscore for a reason."""
+    _rowTag = _spreadsheetNamespace + 'row'
+    _cellTag = _spreadsheetNamespace + 'c'
+    _valueTag = _spreadsheetNamespace + 'v'
+    _textTag = _spreadsheetNamespace + 't'
+    _phoneticTag = _spreadsheetNamespace + 'rPh'
+
+    def __init__(self, reader, columns=None, firstRow=1):
+        self.reader = reader
+        self.styleKinds = reader.styleKinds
+        self.columns = columns
+        self.firstRow = firstRow
+        self.rows = []
+        self.rowNumber = 0
+        self.cells = None
+        self.column = 0
+        self.text = None
+        self.value = None
+        self.inlineTexts = None
+        self.inPhonetic = False
+
+    def start(self, tag, attributes):
+        if tag == self._cellTag:
+            reference = attributes.get('r')
+            self.column = _columnIndex(reference) if reference else self.column + 1
+            self.cellType = attributes.get('t', 'n')
+            self.cellStyle = attributes.get('s')
+            self.value = None
+            self.inlineTexts = [] if self.cellType == 'inlineStr' else None
+        elif tag == self._valueTag:
+            self.text = []
+        elif tag == self._textTag:
+            if self.inlineTexts is not None and not self.inPhonetic:
+                self.text = []
+        elif tag == self._rowTag:
+            self.rowNumber = int(attributes.get('r', self.rowNumber + 1))
+            self.cells = []
+            self.column = 0
+        elif tag == self._phoneticTag:
+            self.inPhonetic = True
+
+    def data(self, data):
+        if self.text is not None:
+            self.text.append(data)
+
+    def end(self, tag):
+        if tag == self._valueTag:
+            self.value = ''.join(self.text)
+            self.text = None
+        elif tag == self._cellTag:
+            self._endCell()
+        elif tag == self._textTag:
+            if self.text is not None:
+                self.inlineTexts.append(''.join(self.text))
+                self.text = None
+        elif tag == self._rowTag:
+            self.rows.append((self.rowNumber, self.cells))
+        elif tag == self._phoneticTag:
+            self.inPhonetic = False
+
+    def _endCell(self):
+        cellType, value = self.cellType, self.value
+        if self.rowNumber < self.firstRow or (self.columns is not None and self.column not in self.columns):
+            self.inlineTexts = None
+            return
+        if cellType == 'inlineStr':
+            self.cells.append((self.column, 's', ''.join(self.inlineTexts)))
+            self.inlineTexts = None
+        elif value is None:
+            return
+        elif cellType == 'n':
+            style = int(self.cellStyle) if self.cellStyle else 0
+            self.cells.append((self.column, self.styleKinds[style] if style < len(self.styleKinds) else 'n', float(value)))
+        elif cellType == 's':
+            self.cells.append((self.column, 's', self.reader.sharedStrings[int(value)]))
+        elif cellType == 'str':
+            self.cells.append((self.column, 's', value))
+        elif cellType == 'b':
+            self.cells.append((self.column, 'b', value == '1'))
+        elif cellType == 'e':
+            self.cells.append((self.column, 'e', value))
+        else:
+            raise _NativeUnsupported('Unsupported cell type: ' + cellType)
+
+    def close(self):
+        pass
+
+
+class _SheetColumnsTarget(_SheetRowsTarget):
+    """Parser target keeping the raw cells of a worksheet column by column, for SheetArrays.\n\n*Do not use it, there is an underscore for a reason."""
+    def __init__(self, reader):
+        super().__init__(reader)
+        self.columns = {}
+
+    def end(self, tag):
+        # The rows are not kept.
+        if tag != self._rowTag:
+            super().end(tag)
+
+    def _endCell(self):
+        cellType, value = self.cellType, self.value
+        if cellType == 'inlineStr':
+            kind, value = 'i', ''.join(self.inlineTexts)
+            self.inlineTexts = None
+        elif value is None:
+            return
+        elif cellType == 'n':
+            style = int(self.cellStyle) if self.cellStyle else 0
+            kind = self.styleKinds[style] if style < len(self.styleKinds) else 'n'
+        elif cellType == 'str':
+            kind = 'i'
+        elif cellType in ('s', 'b', 'e'):
+            kind = cellType
+        else:
+            raise _NativeUnsupported('Unsupported cell type: ' + cellType)
+        column = self.columns.get(self.column)
+        if column is None:
+            column = self.columns[self.column] = ([], [], [])
+        column[0].append(self.rowNumber)
+        column[1].append(kind)
+        column[2].append(value)
+
+
+class SheetArrays:
+    """The cells of a worksheet as NumPy arrays, one array per column (see ExcelDocument.toArrays).
+    - columns : dict of column name -> array of rowCount values, in the order of the sheet.
+    - kinds : dict of column name -> 'int', 'float', 'datetime', 'bool' or 'text' ('text' arrays are indexes in strings, -1 if empty).
+      A boolean column with empty cells or errors is 'float' (1.0, 0.0 or NaN).
+    - strings : Object array of the texts of the text columns. Use text() to get a text column as texts.
+    - firstRow : The row number (1-based) of the first value of the arrays."""
+    def __init__(self, name, columns, kinds, strings, firstRow, rowCount):
+        self.name = name
+        self.columns = columns
+        self.kinds = kinds
+        self.strings = strings
+        self.firstRow = firstRow
+        self.rowCount = rowCount
+
+    def __repr__(self):
+        return 'SheetArrays(%r, %d rows, %r)' % (self.name, self.rowCount, self.kinds)
+
+    def text(self, columnName):
+        """Return a text column as an object array of str, with None for the empty cells."""
+        import numpy
+        indexes = self.columns[columnName]
+        texts = numpy.full(len(indexes), None, dtype=object)
+        present = indexes >= 0
+        texts[present] = self.strings[indexes[present]]
+        return texts
+
+    def toNpz(self, path):
+        """Write the arrays to a .npz file (see numpy.savez), read by SheetArrays.fromNpz. The texts are stored as UTF-8 bytes and offsets, without pickle."""
+        import numpy
+        encoded = [text.encode('utf-8') for text in self.strings]
+        offsets = numpy.zeros(len(encoded) + 1, dtype=numpy.int64)
+        numpy.cumsum([len(data) for data in encoded], out=offsets[1:])
+        arrays = {'column%d' % index: array for index, array in enumerate(self.columns.values())}
+        numpy.savez(path, name=numpy.array(self.name), names=numpy.array(list(self.columns), dtype=str), kinds=numpy.array(list(self.kinds.values()), dtype=str),
+                    firstRow=numpy.array(self.firstRow), rowCount=numpy.array(self.rowCount),
+                    stringsData=numpy.frombuffer(b''.join(encoded), dtype=numpy.uint8), stringsOffsets=offsets, **arrays)
+
+    @classmethod
+    def fromNpz(cls, path):
+        """Read a .npz file written by toNpz (EX. by ExcelDocument.toNpz)."""
+        import numpy
+        with numpy.load(path) as archive:
+            data = archive['stringsData'].tobytes()
+            offsets = archive['stringsOffsets'].tolist()
+            strings = numpy.empty(len(offsets) - 1, dtype=object)
+            strings[:] = [data[offsets[index]:offsets[index + 1]].decode('utf-8') for index in range(len(offsets) - 1)]
+            names = archive['names'].tolist()
+            columns = {name: archive['column%d' % index] for index, name in enumerate(names)}
+            return cls(str(archive['name']), columns, dict(zip(names, archive['kinds'].tolist())), strings,
+                       int(archive['firstRow']), int(archive['rowCount']))
+
+
+def _arrayText(kind, value):
+    """Return the text of a cell of a text column of SheetArrays, from its raw XML text.\n\n*Do not use it, there is an underscore for a reason."""
+    if kind == 'i' or kind == 'e':
+        return value
+    if kind == 'b':
+        return 'TRUE' if value == '1' else 'FALSE'
+    return _generalNumber(float(value))
+
+
+def _cellDateTime(serial, date1904):
+    """Return the datetime.datetime of an Excel serial date, rounded to the millisecond like Excel.\n\n*Do not use it, there is an underscore for a reason."""
+    if date1904:
+        return datetime.datetime(1904, 1, 1) + datetime.timedelta(milliseconds=round(serial * 86400000))
+    # Excel counts a 1900-02-29 which did not exist (serial 60): the serials before it are one day late.
+    if serial < 61:
+        serial += 1
+    return datetime.datetime(1899, 12, 30) + datetime.timedelta(milliseconds=round(serial * 86400000))
+
+
+def _rowValue(kind, value, date1904):
+    """Return the Python value of a cell yielded by _XlsxReader.iterRows, for ExcelDocument.iterRows.\n\n*Do not use it, there is an underscore for a reason."""
+    if kind == 'n' or kind == 'f':
+        return int(value) if value.is_integer() and abs(value) < 2 ** 53 else value
+    if kind == 'd':
+        return _cellDateTime(value, date1904)
+    return value
+
+
+def _sheetIndex(sheetNames, sheet):
+    """Return the 0-based index of a sheet number (1-based) or sheet name.\n\n*Do not use it, there is an underscore for a reason."""
+    if isinstance(sheet, str) and sheet in sheetNames:
+        return sheetNames.index(sheet)
+    if isinstance(sheet, int) and not isinstance(sheet, bool) and 1 <= sheet <= len(sheetNames):
+        return sheet - 1
+    raise Exception('The workbook has no sheet %r.' % (sheet,))
+
+
+def _sheetArrays(reader, sheetIndex, header):
+    """Read a sheet of an _XlsxReader into a SheetArrays, converting each column with NumPy at once.\n\n*Do not use it, there is an underscore for a reason."""
+    import numpy
+    rawColumns = sorted(reader.readColumns(sheetIndex).items())
+    name = reader.sheets[sheetIndex][0]
+    if not rawColumns:
+        return SheetArrays(name, {}, {}, numpy.empty(0, dtype=object), 1, 0)
+    firstRow = min(rows[0] for _, (rows, _, _) in rawColumns)
+    lastRow = max(rows[-1] for _, (rows, _, _) in rawColumns)
+    sharedStrings = reader.sharedStrings if any('s' in kinds for _, (_, kinds, _) in rawColumns) else []
+    sharedCount = len(sharedStrings)
+    extraTexts = {}
+
+    def textIndex(kind, value):
+        if kind == 's':
+            return int(value)
+        text = _arrayText(kind, value)
+        if text not in extraTexts:
+            extraTexts[text] = sharedCount + len(extraTexts)
+        return extraTexts[text]
+
+    names = {}
+    if header:
+        for column, (rows, kinds, values) in rawColumns:
+            if rows[0] == firstRow:
+                names[column] = sharedStrings[int(values[0])] if kinds[0] == 's' else _arrayText(kinds[0], values[0])
+                del rows[0], kinds[0], values[0]
+        firstRow += 1
+    rowCount = max(0, lastRow - firstRow + 1)
+    # Serial of 1970-01-01 in the 1904 and 1900 date systems.
+    epoch = 24107 if reader.date1904 else 25569
+
+    columns = {}
+    kindNames = {}
+    for column, (rows, kinds, values) in rawColumns:
+        columnName = names.get(column) or _columnLetters(column)
+        if columnName in columns:
+            columnName = '%s_%s' % (columnName, _columnLetters(column))
+        positions = numpy.array(rows, dtype=numpy.int64) - firstRow
+        kindArray = numpy.array(kinds, dtype='U1')
+        present = set(kinds)
+        full = len(rows) == rowCount and 'e' not in present
+        valid = kindArray != 'e'
+        if present and present <= {'n', 'f', 'e'} and present != {'e'}:
+            array = numpy.full(rowCount, numpy.nan)
+            array[positions[valid]] = numpy.array(values)[valid].astype(numpy.float64)
+            kind = 'float'
+            if full and numpy.all(numpy.abs(array) < 2 ** 53) and numpy.all(numpy.floor(array) == array):
+                array, kind = array.astype(numpy.int64), 'int'
+        elif present <= {'d', 'e'} and 'd' in present:
+            serials = numpy.array(values)[valid].astype(numpy.float64)
+            if not reader.date1904:
+                # Excel counts a 1900-02-29 which did not exist (serial 60): the serials before it are one day late.
+                serials = numpy.where(serials < 61, serials + 1, serials)
+            array = numpy.full(rowCount, numpy.datetime64('NaT'), dtype='datetime64[ms]')
+            array[positions[valid]] = numpy.rint((serials - epoch) * 86400000).astype(numpy.int64).astype('datetime64[ms]')
+            kind = 'datetime'
+        elif present <= {'b', 'e'} and 'b' in present:
+            truths = numpy.array(values)[valid] == '1'
+            if full:
+                array, kind = numpy.zeros(rowCount, dtype=bool), 'bool'
+            else:
+                # NaN for the empty cells and the errors, like the numbers.
+                array, kind = numpy.full(rowCount, numpy.nan), 'float'
+            array[positions[valid]] = truths
+        else:
+            array = numpy.full(rowCount, -1, dtype=numpy.int32)
+            if present == {'s'}:
+                array[positions] = numpy.array(values).astype(numpy.int32)
+            else:
+                array[positions] = [textIndex(cellKind, value) for cellKind, value in zip(kinds, values)]
+            kind = 'text'
+        columns[columnName] = array
+        kindNames[columnName] = kind
+
+    # Only the texts used by this sheet are kept, the indexes are renumbered.
+    textColumns = [array for columnName, array in columns.items() if kindNames[columnName] == 'text']
+    used = numpy.unique(numpy.concatenate([array[array >= 0] for array in textColumns])) if textColumns else numpy.empty(0, dtype=numpy.int32)
+    extraList = list(extraTexts)
+    strings = numpy.empty(len(used), dtype=object)
+    strings[:] = [sharedStrings[index] if index < sharedCount else extraList[index - sharedCount] for index in used.tolist()]
+    for array in textColumns:
+        present = array >= 0
+        array[present] = numpy.searchsorted(used, array[present])
+    return SheetArrays(name, columns, kindNames, strings, firstRow, rowCount)
+
+
+def _exportNativeNpz(documentPath, exportFolder, sharedStringsMemory=None, sheetNumbers=None):
+    """Export the worksheets (or the sheetNumbers) of a .xlsx / .xlsm file to exportFolder\\1.npz, 2.npz...
+    Return a dict of sheet number -> seconds.\n\n*Do not use it, there is an underscore for a reason."""
+    sheetSeconds = {}
+    with _XlsxReader(documentPath, sharedStringsMemory) as reader:
+        for sheetIndex in (range(len(reader.sheets)) if sheetNumbers is None else [number - 1 for number in sheetNumbers]):
+            start = time.perf_counter()
+            _sheetArrays(reader, sheetIndex, True).toNpz(os.path.join(exportFolder, '%d.npz' % (sheetIndex + 1)))
+            sheetSeconds[sheetIndex + 1] = time.perf_counter() - start
+    return sheetSeconds
+
+
+# Encoding and line terminator of each Excel CSV SaveAs enum. Excel uses the ANSI code page of Windows for
+# xlCSV / xlCSVWindows: the Western European one is used here.
+_nativeCsvEncodings = {
+    6: ('cp1252', '\r\n'),
+    62: ('utf-8-sig', '\r\n'),
+    23: ('cp1252', '\r\n'),
+    24: ('cp437', '\r\n'),
+    22: ('mac_roman', '\r'),
+}
+
+
+def _csvText(kind, value):
+    """Return the text written in a CSV file for a cell.\n\n*Do not use it, there is an underscore for a reason."""
+    if kind == 's' or kind == 'e':
+        return value
+    if kind == 'n':
+        return _generalNumber(value)
+    if kind == 'b':
+        return 'TRUE' if value else 'FALSE'
+    # Dates and formatted numbers are displayed according to the Windows regional settings.
+    raise _NativeUnsupported('Formatted numbers are exported by Excel.')
+
+
+def _writeSheetCsv(reader, sheetIndex, stream, lineTerminator, dimension):
+    """Write the used range of a sheet to a text stream, the same way Excel SaveAs CSV does.\n\n*Do not use it, there is an underscore for a reason."""
+    firstRow, firstColumn, lastRow, lastColumn = dimension
+    width = lastColumn - firstColumn + 1
+    emptyRow = ',' * (width - 1) + lineTerminator
+    writer = csv.writer(stream, lineterminator=lineTerminator)
+    nextRow = firstRow
+    for rowNumber, cells in reader.iterRows(sheetIndex):
+        if not cells:
+            continue
+        if rowNumber < firstRow or rowNumber > lastRow or cells[0][0] < firstColumn or cells[-1][0] > lastColumn:
+            raise _InvalidDimension()
+        stream.write(emptyRow * (rowNumber - nextRow))
+        values = [''] * width
+        for column, kind, value in cells:
+            values[column - firstColumn] = _csvText(kind, value)
+        if any(values):
+            writer.writerow(values)
+        else:
+            stream.write(emptyRow)
+        nextRow = rowNumber + 1
+    stream.write(emptyRow * (lastRow - nextRow + 1))
+
+
+def _exportNativeCsvSheets(documentPath, sheetNumbers, exportFolder, extension, enumNum, sharedStringsMemory=None):
+    """Export some worksheets of a .xlsx / .xlsm file to exportFolder\\<sheet number>.csv without Excel. Return a dict of sheet number -> seconds.\n\n*Do not use it, there is an underscore for a reason."""
+    encoding, lineTerminator = _nativeCsvEncodings[enumNum]
+    sheetSeconds = {}
+    with _XlsxReader(documentPath, sharedStringsMemory) as reader:
+        for sheetNumber in sheetNumbers:
+            start = time.perf_counter()
+            sheetIndex = sheetNumber - 1
+            path = os.path.join(exportFolder, str(sheetNumber) + extension)
+            dimension = reader.dimension(sheetIndex)
+            for attempt in range(2):
+                try:
+                    with io.open(path, 'w', encoding=encoding, errors='replace', newline='') as stream:
+                        _writeSheetCsv(reader, sheetIndex, stream, lineTerminator, dimension or reader.scanDimension(sheetIndex))
+                    break
+                except _InvalidDimension:
+                    # The <dimension> is optional and written by hand by some tools: compute the real one.
+                    dimension = reader.scanDimension(sheetIndex)
+            sheetSeconds[sheetNumber] = time.perf_counter() - start
+    return sheetSeconds
+
+
+def _partition(items, count):
+    """Split items in count lists of about the same size (round robin).\n\n*Do not use it, there is an underscore for a reason."""
+    items = list(items)
+    return [items[i::count] for i in range(max(1, min(count, len(items))))]
+
+
+def _exportNativeCsv(documentPath, exportFolder, extension, enumNum, workers=1, sharedStringsMemory=None, sheetNumbers=None):
+    """Export the worksheets (or the sheetNumbers) of a .xlsx / .xlsm file to exportFolder\\1.csv, 2.csv... without Excel,
+    with workers processes. Return a dict of sheet number -> seconds, or raise _NativeUnsupported.\n\n*Do not use it, there is an underscore for a reason."""
+    if sheetNumbers is None:
+        with _XlsxReader(documentPath) as reader:
+            sheetNumbers = range(1, len(reader.sheets) + 1)
+    # The native engine is CPU bound: more processes than CPUs only add overhead.
+    workers = min(workers, os.cpu_count() or 1)
+    import concurrent.futures
+    import multiprocessing
+    # Daemon processes (EX. the batch workers) cannot start processes.
+    if multiprocessing.current_process().daemon:
+        workers = 1
+    parts = _partition(sheetNumbers, workers)
+    try:
+        if len(parts) < 2:
+            return _exportNativeCsvSheets(documentPath, sheetNumbers, exportFolder, extension, enumNum, sharedStringsMemory)
+        sheetSeconds = {}
+        with concurrent.futures.ProcessPoolExecutor(len(parts)) as executor:
+            futures = [executor.submit(_exportNativeCsvSheets, documentPath, part, exportFolder, extension, enumNum, sharedStringsMemory) for part in parts]
+            for future in futures:
+                sheetSeconds.update(future.result())
+        return dict(sorted(sheetSeconds.items()))
+    except BaseException:
+        for sheetNumber in sheetNumbers:
+            with suppress(OSError):
+                os.remove(os.path.join(exportFolder, str(sheetNumber) + extension))
+        raise
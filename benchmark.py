@@ -0,0 +1,369 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+# Benchmark every to* export method of WordDocument and ExcelDocument on generated documents of various sizes.
+# On Windows, Office is used through COM. Anywhere else (or with --fake), the FakeBackend of MSOfficeFileConverter/fakeoffice.py is used: its delays
+# (see --startup-delay, --open-delay, --save-delay and --seconds-per-mb) only simulate Office, so the Office
+# numbers are only useful to find regressions in this module, not to predict real Office times.
+# The formats having a native engine are measured twice: with the native engine and with Office.
+# With numpy installed, ExcelDocument.toArrays is also compared with exporting to CSV and parsing the CSV into NumPy.
+# The import time of MSOfficeFileConverter is measured in fresh Python processes ('import/MSOfficeFileConverter/python'),
+# with the list of the optional heavy modules it imported (they should only be imported by the features using them).
+#
+# Usage:
+#   python benchmark.py [--fake] [--quick] [--repeat 3] [--methods toPdf,toCsv]
+#   python benchmark.py --fake --save-baseline baseline.json
+#   python benchmark.py --fake --baseline baseline.json --tolerance 0.2
+
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+try:
+    import resource
+except ImportError:
+    # Windows.
+    resource = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from MSOfficeFileConverter import WordDocument, ExcelDocument, OfficeApplicationPool, ComBackend
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+_wordNamespaces = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+_excelNamespace = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+
+
+def generateDocx(path, paragraphs):
+    """Write a .docx file of about paragraphs / 50 pages, with some tables."""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                         '<Default Extension="xml" ContentType="application/xml"/>'
+                         '<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                         '</Types>')
+        archive.writestr('_rels/.rels', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+                         '</Relationships>')
+        archive.writestr('word/_rels/document.xml.rels', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"/>')
+        with archive.open('word/document.xml', 'w') as f:
+            f.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?><w:document %s><w:body>' % _wordNamespaces).encode('utf-8'))
+            for i in range(paragraphs):
+                if i % 100 == 99:
+                    cells = ''.join('<w:tc><w:p><w:r><w:t>Cell %d.%d</w:t></w:r></w:p></w:tc>' % (i, column) for column in range(4))
+                    f.write(('<w:tbl><w:tr>%s</w:tr><w:tr>%s</w:tr></w:tbl>' % (cells, cells)).encode('utf-8'))
+                text = escape('Paragraph %d of the benchmark document, with some <text> to export. ' % i) * 3
+                f.write(('<w:p><w:r><w:t xml:space="preserve">%s</w:t></w:r><w:r><w:rPr><w:b/></w:rPr><w:t>Bold.</w:t></w:r></w:p>' % text).encode('utf-8'))
+            f.write(b'</w:body></w:document>')
+
+
+def _columnName(index):
+    """Return the letters of a 0 based column index (0 -> A, 26 -> AA)."""
+    name = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+def generateXlsx(path, sheets, rows, columns):
+    """Write a .xlsx file of sheets sheets of rows x columns cells, alternating numbers and shared strings."""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                         '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                         '<Default Extension="xml" ContentType="application/xml"/>'
+                         '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+                         '</Types>')
+        archive.writestr('_rels/.rels', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                         '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+                         '</Relationships>')
+        workbook = ''.join('<sheet name="Sheet%d" sheetId="%d" r:id="rId%d"/>' % (i, i, i) for i in range(1, sheets + 1))
+        archive.writestr('xl/workbook.xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<workbook xmlns="%s" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>%s</sheets></workbook>' % (_excelNamespace, workbook))
+        relationships = ''.join('<Relationship Id="rId%d" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet%d.xml"/>' % (i, i)
+                                for i in range(1, sheets + 1))
+        archive.writestr('xl/_rels/workbook.xml.rels', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">%s</Relationships>' % relationships)
+        archive.writestr('xl/styles.xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                         '<styleSheet xmlns="%s"><cellXfs count="1"><xf numFmtId="0"/></cellXfs></styleSheet>' % _excelNamespace)
+        archive.writestr('xl/sharedStrings.xml', '<?xml version="1.0" encoding="UTF-8" standalone="yes"?><sst xmlns="%s">%s</sst>'
+                         % (_excelNamespace, ''.join('<si><t>Text %d, "quoted"</t></si>' % i for i in range(100))))
+        for sheet in range(1, sheets + 1):
+            with archive.open('xl/worksheets/sheet%d.xml' % sheet, 'w') as f:
+                f.write(('<?xml version="1.0" encoding="UTF-8" standalone="yes"?><worksheet xmlns="%s"><dimension ref="A1:%s%d"/><sheetData>'
+                         % (_excelNamespace, _columnName(columns - 1), rows)).encode('utf-8'))
+                for row in range(1, rows + 1):
+                    cells = []
+                    for column in range(columns):
+                        reference = '%s%d' % (_columnName(column), row)
+                        if column % 2:
+                            cells.append('<c r="%s" t="s"><v>%d</v></c>' % (reference, (row + column) % 100))
+                        else:
+                            cells.append('<c r="%s"><v>%s</v></c>' % (reference, row * 1.25 + column))
+                    f.write(('<row r="%d">%s</row>' % (row, ''.join(cells))).encode('utf-8'))
+                f.write(b'</sheetData></worksheet>')
+
+
+def buildCorpus(folder, quick):
+    """Generate the benchmark documents in folder. Return a list of (name, path, document class)."""
+    here = os.path.abspath(os.path.dirname(__file__))
+    corpus = [('SampleWord', os.path.join(here, 'SampleWord.docx'), WordDocument),
+              ('SampleExcel', os.path.join(here, 'SampleExcel.xlsx'), ExcelDocument)]
+    generated = [('Word500Pages', 'Large.docx', WordDocument, lambda path: generateDocx(path, 2500 if quick else 25000)),
+                 ('Excel200Sheets', 'ManySheets.xlsx', ExcelDocument, lambda path: generateXlsx(path, 20 if quick else 200, 50, 8)),
+                 ('Excel100kRows', 'LargeSheet.xlsx', ExcelDocument, lambda path: generateXlsx(path, 1, 10000 if quick else 100000, 10))]
+    for name, fileName, documentClass, generate in generated:
+        path = os.path.join(folder, fileName)
+        generate(path)
+        corpus.append((name, path, documentClass))
+    return corpus
+
+
+# to* methods which do not take an export folder.
+_notExportMethods = {'to', 'toBytes', 'toStream', 'toArrays'}
+
+def exportMethods(documentClass):
+    """Return the names of the to* export methods of a document class."""
+    methods = [name for name in dir(documentClass) if name.startswith('to') and name not in _notExportMethods and callable(getattr(documentClass, name))]
+    if numpy is None and 'toNpz' in methods:
+        methods.remove('toNpz')
+    return sorted(methods)
+
+
+def methodFormat(methodName):
+    """Return the format name exported by a to* method (EX. 'csv_utf8' for toCsv_UTF8)."""
+    return methodName[2:].lower()
+
+
+def percentile(values, percent):
+    """Return the percent percentile of values (nearest rank)."""
+    values = sorted(values)
+    return values[max(0, math.ceil(percent / 100.0 * len(values)) - 1)]
+
+
+def peakRssMb():
+    """Return the peak resident memory of this process in MB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in KB on Linux.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def runBenchmark(corpus, pool, repeat, methods=None):
+    """Run every export method of every document of the corpus repeat times.
+    Return a dict of 'document/method/engine' -> {'p50', 'p99', 'mean', 'filesPerSecond', 'runs'}."""
+    results = {}
+    exportFolder = tempfile.mkdtemp()
+    try:
+        # Start the Office programs before measuring, the pool keeps them started.
+        for documentClass in set(documentClass for _, _, documentClass in corpus):
+            path = next(path for _, path, corpusClass in corpus if corpusClass is documentClass)
+            documentClass(path, pool=pool, native=False).toPdf(exportFolder)
+        for name, path, documentClass in corpus:
+            for methodName in exportMethods(documentClass):
+                if methods and methodName not in methods:
+                    continue
+                engines = [('office', False)]
+                if methodFormat(methodName) in documentClass._nativeFormats:
+                    engines.insert(0, ('native', True))
+                for engine, native in engines:
+                    latencies = []
+                    files = 0
+                    for _ in range(repeat):
+                        document = documentClass(path, pool=pool, native=native)
+                        start = time.perf_counter()
+                        result = getattr(document, methodName)(exportFolder)
+                        latencies.append(time.perf_counter() - start)
+                        files += len(result.files)
+                        # Removed so every run exports in the same conditions (the multi-files folders are never overwritten).
+                        shutil.rmtree(exportFolder, ignore_errors=True)
+                        os.makedirs(exportFolder)
+                    key = '%s/%s/%s' % (name, methodName, engine)
+                    results[key] = {'p50': percentile(latencies, 50), 'p99': percentile(latencies, 99), 'mean': sum(latencies) / len(latencies),
+                                    'files': files, 'filesPerSecond': files / sum(latencies), 'runs': repeat}
+                    print('%-45s p50 %8.4fs  p99 %8.4fs  %9.1f files/s' % (key, results[key]['p50'], results[key]['p99'], results[key]['filesPerSecond']))
+    finally:
+        shutil.rmtree(exportFolder, ignore_errors=True)
+    return results
+
+
+# Modules only needed by some features of MSOfficeFileConverter: importing it should not import them.
+_heavyModules = ('asyncio', 'concurrent.futures', 'multiprocessing', 'logging', 'argparse', 'numpy', 'win32com', 'pythoncom')
+
+_importScript = '''import sys, time
+start = time.perf_counter()
+import MSOfficeFileConverter
+seconds = time.perf_counter() - start
+print(seconds, ','.join(name for name in %r if name in sys.modules))
+''' % (_heavyModules,)
+
+
+def runImportBenchmark(repeat):
+    """Time 'import MSOfficeFileConverter' in fresh Python processes, after a first run compiling the bytecode."""
+    print('\nImport time (fresh processes)')
+    environment = dict(os.environ)
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    moduleFolder = os.path.dirname(os.path.dirname(os.path.abspath(sys.modules['MSOfficeFileConverter'].__file__)))
+    environment['PYTHONPATH'] = os.pathsep.join(filter(None, [moduleFolder, environment.get('PYTHONPATH')]))
+    latencies = []
+    for i in range(max(10, repeat * 5) + 1):
+        output = subprocess.run([sys.executable, '-c', _importScript], env=environment, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+        if i > 0:
+            latencies.append(float(output[0]))
+    heavy = output[1].split(',') if len(output) > 1 else []
+    key = 'import/MSOfficeFileConverter/python'
+    results = {key: {'p50': percentile(latencies, 50), 'p99': percentile(latencies, 99), 'mean': sum(latencies) / len(latencies),
+                     'files': 0, 'heavyModules': heavy}}
+    print('%-45s p50 %8.4fs  p99 %8.4fs  heavy modules: %s' % (key, results[key]['p50'], results[key]['p99'], ', '.join(heavy) or 'none'))
+    return results
+
+
+def readCsvArrays(folder):
+    """Parse the CSV files of a folder into NumPy columns the usual way: csv module, then one array per column,
+    of numbers if the column can be converted, of texts otherwise."""
+    sheets = {}
+    for path in sorted(glob.glob(os.path.join(folder, '*.csv'))):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            rows = list(csv.reader(f))
+        columns = {}
+        for index, values in enumerate(zip(*rows[1:])):
+            try:
+                columns[index] = numpy.array([float(value) if value else numpy.nan for value in values])
+            except ValueError:
+                columns[index] = numpy.array(values, dtype=object)
+        sheets[path] = columns
+    return sheets
+
+
+def runArraysBenchmark(corpus, pool, repeat):
+    """Compare ExcelDocument.toArrays with toCsv_UTF8 followed by readCsvArrays, on the native .xlsx of the corpus.
+    Return a dict of 'document/method/engine' -> measures, like runBenchmark."""
+    results = {}
+    exportFolder = tempfile.mkdtemp()
+    try:
+        for name, path, documentClass in corpus:
+            if documentClass is not ExcelDocument:
+                continue
+            measures = {}
+            for methodName in ('toArrays', 'csvRoundTrip'):
+                latencies = []
+                for _ in range(repeat):
+                    document = ExcelDocument(path, pool=pool)
+                    start = time.perf_counter()
+                    if methodName == 'toArrays':
+                        document.toArrays()
+                    else:
+                        readCsvArrays(document.toCsv_UTF8(exportFolder).path)
+                    latencies.append(time.perf_counter() - start)
+                    shutil.rmtree(exportFolder, ignore_errors=True)
+                    os.makedirs(exportFolder)
+                key = '%s/%s/native' % (name, methodName)
+                results[key] = measures[methodName] = {'p50': percentile(latencies, 50), 'p99': percentile(latencies, 99), 'mean': sum(latencies) / len(latencies),
+                                                       'files': 0, 'filesPerSecond': 0.0, 'runs': repeat}
+                print('%-45s p50 %8.4fs  p99 %8.4fs' % (key, results[key]['p50'], results[key]['p99']))
+            print('%-45s %.1fx faster than the CSV round trip' % (name + '/toArrays', measures['csvRoundTrip']['p50'] / measures['toArrays']['p50']))
+    finally:
+        shutil.rmtree(exportFolder, ignore_errors=True)
+    return results
+
+
+def compareBaseline(report, baseline, tolerance, minDifference):
+    """Print the comparison of a report with a baseline report. Return the list of regressed keys.
+    A measure regressed if its p50 is more than tolerance times slower and at least minDifference seconds slower (very short exports are noisy)."""
+    regressions = []
+    print('\n%-45s %10s %10s %8s' % ('Compared to the baseline', 'p50 (s)', 'base (s)', 'ratio'))
+    for key, measure in sorted(report['results'].items()):
+        base = baseline['results'].get(key)
+        if base is None:
+            continue
+        ratio = measure['p50'] / base['p50'] if base['p50'] > 0 else 1.0
+        flag = ''
+        if ratio > 1 + tolerance and measure['p50'] - base['p50'] >= minDifference:
+            regressions.append(key)
+            flag = '  REGRESSION'
+        print('%-45s %10.4f %10.4f %7.2fx%s' % (key, measure['p50'], base['p50'], ratio, flag))
+    print('Files/s: %.1f (baseline %.1f)' % (report['filesPerSecond'], baseline['filesPerSecond']))
+    if report['peakRssMb'] is not None and baseline.get('peakRssMb') is not None:
+        print('Peak RSS: %.1f MB (baseline %.1f MB)' % (report['peakRssMb'], baseline['peakRssMb']))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every export method of WordDocument and ExcelDocument.')
+    parser.add_argument('--fake', action='store_true', help='Use the FakeBackend even on Windows.')
+    parser.add_argument('--quick', action='store_true', help='Generate smaller documents.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--methods', help='Comma separated to* methods to run (default: all of them).')
+    parser.add_argument('--startup-delay', type=float, default=0.5, help='FakeBackend: seconds to start Office.')
+    parser.add_argument('--open-delay', type=float, default=0.05, help='FakeBackend: seconds to open a document.')
+    parser.add_argument('--save-delay', type=float, default=0.02, help='FakeBackend: seconds for each save.')
+    parser.add_argument('--seconds-per-mb', type=float, default=0.05, help='FakeBackend: seconds added to each open and save per MB of document.')
+    parser.add_argument('--save-baseline', help='Write the results to this JSON file.')
+    parser.add_argument('--baseline', help='Compare the results with this JSON file written by --save-baseline.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='p50 slowdown ratio over the baseline reported as a regression (default: 0.2, so 20%%).')
+    parser.add_argument('--min-difference', type=float, default=0.01, help='Minimum p50 slowdown in seconds reported as a regression (default: 0.01).')
+    args = parser.parse_args()
+
+    fake = args.fake or sys.platform != 'win32'
+    if fake:
+        backend = FakeBackend(startupDelay=args.startup_delay, saveDelay=args.save_delay, openDelay=args.open_delay, secondsPerMegabyte=args.seconds_per_mb)
+        print('Using the FakeBackend: the Office times are simulated.')
+    else:
+        backend = ComBackend()
+
+    workFolder = tempfile.mkdtemp()
+    pool = OfficeApplicationPool(backend, maxUses=None)
+    try:
+        corpus = buildCorpus(workFolder, args.quick)
+        start = time.perf_counter()
+        methods = args.methods.split(',') if args.methods else None
+        results = runBenchmark(corpus, pool, args.repeat, methods)
+        if numpy is not None and (methods is None or 'toArrays' in methods):
+            results.update(runArraysBenchmark(corpus, pool, args.repeat))
+        seconds = time.perf_counter() - start
+        if methods is None:
+            results.update(runImportBenchmark(args.repeat))
+    finally:
+        pool.close()
+        shutil.rmtree(workFolder, ignore_errors=True)
+
+    files = sum(measure['files'] for measure in results.values())
+    report = {'backend': 'fake' if fake else 'com', 'quick': args.quick, 'results': results,
+              'filesPerSecond': files / seconds if seconds > 0 else 0.0, 'peakRssMb': peakRssMb()}
+    print('\n%d measures in %.1fs, %.1f files/s, peak RSS %s MB' % (len(results), seconds, report['filesPerSecond'],
+                                                                   '%.1f' % report['peakRssMb'] if report['peakRssMb'] is not None else 'unknown'))
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compareBaseline(report, json.load(f), args.tolerance, args.min_difference)
+        if regressions:
+            print('%d regressions.' % len(regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
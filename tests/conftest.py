@@ -0,0 +1,76 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import shutil
+import zipfile
+from xml.sax.saxutils import escape
+
+import pytest
+
+from MSOfficeFileConverter import OfficeApplicationPool
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+rootFolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def copySample(folder, name, newName=None):
+    """Copy a sample document of the repository to folder, and return its path."""
+    os.makedirs(str(folder), exist_ok=True)
+    path = os.path.join(str(folder), newName or name)
+    shutil.copyfile(os.path.join(rootFolder, name), path)
+    return path
+
+
+def buildWorkbook(path, sheets, sharedStrings=None, cellFormats=(0,), numberFormats=None):
+    """Write a minimal .xlsx file, and return its path.
+    - sheets : list of (name, XML of the rows of <sheetData>, dimension reference or None).
+    - sharedStrings : The texts of xl/sharedStrings.xml, None to write none.
+    - cellFormats : The numFmtId of each cell style (the s attribute of the cells). numberFormats : dict of custom numFmtId -> format code."""
+    namespace = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+    relationshipNamespace = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    packageNamespace = 'xmlns="http://schemas.openxmlformats.org/package/2006/relationships"'
+    with zipfile.ZipFile(str(path), 'w') as archive:
+        archive.writestr('[Content_Types].xml', '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>')
+        archive.writestr('xl/workbook.xml', '<workbook %s %s><sheets>%s</sheets></workbook>' % (namespace, relationshipNamespace, ''.join(
+            '<sheet name="%s" sheetId="%d" r:id="rId%d"/>' % (escape(name), index, index) for index, (name, _, _) in enumerate(sheets, 1))))
+        archive.writestr('xl/_rels/workbook.xml.rels', '<Relationships %s>%s</Relationships>' % (packageNamespace, ''.join(
+            '<Relationship Id="rId%d" Target="worksheets/sheet%d.xml"/>' % (index, index) for index in range(1, len(sheets) + 1))))
+        for index, (_, rows, dimension) in enumerate(sheets, 1):
+            archive.writestr('xl/worksheets/sheet%d.xml' % index, '<worksheet %s>%s<sheetData>%s</sheetData></worksheet>' % (
+                namespace, '<dimension ref="%s"/>' % dimension if dimension else '', rows))
+        if sharedStrings is not None:
+            archive.writestr('xl/sharedStrings.xml', '<sst %s>%s</sst>' % (namespace, ''.join('<si><t>%s</t></si>' % escape(text) for text in sharedStrings)))
+        archive.writestr('xl/styles.xml', '<styleSheet %s><numFmts>%s</numFmts><cellXfs>%s</cellXfs></styleSheet>' % (namespace, ''.join(
+            '<numFmt numFmtId="%d" formatCode="%s"/>' % (formatId, escape(code, {'"': '&quot;'})) for formatId, code in (numberFormats or {}).items()),
+            ''.join('<xf numFmtId="%d"/>' % formatId for formatId in cellFormats)))
+    return str(path)
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+@pytest.fixture
+def pool(backend):
+    pool = OfficeApplicationPool(backend)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def sampleWord(tmp_path):
+    return copySample(tmp_path / 'source', 'SampleWord.docx')
+
+
+@pytest.fixture
+def sampleExcel(tmp_path):
+    return copySample(tmp_path / 'source', 'SampleExcel.xlsx')
+
+
+@pytest.fixture
+def exportFolder(tmp_path):
+    folder = tmp_path / 'export'
+    folder.mkdir()
+    return str(folder)
@@ -0,0 +1,67 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+import MSOfficeFileConverter.folders
+from MSOfficeFileConverter import ExcelDocument, OfficeApplicationPool, WordDocument
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+@pytest.fixture
+def stagingFolders(monkeypatch):
+    folders = []
+    createStagingFolder = MSOfficeFileConverter.folders._createStagingFolder
+    monkeypatch.setattr(MSOfficeFileConverter.folders, '_createStagingFolder', lambda: folders.append(createStagingFolder()) or folders[-1])
+    return folders
+
+
+def csvFiles(sampleExcel, pool, folder):
+    os.makedirs(folder)
+    result = ExcelDocument(sampleExcel, pool=pool).toCsv(folder)
+    return {name: open(os.path.join(result.folder, name), 'rb').read() for name in os.listdir(result.folder)}
+
+
+@pytest.mark.parametrize('compressionLevel, compressType', [(None, zipfile.ZIP_DEFLATED), (0, zipfile.ZIP_STORED)])
+def test_zipEntries(tmp_path, sampleExcel, pool, exportFolder, stagingFolders, compressionLevel, compressType):
+    result = ExcelDocument(sampleExcel, pool=pool, archive='zip', compressionLevel=compressionLevel).toCsv(exportFolder)
+    assert result.path == os.path.join(exportFolder, 'CSV_Files_SampleExcel.csv.zip')
+    assert os.listdir(exportFolder) == ['CSV_Files_SampleExcel.csv.zip']
+    with zipfile.ZipFile(result.path) as archive:
+        assert sorted(archive.namelist()) == ['1.csv', '2.csv', '3.csv']
+        assert {info.compress_type for info in archive.infolist()} == {compressType}
+        assert {name: archive.read(name) for name in archive.namelist()} == csvFiles(sampleExcel, pool, str(tmp_path / 'folder'))
+    assert stagingFolders and not any(os.path.exists(folder) for folder in stagingFolders)
+
+
+@pytest.mark.parametrize('compressionLevel, suffix, mode', [(None, '.tar', 'r:'), (9, '.tar.gz', 'r:gz')])
+def test_tarEntries(tmp_path, sampleExcel, pool, exportFolder, stagingFolders, compressionLevel, suffix, mode):
+    result = ExcelDocument(sampleExcel, pool=pool, archive='tar', compressionLevel=compressionLevel).toCsv(exportFolder)
+    assert os.listdir(exportFolder) == ['CSV_Files_SampleExcel.csv' + suffix]
+    with tarfile.open(result.path, mode) as archive:
+        assert sorted(archive.getnames()) == ['1.csv', '2.csv', '3.csv']
+        assert {name: archive.extractfile(name).read() for name in archive.getnames()} == csvFiles(sampleExcel, pool, str(tmp_path / 'folder'))
+    assert not any(os.path.exists(folder) for folder in stagingFolders)
+
+
+def test_officeExportToAnArchive(sampleWord, pool, exportFolder, stagingFolders):
+    result = WordDocument(sampleWord, pool=pool, archive='zip').toHtml(exportFolder)
+    assert os.listdir(exportFolder) == [os.path.basename(result.path)]
+    with zipfile.ZipFile(result.path) as archive:
+        assert archive.namelist() == ['SampleWord.html']
+    assert len(stagingFolders) == 1 and not os.path.exists(stagingFolders[0])
+
+
+def test_failedExportLeavesNothing(sampleExcel, exportFolder, stagingFolders):
+    pool = OfficeApplicationPool(FakeBackend(failOn=['SampleExcel']))
+    try:
+        with pytest.raises(Exception, match='Simulated export failure'):
+            ExcelDocument(sampleExcel, pool=pool, native=False, archive='zip').toCsv(exportFolder)
+    finally:
+        pool.close()
+    assert os.listdir(exportFolder) == []
+    assert len(stagingFolders) == 1 and not os.path.exists(stagingFolders[0])
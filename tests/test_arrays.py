@@ -0,0 +1,90 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import csv
+import datetime
+import os
+
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+import MSOfficeFileConverter.documents
+from MSOfficeFileConverter import ExcelDocument, SheetArrays
+from tests.conftest import buildWorkbook
+
+
+def cell(reference, value, cellType=None, style=None):
+    attributes = ' t="%s"' % cellType if cellType else ''
+    attributes += ' s="%d"' % style if style else ''
+    if cellType == 'inlineStr':
+        return '<c r="%s"%s><is><t>%s</t></is></c>' % (reference, attributes, value)
+    return '<c r="%s"%s><v>%s</v></c>' % (reference, attributes, value)
+
+
+def row(number, *cells):
+    return '<row r="%d">%s</row>' % (number, ''.join(cells))
+
+
+# Columns : A int, B float with a gap, C bool, D bool with a gap, E bool with an error, F text mixing types.
+typedRows = (row(1, *(cell(letter + '1', index, 's') for index, letter in enumerate('ABCDEF'))) +
+             row(2, cell('A2', 1), cell('B2', 0.5), cell('C2', 1, 'b'), cell('D2', 1, 'b'), cell('E2', 0, 'b'), cell('F2', 'x', 'inlineStr')) +
+             row(3, cell('A3', 2), cell('C3', 0, 'b'), cell('E3', '#N/A', 'e'), cell('F3', 3)) +
+             row(4, cell('A4', -3), cell('B4', 1e20), cell('C4', 1, 'b'), cell('D4', 0, 'b'), cell('E4', 1, 'b'), cell('F4', 1, 'b')))
+
+
+@pytest.fixture
+def typedWorkbook(tmp_path):
+    return buildWorkbook(tmp_path / 'typed.xlsx', [('Typed', typedRows, 'A1:F4')], list('ABCDEF'))
+
+
+def test_dtypesMatchTheCsv(typedWorkbook, pool, exportFolder):
+    document = ExcelDocument(typedWorkbook, pool=pool)
+    sheet = document.toArrays()['Typed']
+    assert sheet.kinds == {'A': 'int', 'B': 'float', 'C': 'bool', 'D': 'float', 'E': 'float', 'F': 'text'}
+    assert [sheet.columns[name].dtype for name in 'ABCDEF'] == [numpy.int64, numpy.float64, bool, numpy.float64, numpy.float64, numpy.int32]
+    result = document.toCsv(exportFolder)
+    with open(os.path.join(result.folder, '1.csv'), newline='') as f:
+        header, *rows = list(csv.reader(f))
+    assert header == list('ABCDEF') and sheet.rowCount == len(rows)
+    truth = {'TRUE': 1.0, 'FALSE': 0.0}
+    for index, name in enumerate('ABCDEF'):
+        texts = [values[index] for values in rows]
+        array = sheet.columns[name]
+        if sheet.kinds[name] == 'text':
+            assert list(sheet.text(name)) == texts
+        elif sheet.kinds[name] == 'bool':
+            assert array.tolist() == [text == 'TRUE' for text in texts]
+        else:
+            expected = [numpy.nan if text in ('', '#N/A') else truth[text] if text in truth else float(text) for text in texts]
+            numpy.testing.assert_array_equal(array.astype(numpy.float64), expected)
+
+
+def test_datesAndNpzRoundTrip(tmp_path, pool, exportFolder):
+    rows = row(1, cell('A1', 'When', 'inlineStr'), cell('B1', 'Name', 'inlineStr')) + row(2, cell('A2', 45000.5, style=1), cell('B2', 'café', 'inlineStr')) + row(3, cell('B3', '', 'inlineStr'))
+    path = buildWorkbook(tmp_path / 'dates.xlsx', [('Dates', rows, 'A1:B3')], cellFormats=(0, 22))
+    sheet = ExcelDocument(path, pool=pool).toArrays()['Dates']
+    assert sheet.kinds == {'When': 'datetime', 'Name': 'text'}
+    assert sheet.columns['When'][0] == numpy.datetime64(datetime.datetime(2023, 3, 15, 12, 0))
+    assert numpy.isnat(sheet.columns['When'][1])
+    result = ExcelDocument(path, pool=pool).toNpz(exportFolder)
+    assert result.engine == 'native'
+    copy = SheetArrays.fromNpz(os.path.join(result.folder, '1.npz'))
+    assert (copy.name, copy.kinds, copy.firstRow, copy.rowCount) == ('Dates', sheet.kinds, 2, 2)
+    for name in sheet.columns:
+        numpy.testing.assert_array_equal(copy.columns[name], sheet.columns[name])
+    assert list(copy.text('Name')) == ['café', '']
+
+
+def test_officeCopyRemovedOnceTheWorkbookIsClosed(sampleExcel, pool, exportFolder, monkeypatch):
+    folders = []
+    createStagingFolder = MSOfficeFileConverter.documents._createStagingFolder
+    monkeypatch.setattr(MSOfficeFileConverter.documents, '_createStagingFolder', lambda: folders.append(createStagingFolder()) or folders[-1])
+    closedWith = []
+    close = ExcelDocument._close
+    monkeypatch.setattr(ExcelDocument, '_close', lambda self, workbook: closedWith.append(os.listdir(folders[0])) or close(self, workbook))
+    result = ExcelDocument(sampleExcel, pool=pool, native=False).toNpz(exportFolder)
+    assert result.engine == 'office'
+    assert sorted(os.listdir(result.folder)) == ['1.npz', '2.npz', '3.npz']
+    assert closedWith == [['SampleExcel.xlsx']]
+    assert not os.path.exists(folders[0])
@@ -0,0 +1,120 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import asyncio
+import os
+
+import pytest
+
+from MSOfficeFileConverter import AsyncConverter, WordDocument
+from tests.conftest import copySample
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+def makeDocuments(folder, count):
+    return [WordDocument(copySample(folder, 'SampleWord.docx', 'document%d.docx' % i)) for i in range(count)]
+
+
+def test_toExportsInWorkerThreads(tmp_path, exportFolder):
+    documents = makeDocuments(tmp_path / 'source', 4)
+    backend = FakeBackend(saveDelay=0.05)
+
+    async def main():
+        with AsyncConverter(backend, workers=2) as converter:
+            results = await asyncio.gather(*[document.to('PDF', exportFolder, converter=converter) for document in documents])
+            return results, converter.stats()
+
+    results, stats = asyncio.run(main())
+    assert sorted(os.path.basename(result.path) for result in results) == ['document%d.pdf' % i for i in range(4)]
+    assert (stats['completed'], stats['failed'], stats['queued'], stats['running']) == (4, 0, 0, 0)
+    assert backend.dispatchCount == 2
+    assert backend.quitCount == 2
+
+
+def test_toRunsQueuedJobsByPriority(tmp_path, exportFolder):
+    blocking, *documents = makeDocuments(tmp_path / 'source', 4)
+    finished = []
+
+    async def export(document, priority):
+        await document.to('pdf', exportFolder, converter=converter, priority=priority)
+        finished.append(priority)
+
+    async def main():
+        task = asyncio.ensure_future(export(blocking, 'normal'))
+        # The only worker is busy: the next jobs are queued.
+        await asyncio.sleep(0.1)
+        await asyncio.gather(task, *[export(document, priority) for document, priority in zip(documents, ['bulk', 'normal', 'interactive'])])
+
+    with AsyncConverter(FakeBackend(saveDelay=0.2), workers=1) as converter:
+        asyncio.run(main())
+    assert finished == ['normal', 'interactive', 'normal', 'bulk']
+
+
+def test_timeoutCancelsQueuedJob(tmp_path, exportFolder):
+    running, queued = makeDocuments(tmp_path / 'source', 2)
+
+    async def main():
+        task = asyncio.ensure_future(running.to('pdf', exportFolder, converter=converter))
+        await asyncio.sleep(0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await queued.to('pdf', exportFolder, converter=converter, timeout=0.05)
+        await task
+
+    with AsyncConverter(FakeBackend(saveDelay=0.3), workers=1) as converter:
+        asyncio.run(main())
+    assert converter.stats()['cancelled'] == 1
+    assert os.listdir(exportFolder) == ['document0.pdf']
+
+
+def test_failedExportRaisesInCaller(sampleWord, exportFolder):
+    async def main():
+        with pytest.raises(Exception, match='Simulated export failure'):
+            await WordDocument(sampleWord).to('pdf', exportFolder, converter=converter)
+
+    with AsyncConverter(FakeBackend(failOn=['SampleWord']), workers=1) as converter:
+        asyncio.run(main())
+    assert converter.stats()['failed'] == 1
+
+
+def test_closedConverterRefusesJobs(sampleWord, exportFolder):
+    converter = AsyncConverter(FakeBackend(), workers=1)
+    converter.close()
+    with pytest.raises(Exception, match='closed'):
+        asyncio.run(WordDocument(sampleWord).to('pdf', exportFolder, converter=converter))
+
+
+def test_timeoutKillsTheRunningJob(tmp_path, exportFolder):
+    stuck = WordDocument(copySample(tmp_path / 'source', 'SampleWord.docx', 'stuck.docx'))
+    following, = makeDocuments(tmp_path / 'source', 1)
+    backend = FakeBackend(hangOn=['stuck'])
+
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await stuck.to('pdf', exportFolder, converter=converter, timeout=0.2)
+        # The only worker is free again: the next job does not wait for the stuck one.
+        return await following.to('pdf', exportFolder, converter=converter, timeout=5)
+
+    with AsyncConverter(backend, workers=1) as converter:
+        result = asyncio.run(main())
+    assert os.path.basename(result.path) == 'document0.pdf'
+    assert backend.killCount == 1
+    assert converter.stats()['failed'] == 1
+
+
+def test_baseExceptionResolvesTheFuture():
+    class Stop(BaseException):
+        pass
+
+    def stop(pool):
+        raise Stop('stopped')
+
+    async def main():
+        with pytest.raises(Exception, match='The job raised Stop: stopped') as error:
+            await converter.submit(stop)
+        assert isinstance(error.value.__cause__, Stop)
+        return await converter.submit(lambda pool: 'next')
+
+    with AsyncConverter(FakeBackend(), workers=1) as converter:
+        assert asyncio.run(main()) == 'next'
+    stats = converter.stats()
+    assert (stats['completed'], stats['failed'], stats['running']) == (1, 1, 0)
@@ -0,0 +1,108 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+
+import pytest
+
+import MSOfficeFileConverter.batch
+from MSOfficeFileConverter import BatchJob, IncrementalManifest, convertBatch, jobsFromDirectory
+from tests.conftest import copySample
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+@pytest.fixture
+def sourceFolder(tmp_path):
+    folder = tmp_path / 'source'
+    copySample(folder, 'SampleWord.docx')
+    copySample(folder / 'sub', 'SampleExcel.xlsx')
+    copySample(folder, 'SampleWord.docx', '~$SampleWord.docx')
+    (folder / 'notes.txt').write_text('Not a document')
+    return str(folder)
+
+
+def test_jobsFromDirectoryGivesEachTypeItsFormats(sourceFolder, tmp_path):
+    jobs = jobsFromDirectory(sourceFolder, ['PDF', 'html', 'csv'], str(tmp_path / 'export'))
+    assert [os.path.relpath(job.source, sourceFolder) for job in jobs] == ['SampleWord.docx', os.path.join('sub', 'SampleExcel.xlsx')]
+    word, excel = jobs
+    assert (word.formats, word.skippedFormats) == (['pdf', 'html'], ['csv'])
+    assert (excel.formats, excel.skippedFormats) == (['pdf', 'csv'], ['html'])
+    assert os.path.normpath(word.destination) == str(tmp_path / 'export')
+    assert excel.destination == str(tmp_path / 'export' / 'sub')
+
+
+def test_jobsFromDirectoryNotRecursive(sourceFolder):
+    jobs = jobsFromDirectory(sourceFolder, 'pdf', recursive=False)
+    assert [os.path.basename(job.source) for job in jobs] == ['SampleWord.docx']
+    assert jobs[0].destination is None
+
+
+def test_jobsFromDirectoryRefusesUnknownFormat(sourceFolder):
+    with pytest.raises(Exception, match='Unsupported export format: docz'):
+        jobsFromDirectory(sourceFolder, ['pdf', 'docz'])
+
+
+def test_convertBatchExportsEveryJob(sourceFolder, tmp_path):
+    exportFolder = tmp_path / 'export'
+    jobs = jobsFromDirectory(sourceFolder, ['pdf', 'csv'], str(exportFolder))
+    summary = convertBatch(jobs, 2, FakeBackend())
+    assert summary.failed == []
+    # One CSV file per sheet.
+    assert summary.fileCount == 5
+    assert summary.skippedFormats == 1
+    assert sorted(os.listdir(str(exportFolder))) == ['SampleWord.pdf', 'sub']
+    assert sorted(os.listdir(str(exportFolder / 'sub'))) == ['CSV_Files_SampleExcel.csv', 'SampleExcel.pdf']
+    assert '1 exports skipped' in str(summary)
+
+
+def test_convertBatchOnlySkippedFormats(sourceFolder, tmp_path):
+    jobs = jobsFromDirectory(sourceFolder, 'csv', str(tmp_path / 'export'), recursive=False)
+    summary = convertBatch(jobs, 2, FakeBackend())
+    assert summary.failed == []
+    assert summary.fileCount == 0
+    assert summary.skippedFormats == 1
+    assert not os.path.exists(str(tmp_path / 'export'))
+
+
+def test_incrementalBatchSkipsUpToDateDocuments(sourceFolder, tmp_path):
+    manifest = IncrementalManifest(str(tmp_path / 'manifest.json'))
+    jobs = jobsFromDirectory(sourceFolder, 'pdf', str(tmp_path / 'export'))
+    assert len(convertBatch(jobs, 2, FakeBackend(), incremental=manifest).upToDate) == 0
+
+    dryRun = convertBatch(jobs, 2, FakeBackend(), incremental=manifest, dryRun=True)
+    assert len(dryRun.upToDate) == 2
+    assert 'WOULD EXPORT' not in str(dryRun)
+
+    summary = convertBatch(jobs, 2, FakeBackend(), incremental=manifest)
+    assert len(summary.upToDate) == 2
+    assert summary.fileCount == 0
+
+
+def test_dryRunReportsDocumentsItCannotPlan(sourceFolder, tmp_path):
+    manifest = IncrementalManifest(None)
+    jobs = jobsFromDirectory(sourceFolder, 'pdf', str(tmp_path / 'export'), recursive=False)
+    jobs.append(BatchJob(str(tmp_path / 'missing.docx'), 'pdf', str(tmp_path / 'export')))
+    summary = convertBatch(jobs, 2, FakeBackend(), incremental=manifest, dryRun=True)
+    assert len(summary.succeeded) == 1
+    assert [result.job.source for result in summary.failed] == [str(tmp_path / 'missing.docx')]
+    text = str(summary)
+    assert text.startswith('2 documents, 0 up to date, 1 to export, 1 failed')
+    assert 'WOULD EXPORT %s to pdf' % jobs[0].source in text
+    assert 'FAILED %s' % jobs[1].source in text
+    assert not os.path.exists(str(tmp_path / 'export'))
+
+
+@pytest.mark.parametrize('retries, started', [(0, 1), (1, 2)])
+def test_crashedWorkerReplacedOnlyForPendingJobs(tmp_path, monkeypatch, retries, started):
+    workers = []
+
+    class CountedWorker(MSOfficeFileConverter.batch._BatchWorker):
+        def __init__(self, *args):
+            super().__init__(*args)
+            workers.append(self)
+    monkeypatch.setattr(MSOfficeFileConverter.batch, '_BatchWorker', CountedWorker)
+    jobs = [BatchJob(copySample(tmp_path / 'source', 'SampleWord.docx', 'crash.docx'), 'pdf', str(tmp_path / 'export'))]
+    summary = convertBatch(jobs, 1, FakeBackend(crashOn=['crash']), retries=retries)
+    assert summary.workerCrashes == retries + 1
+    assert len(workers) == started
+    assert summary.results[0].error.startswith('Worker process died')
@@ -0,0 +1,92 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import threading
+import time
+
+from MSOfficeFileConverter import ConversionCache, WordDocument, ExcelDocument
+
+
+def writeFile(path, size):
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+    return path
+
+
+def test_hitAndMiss(tmp_path, pool, backend, sampleWord, exportFolder):
+    cache = ConversionCache(str(tmp_path / 'cache'))
+    first = WordDocument(sampleWord, pool=pool, cache=cache).toPdf(exportFolder)
+    second = WordDocument(sampleWord, pool=pool, cache=cache).toPdf(exportFolder)
+    assert (first.cached, second.cached) == (False, True)
+    assert open(first.path, 'rb').read() == open(second.path, 'rb').read()
+    assert len(backend.opened) == 1
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'evictions': 0, 'hitRatio': 0.5}
+    assert not cache.restore(cache.key('0' * 64, 'pdf', {}), str(tmp_path / 'missing.pdf'), None)
+
+
+def test_multiFilesRestoredAsOneEntry(tmp_path, pool, backend, sampleExcel, exportFolder):
+    cache = ConversionCache(str(tmp_path / 'cache'))
+    first = ExcelDocument(sampleExcel, pool=pool, cache=cache, native=False).toCsv(exportFolder)
+    second = ExcelDocument(sampleExcel, pool=pool, cache=cache, native=False).toCsv(exportFolder)
+    assert second.cached and second.folder != first.folder
+    assert sorted(os.listdir(second.folder)) == sorted(os.listdir(first.folder)) == ['1.csv', '2.csv', '3.csv']
+    for name in os.listdir(first.folder):
+        assert open(os.path.join(second.folder, name), 'rb').read() == open(os.path.join(first.folder, name), 'rb').read()
+    assert len(backend.opened) == 1
+    assert len([name for name in os.listdir(cache.folder) if name not in ('tmp', 'index')]) == 1
+
+
+def test_evictsLeastRecentlyUsed(tmp_path):
+    cache = ConversionCache(str(tmp_path / 'cache'), maxBytes=250)
+    for name in 'abc':
+        cache.store(name, writeFile(str(tmp_path / name), 100), None)
+        # The modification times must differ for the LRU order.
+        time.sleep(0.02)
+    assert cache.stats()['evictions'] == 1
+    assert not os.path.exists(os.path.join(cache.folder, 'a'))
+    assert cache.restore('b', str(tmp_path / 'b.out'), None)
+    time.sleep(0.02)
+    cache.store('d', writeFile(str(tmp_path / 'd'), 100), None)
+    assert sorted(name for name in os.listdir(cache.folder) if len(name) == 1) == ['b', 'd']
+    assert cache.size() == 200
+
+
+def test_storeOnlyListsEntriesOverMaxBytes(tmp_path, monkeypatch):
+    cache = ConversionCache(str(tmp_path / 'cache'), maxBytes=1000)
+    cache.store('first', writeFile(str(tmp_path / 'first'), 100), None)
+    scans = []
+    listEntries = cache._entries
+    monkeypatch.setattr(cache, '_entries', lambda: scans.append(1) or listEntries())
+    for index in range(8):
+        cache.store('entry%d' % index, writeFile(str(tmp_path / 'entry'), 100), None)
+    assert scans == []
+    assert cache.size() == 900
+    cache.store('last', writeFile(str(tmp_path / 'last'), 200), None)
+    assert scans == [1]
+    assert cache.size() <= 1000
+
+
+def test_sameKeyStoredByTwoWorkers(tmp_path):
+    cache = ConversionCache(str(tmp_path / 'cache'))
+    other = ConversionCache(str(tmp_path / 'cache'))
+    source = writeFile(str(tmp_path / 'export.pdf'), 1000)
+    barrier = threading.Barrier(2)
+    errors = []
+
+    def work(cache):
+        barrier.wait()
+        try:
+            cache.store('same', source, None)
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=work, args=(c,)) for c in (cache, other)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert cache.size() == 1000
+    assert os.listdir(os.path.join(cache.folder, 'tmp')) == []
+    assert cache.restore('same', str(tmp_path / 'restored.pdf'), None)
+    assert os.path.getsize(str(tmp_path / 'restored.pdf')) == 1000
@@ -0,0 +1,97 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import zipfile
+
+import pytest
+
+from MSOfficeFileConverter import WordDocument
+from MSOfficeFileConverter.docx import _exportNativeTxt, _iterDocxText
+from MSOfficeFileConverter.utils import _NativeUnsupported
+
+wordNamespace = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+relationshipsXml = ('<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" Target="header1.xml"/>'
+                    '</Relationships>')
+
+
+def buildDocx(path, body, styles=None, relationships=relationshipsXml, header='<w:p><w:r><w:t>Header</w:t></w:r></w:p>'):
+    """Write a minimal .docx file, and return its path. None leaves a part out."""
+    with zipfile.ZipFile(str(path), 'w') as archive:
+        archive.writestr('word/document.xml', '<w:document %s><w:body>%s</w:body></w:document>' % (wordNamespace, body))
+        if relationships is not None:
+            archive.writestr('word/_rels/document.xml.rels', relationships)
+        if header is not None:
+            archive.writestr('word/header1.xml', '<w:hdr %s>%s</w:hdr>' % (wordNamespace, header))
+        if styles is not None:
+            archive.writestr('word/styles.xml', '<w:styles %s>%s</w:styles>' % (wordNamespace, styles))
+    return str(path)
+
+
+def paragraph(content):
+    return '<w:p>%s</w:p>' % content
+
+
+def run(text):
+    return '<w:r><w:t xml:space="preserve">%s</w:t></w:r>' % text
+
+
+def test_sampleWordGolden(pool, backend, sampleWord, exportFolder):
+    result = WordDocument(sampleWord, pool=pool).toTxt(exportFolder)
+    assert result.engine == 'native'
+    assert backend.dispatchCount == 0
+    assert open(result.path, 'rb').read() == b'I <3 FanaticPythoner.\r\n'
+
+
+def test_textOfRunsTablesAndBreaks(tmp_path, exportFolder):
+    body = (paragraph(run('Hello ') + run('world') + '<w:r><w:tab/><w:t>tab</w:t><w:br/><w:t>line</w:t></w:r>') +
+            paragraph('<w:r><w:rPr><w:vanish/></w:rPr><w:t>hidden</w:t></w:r>' + run('shown') + '<w:del>' + run('deleted') + '</w:del>') +
+            '<w:tbl><w:tr><w:tc>%s</w:tc><w:tc>%s%s</w:tc></w:tr></w:tbl>' % (paragraph(run('A1')), paragraph(run('B1')), paragraph(run('B1 bis'))) +
+            paragraph(run('café')))
+    path = buildDocx(tmp_path / 'text.docx', body)
+    exportFilePath = os.path.join(exportFolder, 'text.txt')
+    _exportNativeTxt(path, exportFilePath)
+    assert open(exportFilePath, 'rb').read() == b'Hello world\ttab\r\nline\r\nshown\r\nA1\tB1\r\nB1 bis\r\ncaf\xe9\r\n'
+    assert list(_iterDocxText(path, headersFooters=True))[0] == 'Header'
+
+
+numberedStyle = ('<w:style w:styleId="ListParagraph"><w:pPr><w:numPr><w:numId w:val="1"/></w:numPr></w:pPr></w:style>'
+                 '<w:style w:styleId="MyList"><w:basedOn w:val="ListParagraph"/></w:style>')
+
+
+@pytest.mark.parametrize('content', [
+    '<w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr>' + run('item'),
+    '<w:pPr><w:pStyle w:val="MyList"/></w:pPr>' + run('item'),
+    '<w:r><w:pict><w:txbxContent>%s</w:txbxContent></w:pict></w:r>' % paragraph(run('in a textbox')),
+    run('note') + '<w:r><w:footnoteReference w:id="1"/></w:r>',
+], ids=['list', 'listStyle', 'textbox', 'footnote'])
+def test_strictModeFallsBackToWord(tmp_path, pool, backend, exportFolder, content):
+    path = buildDocx(tmp_path / 'unsupported.docx', paragraph(run('before')) + paragraph(content), styles=numberedStyle)
+    with pytest.raises(_NativeUnsupported):
+        _exportNativeTxt(path, os.path.join(exportFolder, 'native.txt'))
+    assert os.listdir(exportFolder) == []
+    assert list(_iterDocxText(path))[0] == 'before'
+    result = WordDocument(path, pool=pool).toTxt(exportFolder)
+    assert result.engine == 'office'
+    assert len(backend.opened) == 1
+
+
+def test_textboxParagraphsKeepTheirAnchor(tmp_path):
+    textbox = '<w:r><w:pict><w:txbxContent>%s</w:txbxContent></w:pict></w:r>' % paragraph(run('in a textbox'))
+    path = buildDocx(tmp_path / 'textbox.docx', paragraph(run('anchor ') + textbox + run('after')))
+    assert list(_iterDocxText(path)) == ['in a textbox', 'anchor after']
+
+
+@pytest.mark.parametrize('relationships', [None, '<Relationships'], ids=['missing', 'malformed'])
+def test_headersFootersWithBrokenRelationships(tmp_path, relationships):
+    path = buildDocx(tmp_path / 'broken.docx', paragraph(run('text')), relationships=relationships)
+    with pytest.raises(_NativeUnsupported):
+        list(_iterDocxText(path, headersFooters=True))
+    assert list(_iterDocxText(path)) == ['text']
+
+
+def test_malformedStylesFallBack(tmp_path, exportFolder):
+    path = buildDocx(tmp_path / 'styles.docx', paragraph(run('text')), styles='<w:style')
+    with pytest.raises(_NativeUnsupported):
+        _exportNativeTxt(path, os.path.join(exportFolder, 'native.txt'))
@@ -0,0 +1,58 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+
+import pytest
+
+from MSOfficeFileConverter import ExcelDocument, WordDocument
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_wordPages(sampleWord, pool, exportFolder):
+    assert read(WordDocument(sampleWord, pool=pool).toPdf(exportFolder).path).startswith('SaveAs of ')
+    result = WordDocument(sampleWord, pool=pool, overwrite=True, pages=[3, 2, 4]).export(['pdf', 'xps'], exportFolder)
+    for formatName, enumNum in (('pdf', 17), ('xps', 18)):
+        assert read(result[formatName].path) == 'ExportAsFixedFormat of the pages 2 to 4 of %s with format %d\n' % (sampleWord, enumNum)
+    with pytest.raises(Exception, match='consecutive pages'):
+        WordDocument(sampleWord, pool=pool, overwrite=True, pages=[1, 3]).toPdf(exportFolder)
+
+
+@pytest.fixture
+def visibleAtClose(monkeypatch):
+    """The visible sheets of each workbook when it is closed."""
+    visible = []
+    close = ExcelDocument._close
+    monkeypatch.setattr(ExcelDocument, '_close', lambda self, workbook: visible.append(
+        [worksheet.Name for worksheet in workbook.Worksheets if worksheet.Visible == -1]) or close(self, workbook))
+    return visible
+
+
+def test_excelSheetsAndPages(sampleExcel, pool, exportFolder, visibleAtClose):
+    result = ExcelDocument(sampleExcel, pool=pool, sheets=['Sheet3', 1], pages=range(1, 3)).export(['pdf', 'xps'], exportFolder)
+    for formatName, enumNum in (('pdf', 0), ('xps', 1)):
+        assert read(result[formatName].path) == 'ExportAsFixedFormat of the sheets Sheet1, Sheet3 of the pages 1 to 2 of %s with format %d\n' % (sampleExcel, enumNum)
+    # The sheets hidden for the export are shown again.
+    assert visibleAtClose == [['Sheet1', 'Sheet2', 'Sheet3']]
+
+
+def test_excelActiveSheetAndWholeWorkbook(sampleExcel, pool, exportFolder):
+    result = ExcelDocument(sampleExcel, pool=pool, activeSheetOnly=True, pages=[2]).toXps(exportFolder)
+    assert read(result.path).startswith('Sheet 1 ExportAsFixedFormat of the pages 2 to 2 ')
+    result = ExcelDocument(sampleExcel, pool=pool, overwrite=True).toPdf(exportFolder)
+    assert read(result.path).startswith('ExportAsFixedFormat of %s ' % sampleExcel)
+    assert sorted(os.listdir(exportFolder)) == ['SampleExcel.pdf', 'SampleExcel.xps']
+
+
+@pytest.mark.parametrize('options, message', [
+    ({'sheets': ['Missing']}, 'no sheet'),
+    ({'sheets': [0]}, 'The sheets must be'),
+    ({'pages': [0, 1]}, 'The pages must be'),
+])
+def test_excelInvalidSubsets(sampleExcel, pool, exportFolder, options, message):
+    with pytest.raises(Exception, match=message):
+        ExcelDocument(sampleExcel, pool=pool, **options).toPdf(exportFolder)
@@ -0,0 +1,58 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import threading
+
+from MSOfficeFileConverter.folders import _folderIndexes, _FolderReservation
+
+
+def test_concurrentReservationsGetDistinctFolders(exportFolder):
+    count = 16
+    barrier = threading.Barrier(count)
+    reservations = []
+
+    def reserve():
+        barrier.wait()
+        reservations.append(_FolderReservation(exportFolder, 'HtmlFiles_', 'file.html', False))
+    threads = [threading.Thread(target=reserve) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    names = sorted(os.path.basename(reservation.folder) for reservation in reservations)
+    assert len(set(names)) == count
+    assert names == sorted(['HtmlFiles_file.html'] + ['HtmlFiles_%d_file.html' % index for index in range(1, count)])
+    assert len({reservation.staging for reservation in reservations}) == count
+
+
+def test_foldersTakenOutsideTheProcessAreSkipped(exportFolder):
+    os.mkdir(os.path.join(exportFolder, 'HtmlFiles_file.html'))
+    os.mkdir(os.path.join(exportFolder, 'HtmlFiles_2_file.html'))
+    first = _FolderReservation(exportFolder, 'HtmlFiles_', 'file.html', False)
+    assert os.path.basename(first.folder) == 'HtmlFiles_3_file.html'
+    # Another process takes the next folder: the index remembered by this process is already taken.
+    os.mkdir(os.path.join(exportFolder, 'HtmlFiles_4_file.html'))
+    second = _FolderReservation(exportFolder, 'HtmlFiles_', 'file.html', False)
+    assert os.path.basename(second.folder) == 'HtmlFiles_5_file.html'
+    assert _folderIndexes[(exportFolder, 'HtmlFiles_', 'file.html')] == 6
+
+
+def test_publishAndDiscard(exportFolder):
+    published = _FolderReservation(exportFolder, 'HtmlFiles_', 'file.html', False)
+    with open(os.path.join(published.staging, 'file.html'), 'w') as f:
+        f.write('html')
+    assert published.path(os.path.join(published.staging, 'file.html')) == os.path.join(published.folder, 'file.html')
+    published.publish()
+    assert os.listdir(published.folder) == ['file.html']
+    discarded = _FolderReservation(exportFolder, 'HtmlFiles_', 'file.html', False)
+    discarded.discard()
+    assert sorted(os.listdir(exportFolder)) == ['HtmlFiles_file.html']
+
+    replaced = _FolderReservation(exportFolder, 'HtmlFiles_', 'file.html', True)
+    assert replaced.folder == published.folder
+    with open(os.path.join(replaced.staging, 'new.html'), 'w') as f:
+        f.write('new')
+    replaced.publish()
+    assert os.listdir(replaced.folder) == ['new.html']
+    assert os.listdir(exportFolder) == ['HtmlFiles_file.html']
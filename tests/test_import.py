@@ -0,0 +1,45 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import json
+import subprocess
+import sys
+
+from tests.conftest import rootFolder
+
+windowsModules = ['win32com', 'pythoncom', 'pywintypes', 'win32api', 'win32process', 'winreg']
+
+# Run in a fresh interpreter where the Windows modules cannot be imported, like on Linux without pywin32.
+script = '''
+import importlib.abc, json, os, sys
+
+class WindowsModulesFinder(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path=None, target=None):
+        if name.split('.')[0] in %r:
+            raise ImportError('No module named %%r' %% name)
+        return None
+
+sys.meta_path.insert(0, WindowsModulesFinder())
+os.environ.pop('MSOFFICEFILECONVERTER_BACKEND', None)
+import MSOfficeFileConverter
+from MSOfficeFileConverter import OfficeApplicationPool, WordDocument, getBackend
+pool = OfficeApplicationPool(getBackend())
+text = WordDocument.fromBytes(open(os.path.join(%r, 'SampleWord.docx'), 'rb').read(), 'SampleWord.docx', pool=pool).toBytes('txt')
+try:
+    WordDocument(os.path.join(%r, 'SampleWord.docx'), pool=pool).toBytes('pdf')
+    error = None
+except Exception as e:
+    error = str(e)
+print(json.dumps({'backend': type(getBackend()).__name__, 'text': text.decode('cp1252'), 'error': error,
+                  'loaded': sorted(name for name in sys.modules if name.split('.')[0] in %r)}))
+''' % (windowsModules, rootFolder, rootFolder, windowsModules)
+
+
+def test_importWithoutTheWindowsModules():
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, timeout=60, check=True).stdout
+    result = json.loads(output.splitlines()[-1])
+    assert result['loaded'] == []
+    if sys.platform != 'win32':
+        assert result['backend'] == 'NativeBackend'
+        assert 'native backend' in result['error']
+    assert result['text'] == 'I <3 FanaticPythoner.\r\n'
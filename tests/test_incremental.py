@@ -0,0 +1,63 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import shutil
+import time
+import zipfile
+
+from MSOfficeFileConverter import IncrementalManifest, WordDocument
+from tests.conftest import copySample
+
+
+def writeVersion(path, text):
+    """Write a copy of SampleWord.docx with an extra part: versions of the same length have the same size."""
+    copySample(os.path.dirname(path), 'SampleWord.docx', os.path.basename(path))
+    with zipfile.ZipFile(path, 'a') as document:
+        document.writestr('customXml/version.xml', text, compress_type=zipfile.ZIP_STORED)
+    return path
+
+
+def export(path, manifest, pool, exportFolder):
+    return WordDocument(path, pool=pool, incremental=manifest).export(['pdf', 'html'], exportFolder)
+
+
+def test_upToDateExportsAreSkipped(tmp_path, pool, backend, exportFolder):
+    path = writeVersion(str(tmp_path / 'source' / 'document.docx'), 'version 1')
+    manifestPath = str(tmp_path / 'manifest.json')
+    with IncrementalManifest(manifestPath) as manifest:
+        first = export(path, manifest, pool, exportFolder)
+    assert {result.engine for result in first.values()} == {'office'}
+
+    manifest = IncrementalManifest(manifestPath)
+    second = export(path, manifest, pool, exportFolder)
+    assert {result.engine for result in second.values()} == {'upToDate'}
+    assert second['pdf'].path == first['pdf'].path and second['html'].folder == first['html'].folder
+    # A touch or a copy changes the modification time, not the content.
+    time.sleep(0.01)
+    shutil.copyfile(path, path + '.copy')
+    os.replace(path + '.copy', path)
+    assert manifest.plan(WordDocument(path, pool=pool), ['pdf', 'html'], exportFolder) == {'pdf': None, 'html': None}
+    assert len(backend.opened) == 1
+
+
+def test_changedSourceIsExportedAgain(tmp_path, pool, backend, exportFolder):
+    path = writeVersion(str(tmp_path / 'source' / 'document.docx'), 'version 1')
+    manifest = IncrementalManifest(None)
+    first = export(path, manifest, pool, exportFolder)
+    size = os.path.getsize(path)
+    writeVersion(path, 'version 2')
+    assert os.path.getsize(path) == size
+    assert manifest.plan(WordDocument(path, pool=pool), ['pdf', 'html'], exportFolder) == {'pdf': 'source changed', 'html': 'source changed'}
+    second = export(path, manifest, pool, exportFolder)
+    assert {result.engine for result in second.values()} == {'office'}
+    assert len(backend.opened) == 2
+    # The folder of the multi-files format is replaced, not duplicated.
+    assert second['html'].folder == first['html'].folder
+    assert sorted(os.listdir(exportFolder)) == sorted([os.path.basename(first['pdf'].path), os.path.basename(first['html'].folder)])
+
+    os.remove(second['pdf'].path)
+    assert manifest.plan(WordDocument(path, pool=pool), ['pdf', 'html'], exportFolder) == {'pdf': 'output missing', 'html': None}
+    third = export(path, manifest, pool, exportFolder)
+    assert (third['pdf'].engine, third['html'].engine) == ('office', 'upToDate')
+    assert os.path.isfile(third['pdf'].path)
@@ -0,0 +1,58 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import io
+import os
+
+import pytest
+
+import MSOfficeFileConverter.documents
+from MSOfficeFileConverter import ExcelDocument, WordDocument
+from tests.conftest import rootFolder
+
+
+@pytest.fixture
+def stagingFolders(monkeypatch):
+    folders = []
+    createStagingFolder = MSOfficeFileConverter.documents._createStagingFolder
+    monkeypatch.setattr(MSOfficeFileConverter.documents, '_createStagingFolder', lambda: folders.append(createStagingFolder()) or folders[-1])
+    return folders
+
+
+def readSample(name):
+    with open(os.path.join(rootFolder, name), 'rb') as f:
+        return f.read()
+
+
+def test_wordRoundTrip(pool, backend, stagingFolders, sampleWord, exportFolder):
+    stream = io.BytesIO(readSample('SampleWord.docx'))
+    with WordDocument.fromStream(stream, 'upload.docx', pool=pool) as document:
+        assert document.fileName == 'upload'
+        text = document.toBytes('TXT')
+        output = io.BytesIO()
+        assert document.toStream('txt', output) == len(text)
+        pdf = document.toBytes('pdf')
+    assert text == output.getvalue() == open(WordDocument(sampleWord, pool=pool).toTxt(exportFolder).path, 'rb').read()
+    assert pdf.startswith(b'SaveAs of ') and b'upload.docx' in pdf
+    assert len(backend.opened) == 1
+    # The uploaded document and the PDF staged for toBytes.
+    assert len(stagingFolders) == 2
+    assert not any(os.path.exists(folder) for folder in stagingFolders)
+
+
+def test_excelMultiFilesFormats(pool, stagingFolders, sampleExcel, exportFolder):
+    document = ExcelDocument.fromBytes(readSample('SampleExcel.xlsx'), 'upload.xlsx', pool=pool)
+    files = document.toBytes('csv')
+    folder = ExcelDocument(sampleExcel, pool=pool).toCsv(exportFolder).folder
+    assert files == {name: open(os.path.join(folder, name), 'rb').read() for name in os.listdir(folder)}
+    with pytest.raises(Exception, match='use toBytes'):
+        document.toStream('csv', io.BytesIO())
+    document.close()
+    document.close()
+    assert not any(os.path.exists(folder) for folder in stagingFolders)
+
+
+def test_failedConstructorRemovesTheUpload(stagingFolders):
+    with pytest.raises(Exception, match='The archive must be'):
+        WordDocument.fromBytes(readSample('SampleWord.docx'), 'upload.docx', archive='rar')
+    assert len(stagingFolders) == 1 and not os.path.exists(stagingFolders[0])
@@ -0,0 +1,115 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import gc
+import json
+import logging
+import os
+import pickle
+import re
+import weakref
+
+import pytest
+
+from MSOfficeFileConverter import (
+    BatchJob, ConversionCache, ExcelDocument, LogSink, OfficeApplicationPool, PrometheusTextfileSink, WordDocument,
+    addMetricsSink, convertBatch, removeMetricsSink)
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+from MSOfficeFileConverter.metrics import _textfileSinks
+
+
+@pytest.fixture
+def received():
+    received = []
+    addMetricsSink(received.append)
+    yield received
+    removeMetricsSink(received.append)
+
+
+def counters(path):
+    """Return the {'name{labels}': value} of a Prometheus text file."""
+    return {line.rsplit(' ', 1)[0]: float(line.rsplit(' ', 1)[1]) for line in open(path).read().splitlines() if line and not line.startswith('#')}
+
+
+def test_phasesOfOfficeNativeAndCachedExports(tmp_path, received, sampleWord, sampleExcel, exportFolder):
+    pool = OfficeApplicationPool(FakeBackend())
+    WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    ExcelDocument(sampleExcel, pool=pool, cache=ConversionCache(str(tmp_path / 'cache'))).toCsv(exportFolder)
+    pool.close()
+    word, excel, quit = received
+    assert (word.event, word.program, word.inputBytes, word.error) == ('export', 'Word.Application', os.path.getsize(sampleWord), None)
+    assert set(word.phases) == {'dispatch', 'open', 'export', 'close'}
+    assert word.formats['pdf']['engine'] == 'office' and word.formats['pdf']['outputBytes'] > 0
+    assert word.seconds >= sum(word.phases.values())
+    assert set(excel.phases) == {'cacheLookup', 'native', 'cacheStore'}
+    assert excel.formats['csv']['engine'] == 'native'
+    assert (quit.event, set(quit.phases)) == ('pool', {'quit'})
+
+
+def test_failedExportAndBrokenSink(received, sampleWord, exportFolder):
+    def brokenSink(metrics):
+        raise ValueError('broken sink')
+    addMetricsSink(brokenSink)
+    try:
+        pool = OfficeApplicationPool(FakeBackend(failOn=['SampleWord']))
+        with pytest.raises(Exception, match='Simulated export failure'):
+            WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+        pool.close()
+    finally:
+        removeMetricsSink(brokenSink)
+    assert 'Simulated export failure' in received[0].error
+
+
+def test_logSink(pool, sampleWord, exportFolder, caplog):
+    sink = LogSink()
+    addMetricsSink(sink)
+    try:
+        with caplog.at_level(logging.INFO, logger='MSOfficeFileConverter'):
+            WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    finally:
+        removeMetricsSink(sink)
+    line = json.loads(caplog.records[-1].getMessage())
+    assert line['event'] == 'export' and 'pdf' in line['formats']
+
+
+def test_prometheusTextfileSink(tmp_path, pool, sampleWord, exportFolder):
+    sink = PrometheusTextfileSink(str(tmp_path / 'metrics_{pid}.prom'), minInterval=3600)
+    path = str(tmp_path / ('metrics_%d.prom' % os.getpid()))
+    sink.flush()
+    addMetricsSink(sink)
+    try:
+        for _ in range(2):
+            WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    finally:
+        removeMetricsSink(sink)
+    # Not written again before minInterval.
+    assert counters(path) == {}
+    assert sink in _textfileSinks
+    sink.close()
+    assert sink not in _textfileSinks
+    values = counters(path)
+    assert values['msofficefileconverter_jobs_total{program="Word.Application"}'] == 2.0
+    assert values['msofficefileconverter_exports_total{engine="office",format="pdf"}'] == 2.0
+    assert values['msofficefileconverter_phase_count_total{phase="open"}'] == 2.0
+    assert re.search(r'^# TYPE msofficefileconverter_jobs_total counter$', open(path).read(), re.M)
+    assert not os.path.exists(path + '.tmp')
+
+
+def test_unusedSinksAreNotWrittenAtExit(tmp_path):
+    sink = PrometheusTextfileSink(str(tmp_path / 'metrics.prom'))
+    copy = pickle.loads(pickle.dumps(sink))
+    assert copy._counters == {} and copy.path == sink.path
+    assert sink in _textfileSinks and copy in _textfileSinks
+    references = [weakref.ref(sink), weakref.ref(copy)]
+    del sink, copy
+    gc.collect()
+    assert [reference() for reference in references] == [None, None]
+
+
+def test_batchWorkersWriteTheirCounters(tmp_path, sampleWord):
+    sink = PrometheusTextfileSink(str(tmp_path / 'metrics_{pid}.prom'), minInterval=3600)
+    sink.flush()
+    jobs = [BatchJob(sampleWord, 'pdf', str(tmp_path / 'export')), BatchJob(sampleWord, 'txt', str(tmp_path / 'export'))]
+    summary = convertBatch(jobs, 1, FakeBackend(), metricsSinks=[sink])
+    path = str(tmp_path / ('metrics_%d.prom' % summary.results[0].workerPid))
+    assert counters(path)['msofficefileconverter_jobs_total{program="Word.Application"}'] == 2.0
@@ -0,0 +1,77 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import pytest
+
+from MSOfficeFileConverter import OfficeApplicationPool, OpenProfile, WordDocument, ExcelDocument
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+class RecordingBackend(FakeBackend):
+    """FakeBackend keeping the applications it started, to look at them once quit."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.applications = []
+
+    def dispatch(self, progName):
+        application = super().dispatch(progName)
+        self.applications.append(application)
+        return application
+
+
+def wordSettings(application):
+    return (application.ScreenUpdating, application.DisplayAlerts, application.Options.Pagination, application.Options.UpdateLinksAtOpen)
+
+
+def test_wordProfileAppliedThenRestored(sampleWord, exportFolder):
+    backend = RecordingBackend()
+    pool = OfficeApplicationPool(backend)
+    WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    pool.close()
+    opened, = backend.opened
+    assert opened.arguments == {'ReadOnly': True, 'AddToRecentFiles': False}
+    assert (opened.settings['ScreenUpdating'], opened.settings['DisplayAlerts'], opened.settings['Options.Pagination'],
+            opened.settings['Options.UpdateLinksAtOpen']) == (False, 0, False, False)
+    assert wordSettings(backend.applications[0]) == (True, -1, True, True)
+
+
+def test_excelProfileAppliedThenRestored(sampleExcel, exportFolder):
+    backend = RecordingBackend()
+    pool = OfficeApplicationPool(backend)
+    ExcelDocument(sampleExcel, pool=pool).toPdf(exportFolder)
+    pool.close()
+    opened, = backend.opened
+    assert opened.arguments == {'ReadOnly': True, 'AddToMru': False, 'UpdateLinks': 0}
+    assert (opened.settings['EnableEvents'], opened.settings['DisplayAlerts']) == (False, False)
+    excel = backend.applications[0]
+    assert (excel.EnableEvents, excel.DisplayAlerts, excel.ScreenUpdating, excel.CalculateBeforeSave) == (True, True, True, True)
+
+
+def test_profileRestoredAfterFailedExport(sampleWord, exportFolder):
+    backend = RecordingBackend(failOn=['SampleWord'])
+    pool = OfficeApplicationPool(backend)
+    with pytest.raises(Exception, match='Simulated export failure'):
+        WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    pool.close()
+    assert wordSettings(backend.applications[0]) == (True, -1, True, True)
+
+
+def test_officeDefaultsChangeNothing(sampleWord, exportFolder):
+    backend = FakeBackend()
+    pool = OfficeApplicationPool(backend, openProfile=OpenProfile.officeDefaults())
+    WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    pool.close()
+    opened, = backend.opened
+    assert opened.arguments == {}
+    assert (opened.settings['ScreenUpdating'], opened.settings['DisplayAlerts'], opened.settings['Options.Pagination']) == (True, -1, True)
+
+
+def test_cacheOptionsOnlyForChangedExports():
+    assert OpenProfile().cacheOptions('Excel') == {}
+    assert OpenProfile(calculation='automatic').cacheOptions('Excel') == {'calculation': 'automatic'}
+    assert OpenProfile(updateLinks=True).cacheOptions('Word') == {'updateLinks': True}
+
+
+def test_invalidCalculation():
+    with pytest.raises(Exception, match='calculation'):
+        OpenProfile(calculation='sometimes')
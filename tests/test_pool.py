@@ -0,0 +1,114 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import threading
+import time
+
+import pytest
+
+from MSOfficeFileConverter import OfficeApplicationPool, WordDocument, ExcelDocument
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+def test_exportsReuseOneInstance(backend, pool, sampleWord, exportFolder):
+    for i in range(5):
+        WordDocument(sampleWord, pool=pool).toPdf(exportFolder, 'export%d.pdf' % i)
+    assert backend.dispatchCount == 1
+    assert backend.quitCount == 0
+    assert len(os.listdir(exportFolder)) == 5
+
+
+def test_maxUsesReplacesInstance(sampleWord, exportFolder):
+    backend = FakeBackend()
+    pool = OfficeApplicationPool(backend, maxUses=2)
+    for i in range(5):
+        WordDocument(sampleWord, pool=pool).toPdf(exportFolder, 'export%d.pdf' % i)
+    pool.close()
+    assert backend.dispatchCount == 3
+    assert backend.quitCount == 3
+
+
+def test_closeQuitsIdleInstances(backend, sampleWord, sampleExcel, exportFolder):
+    pool = OfficeApplicationPool(backend)
+    WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    ExcelDocument(sampleExcel, pool=pool).toPdf(exportFolder)
+    assert backend.quitCount == 0
+    pool.close()
+    assert backend.dispatchCount == 2
+    assert backend.quitCount == 2
+
+
+def test_instanceGivenBackAfterCloseIsQuit(backend):
+    pool = OfficeApplicationPool(backend)
+    with pool.borrow('Word.Application') as application:
+        pool.close()
+        assert backend.quitCount == 0
+    assert backend.quitCount == 1
+    assert application.closed
+
+
+def test_failedExportDiscardsInstance(sampleWord, exportFolder):
+    backend = FakeBackend(failOn=['SampleWord'])
+    pool = OfficeApplicationPool(backend)
+    for _ in range(2):
+        with pytest.raises(Exception, match='Simulated export failure'):
+            WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    pool.close()
+    assert backend.dispatchCount == 2
+    assert backend.quitCount == 2
+
+
+def test_sizeBoundsInstancesOfConcurrentThreads(sampleWord, exportFolder):
+    backend = FakeBackend(saveDelay=0.05)
+    pool = OfficeApplicationPool(backend, size=2)
+    errors = []
+
+    def export(index):
+        try:
+            WordDocument(sampleWord, pool=pool).toPdf(exportFolder, 'export%d.pdf' % index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=export, args=(i,)) for i in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.close()
+    assert errors == []
+    assert backend.dispatchCount == 2
+    assert len(os.listdir(exportFolder)) == 6
+
+
+class SlowKillBackend(FakeBackend):
+    """FakeBackend taking its time to kill an instance, so the job can finish while it is killed."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.killing = threading.Event()
+
+    def kill(self, application):
+        self.killing.set()
+        time.sleep(0.2)
+        super().kill(application)
+
+
+def test_jobFinishingDuringKillIsNotReused():
+    backend = SlowKillBackend()
+    pool = OfficeApplicationPool(backend, timeout=0.05)
+    with pool.borrow('Word.Application') as killed:
+        assert backend.killing.wait(5)
+    assert backend.killCount == 1
+    with pool.borrow('Word.Application') as application:
+        assert application is not killed
+    pool.close()
+    assert backend.dispatchCount == 2
+    assert backend.killCount == 1
+
+
+def test_borrowAfterCloseRaises(backend, sampleWord, exportFolder):
+    pool = OfficeApplicationPool(backend)
+    pool.close()
+    with pytest.raises(Exception, match='The pool is closed'):
+        WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    assert backend.dispatchCount == 0
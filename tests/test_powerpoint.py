@@ -0,0 +1,64 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import zipfile
+
+import pytest
+
+from MSOfficeFileConverter import ConversionCache, PowerPointDocument
+
+
+@pytest.fixture
+def presentation(tmp_path):
+    """A .pptx file of 5 slides, for the FakeBackend."""
+    path = str(tmp_path / 'slides.pptx')
+    with zipfile.ZipFile(path, 'w') as archive:
+        for number in range(1, 6):
+            archive.writestr('ppt/slides/slide%d.xml' % number, '<p:sld/>')
+    return path
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_fixedFormatSlideRange(presentation, pool, exportFolder):
+    assert 'of the slides' not in read(PowerPointDocument(presentation, pool=pool).toPdf(exportFolder).path)
+    result = PowerPointDocument(presentation, pool=pool, overwrite=True, slides=range(2, 4)).export(['pdf', 'xps'], exportFolder)
+    assert 'ExportAsFixedFormat of the slides 2 to 3' in read(result['pdf'].path)
+    assert 'ExportAsFixedFormat of the slides 2 to 3' in read(result['xps'].path)
+    # The slides after the last one are ignored.
+    assert 'of the slides 4 to 5' in read(PowerPointDocument(presentation, pool=pool, overwrite=True, slides=range(4, 9)).toPdf(exportFolder).path)
+
+
+def test_imagesOfTheSelectedSlides(presentation, pool, exportFolder):
+    result = PowerPointDocument(presentation, pool=pool, slides=[5, 1, 3, 7], imageWidth=480).toPng(exportFolder)
+    assert sorted(os.listdir(result.folder)) == ['1.png', '3.png', '5.png']
+    assert 'Slide 3 Export 480x270' in read(os.path.join(result.folder, '3.png'))
+    assert sorted(result.sheetSeconds) == [1, 3, 5]
+
+
+@pytest.mark.parametrize('slides, message', [
+    ([1, 3], 'consecutive slides'),
+    ([6, 7], 'only 5 slides'),
+])
+def test_slidesThatCannotBeExported(presentation, pool, exportFolder, slides, message):
+    with pytest.raises(Exception, match=message):
+        PowerPointDocument(presentation, pool=pool, slides=slides).toPdf(exportFolder)
+    assert os.listdir(exportFolder) == []
+
+
+@pytest.mark.parametrize('slides', [[], [0], [True], ['1']])
+def test_invalidSlides(presentation, pool, slides):
+    with pytest.raises(Exception, match='The slides must be numbers starting at 1'):
+        PowerPointDocument(presentation, pool=pool, slides=slides)
+
+
+def test_slidesAreAPartOfTheCacheKey(tmp_path, presentation, pool, backend, exportFolder):
+    cache = ConversionCache(str(tmp_path / 'cache'))
+    for slides in (range(1, 3), range(1, 3), range(2, 4), None):
+        PowerPointDocument(presentation, pool=pool, cache=cache, overwrite=True, slides=slides).toPdf(exportFolder)
+    assert len(backend.opened) == 3
+    assert cache.stats()['hits'] == 1
@@ -0,0 +1,61 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import pytest
+
+from MSOfficeFileConverter import ComBackend, MemoryRegistry, appPathsKey, prepareRegKeys
+
+officeFolder = 'C:\\Program Files\\Microsoft Office\\root\\Office16'
+securityKeys = ['Software\\Microsoft\\Office\\16.0\\%s\\Security' % program for program in ('Word', 'Excel')]
+
+
+def makeRegistry(stamp=1):
+    keys = {('HKLM', appPathsKey + '\\' + exe): {'Path': officeFolder} for exe in ('WINWORD.EXE', 'excel.exe')}
+    keys.update({('HKCU', path): {} for path in securityKeys})
+    executables = [officeFolder + '\\' + exe for exe in ('WINWORD.EXE', 'excel.exe')]
+    return MemoryRegistry(keys, fileVersions={path: (16, 0, 1, 1) for path in executables},
+                          fileStamps={path: [stamp, stamp] for path in executables})
+
+
+@pytest.fixture
+def markerPath(tmp_path):
+    return str(tmp_path / 'regkeys.json')
+
+
+def test_prepareRegKeysWritesSecurityValues(markerPath):
+    registry = makeRegistry()
+    prepareRegKeys(registry, markerPath)
+    for path in securityKeys:
+        assert registry.queryValue('HKCU', path, 'AccessVBOM') == 1
+        assert registry.queryValue('HKCU', path, 'VBAWarnings') == 1
+
+
+def test_registryWrittenOncePerProcess(markerPath):
+    registry = makeRegistry()
+    backends = [ComBackend(registry, markerPath) for _ in range(3)]
+    for backend in backends * 2:
+        backend.prepare()
+    assert registry.scans == 1
+
+
+def test_markerSkipsScanOfOtherProcesses(markerPath):
+    prepareRegKeys(makeRegistry(), markerPath)
+    # A new Registry object is what another process sees.
+    registry = makeRegistry()
+    prepareRegKeys(registry, markerPath)
+    assert registry.scans == 0
+    assert registry.prepared
+
+
+def test_officeUpdateScansAgain(markerPath):
+    prepareRegKeys(makeRegistry(), markerPath)
+    registry = makeRegistry(stamp=2)
+    prepareRegKeys(registry, markerPath)
+    assert registry.scans == 1
+
+
+def test_noMarkerScansEveryProcess():
+    for _ in range(2):
+        registry = makeRegistry()
+        prepareRegKeys(registry, None)
+        assert registry.scans == 1
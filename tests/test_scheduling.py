@@ -0,0 +1,77 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import pytest
+
+from MSOfficeFileConverter import BatchJob, IncrementalManifest, JobScheduler, LatencyModel, convertBatch
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+class RecordingScheduler(JobScheduler):
+    """JobScheduler keeping the priority of every queued job."""
+    def __init__(self):
+        super().__init__()
+        self.priorities = []
+
+    def put(self, item, seconds=0.0, priority='normal'):
+        self.priorities.append(priority)
+        super().put(item, seconds, priority)
+
+
+def test_schedulerOrdersByPriorityThenSeconds():
+    scheduler = JobScheduler(aging=0.0)
+    scheduler.put('long bulk', 1.0, 'bulk')
+    scheduler.put('long', 10.0)
+    scheduler.put('short', 1.0)
+    scheduler.put('interactive', 100.0, 'interactive')
+    assert [scheduler.get(block=False) for _ in range(4)] == ['interactive', 'short', 'long', 'long bulk']
+    with pytest.raises(Exception, match='Unknown priority'):
+        scheduler.put('job', 1.0, 'urgent')
+
+
+def test_latencyModelLearnsFromExports():
+    model = LatencyModel()
+    megabyte = 1024 * 1024
+    assert model.predict('Word', 'pdf', megabyte) == sum(LatencyModel.defaultFormat)
+    model.record('Word', 'pdf', megabyte, 1.0)
+    model.record('Word', 'pdf', 3 * megabyte, 2.0)
+    assert model.predict('Word', 'pdf', 2 * megabyte) == pytest.approx(1.5)
+
+
+def test_nativeFormatsDoNotOpenOffice(sampleExcel, sampleWord):
+    model = LatencyModel()
+    assert model.estimate(sampleExcel, ['csv']) < 0.1
+    assert model.estimate(sampleExcel, ['csv', 'pdf']) > 1.0
+    assert model.estimate(sampleWord, 'pdf') > 1.0
+
+
+def test_learnedOnlyOnceEveryPartWasExported(sampleWord):
+    model = LatencyModel()
+    assert not model.learned(sampleWord, ['pdf'])
+    model.record('Word', 'pdf', 1000, 0.5)
+    assert not model.learned(sampleWord, ['pdf'])
+    model.record('Word', 'open', 1000, 0.5)
+    assert model.learned(sampleWord, ['PDF'])
+
+
+def test_batchMeasuresOnlyLearnedPredictions(tmp_path, sampleWord):
+    model = LatencyModel()
+    jobs = [BatchJob(sampleWord, 'pdf', str(tmp_path / 'export'))]
+    summary = convertBatch(jobs, 1, FakeBackend(), latencyModel=model)
+    assert summary.results[0].predictedSeconds is None
+    assert summary.predictionError['count'] == 0
+    summary = convertBatch(jobs, 1, FakeBackend(), latencyModel=model)
+    assert summary.results[0].predictedSeconds is not None
+    assert summary.predictionError['count'] == 1
+    assert 'Predicted job time' in str(summary)
+
+
+def test_incrementalPlanKeepsPriority(tmp_path, sampleWord):
+    manifest = IncrementalManifest(None)
+    exportFolder = str(tmp_path / 'export')
+    convertBatch([BatchJob(sampleWord, 'pdf', exportFolder)], 1, FakeBackend(), incremental=manifest)
+    scheduler = RecordingScheduler()
+    summary = convertBatch([BatchJob(sampleWord, ['pdf', 'txt'], exportFolder, 'interactive')], 1, FakeBackend(),
+                           incremental=manifest, scheduler=scheduler)
+    assert summary.results[0].job.formats == ['txt']
+    assert scheduler.priorities == ['interactive']
@@ -0,0 +1,115 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import http.client
+import json
+import os
+import urllib.error
+import urllib.request
+
+import pytest
+
+import MSOfficeFileConverter.server
+from MSOfficeFileConverter import ConversionServer
+from MSOfficeFileConverter.server import _RequestBody
+from tests.conftest import rootFolder
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = ConversionServer(port=0, backend=FakeBackend(), workers=2, roots=[str(tmp_path)]).start()
+    yield server
+    server.stop()
+
+
+def request(server, path, data=None, contentType='application/json'):
+    """Return the status and the body of a request to the server."""
+    headers = {'Content-Type': contentType} if data is not None else {}
+    try:
+        with urllib.request.urlopen(urllib.request.Request('http://127.0.0.1:%d%s' % (server.port, path), data, headers), timeout=30) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def test_convertJson(server, sampleWord, exportFolder):
+    job = {'source': sampleWord, 'format': ['pdf', 'TXT'], 'destination': exportFolder}
+    status, body = request(server, '/convert', json.dumps(job).encode('utf-8'))
+    assert status == 200
+    results = json.loads(body.decode('utf-8'))['results']
+    assert sorted(results) == ['pdf', 'txt']
+    assert results['pdf']['path'] == os.path.join(exportFolder, 'SampleWord.pdf')
+    assert sorted(os.listdir(exportFolder)) == ['SampleWord.pdf', 'SampleWord.txt']
+
+
+def test_convertUpload(server):
+    with open(os.path.join(rootFolder, 'SampleWord.docx'), 'rb') as f:
+        document = f.read()
+    status, body = request(server, '/convert?format=PDF&name=upload.docx', document, 'application/octet-stream')
+    assert status == 200
+    assert body.startswith(b'SaveAs of ') and b'upload.docx' in body
+
+
+def test_uploadOfMultiFilesFormatIsRefused(server):
+    with open(os.path.join(rootFolder, 'SampleWord.docx'), 'rb') as f:
+        status, body = request(server, '/convert?format=html&name=upload.docx', f.read(), 'application/octet-stream')
+    assert status == 400
+    assert b'Multi-files formats' in body
+    # Refused before the upload is written and exported.
+    assert server.converter.backend.opened == []
+    assert request(server, '/convert?format=pdf&name=upload.txt', b'text', 'application/octet-stream')[0] == 400
+
+
+def test_largeUploadIsStreamedToAFile(server, monkeypatch):
+    sizes = []
+    openDocument = MSOfficeFileConverter.server.openDocument
+    monkeypatch.setattr(MSOfficeFileConverter.server, 'openDocument', lambda source, **kwargs: sizes.append(os.path.getsize(source)) or openDocument(source, **kwargs))
+    monkeypatch.setattr(_RequestBody, 'read', None)
+    with open(os.path.join(rootFolder, 'SampleWord.docx'), 'rb') as f:
+        document = f.read()
+    document += b'\0' * (3 * 1024 * 1024)
+    connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=30)
+    try:
+        # A refused body is skipped, so the next request of the connection is read.
+        connection.request('POST', '/unknown', document)
+        assert connection.getresponse().read() and connection.sock is not None
+        connection.request('POST', '/convert?format=pdf&name=large.docx', document)
+        response = connection.getresponse()
+        assert response.status == 200 and b'large.docx' in response.read()
+    finally:
+        connection.close()
+    assert sizes == [len(document)]
+
+
+def test_pathsOutsideTheRootsAreRefused(server, tmp_path, sampleWord, exportFolder):
+    outside = os.path.join(rootFolder, 'SampleWord.docx')
+    for job in ({'source': outside, 'format': 'pdf', 'destination': exportFolder},
+                {'source': sampleWord, 'format': 'pdf', 'destination': str(tmp_path.parent)},
+                {'source': os.path.join(exportFolder, '..', '..', 'file.docx'), 'format': 'pdf'}):
+        status, body = request(server, '/convert', json.dumps(job).encode('utf-8'))
+        assert status == 403 and b'roots' in body
+    job = {'source': sampleWord, 'format': 'pdf', 'destination': exportFolder, 'fileName': '../escaped'}
+    assert request(server, '/convert', json.dumps(job).encode('utf-8'))[0] == 400
+    assert server.converter.backend.opened == []
+
+    noRoots = ConversionServer(port=0, backend=FakeBackend(), workers=1).start()
+    try:
+        assert request(noRoots, '/convert', json.dumps({'source': sampleWord, 'format': 'pdf'}).encode('utf-8'))[0] == 403
+    finally:
+        noRoots.stop()
+
+
+def test_errors(server, tmp_path):
+    assert request(server, '/convert', b'garbage')[0] == 400
+    assert request(server, '/convert', json.dumps({'source': str(tmp_path / 'missing.docx'), 'format': 'pdf'}).encode('utf-8'))[0] == 500
+    assert request(server, '/unknown')[0] == 404
+
+
+def test_healthAndStats(server, sampleWord, exportFolder):
+    assert json.loads(request(server, '/health')[1].decode('utf-8')) == {'status': 'ok'}
+    request(server, '/convert', json.dumps({'source': sampleWord, 'format': 'pdf', 'destination': exportFolder}).encode('utf-8'))
+    request(server, '/convert', b'garbage')
+    stats = json.loads(request(server, '/stats')[1].decode('utf-8'))
+    assert (stats['requests'], stats['errors'], stats['completed'], stats['queued']) == (4, 1, 1, 0)
+    assert stats['latencyP50'] > 0
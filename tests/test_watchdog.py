@@ -0,0 +1,72 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+import zipfile
+
+import pytest
+
+from MSOfficeFileConverter import OfficeApplicationPool, Quarantine, ExportTimeout, WordDocument, convertBatch, jobsFromDirectory
+from tests.conftest import copySample
+from MSOfficeFileConverter.fakeoffice import FakeBackend
+
+
+def test_hangRaisesExportTimeout(sampleWord, exportFolder):
+    backend = FakeBackend(hangOn=['SampleWord'])
+    pool = OfficeApplicationPool(backend, timeout=0.3)
+    with pytest.raises(ExportTimeout):
+        WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    pool.close()
+    assert backend.killCount == 1
+    assert os.listdir(exportFolder) == []
+
+
+def test_killedInstanceIsReplaced(tmp_path, exportFolder):
+    hung = copySample(tmp_path / 'source', 'SampleWord.docx', 'hang.docx')
+    other = copySample(tmp_path / 'source', 'SampleWord.docx', 'other.docx')
+    backend = FakeBackend(hangOn=['hang'])
+    pool = OfficeApplicationPool(backend, timeout=0.3, retries=1)
+    with pytest.raises(ExportTimeout):
+        WordDocument(hung, pool=pool).toPdf(exportFolder)
+    WordDocument(other, pool=pool).toPdf(exportFolder)
+    pool.close()
+    assert backend.killCount == 2
+    assert backend.dispatchCount == 3
+    assert os.listdir(exportFolder) == ['other.pdf']
+
+
+def test_poolQuarantineRefusesDocument(sampleWord, exportFolder):
+    backend = FakeBackend(failOn=['SampleWord'])
+    quarantine = Quarantine(None, maxFailures=1)
+    pool = OfficeApplicationPool(backend, quarantine=quarantine)
+    with pytest.raises(Exception, match='Simulated export failure'):
+        WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    with pytest.raises(Exception, match='quarantined'):
+        WordDocument(sampleWord, pool=pool).toPdf(exportFolder)
+    pool.close()
+    assert backend.dispatchCount == 1
+    assert [entry['path'] for entry in quarantine.quarantined()] == [os.path.abspath(sampleWord)]
+
+
+def test_batchReportsHangCrashAndFailure(tmp_path):
+    for name in ('good', 'hang', 'crash', 'fail'):
+        # The Quarantine knows the documents by their content: each copy gets its own.
+        with zipfile.ZipFile(copySample(tmp_path / 'source', 'SampleWord.docx', name + '.docx'), 'a') as document:
+            document.writestr('customXml/name.xml', name)
+    jobs = jobsFromDirectory(str(tmp_path / 'source'), ['pdf'], str(tmp_path / 'export'))
+    backend = FakeBackend(hangOn=['hang'], crashOn=['crash'], failOn=['fail'])
+    quarantine = Quarantine(None, maxFailures=1)
+    summary = convertBatch(jobs, 2, backend, timeout=1, retries=1, quarantine=quarantine)
+    errors = {os.path.basename(result.job.source): result.error for result in summary.results}
+    assert errors['good.docx'] is None
+    assert errors['hang.docx'].startswith('ExportTimeout')
+    assert errors['crash.docx'].startswith('Worker process died')
+    assert 'Simulated export failure' in errors['fail.docx']
+    assert summary.workerCrashes == 2
+    assert os.listdir(str(tmp_path / 'export')) == ['good.pdf']
+    assert len(quarantine.quarantined()) == 3
+
+    summary = convertBatch(jobs, 2, backend, timeout=1, retries=1, quarantine=quarantine)
+    attempts = {os.path.basename(result.job.source): result.attempts for result in summary.results}
+    assert attempts == {'good.docx': 1, 'hang.docx': 0, 'crash.docx': 0, 'fail.docx': 0}
+    assert all(result.error.startswith('Quarantined') for result in summary.results if result.attempts == 0)
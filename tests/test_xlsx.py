@@ -0,0 +1,159 @@
+# Autor : FanaticPythoner.
+# Please read the "LICENSE" file before doing anything.
+
+import os
+
+import pytest
+
+from MSOfficeFileConverter import ExcelDocument
+from MSOfficeFileConverter.utils import _NativeUnsupported
+from MSOfficeFileConverter.xlsx import _exportNativeCsv, _SharedStrings, _XlsxReader
+from tests.conftest import buildWorkbook, rootFolder
+
+cellsRows = (
+    '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="inlineStr"><is><t>Value, with comma</t></is></c>'
+    '<c r="C1" t="str"><f>A1</f><v>say "hi"</v></c></row>'
+    '<row r="2"><c r="A2"><v>1</v></c><c r="B2"><v>2.5</v></c><c r="C2" t="b"><v>1</v></c><c r="D2" t="e"><v>#DIV/0!</v></c></row>'
+    '<row r="4"><c r="A4" t="s"><v>1</v></c><c r="D4" t="b"><v>0</v></c></row>'
+    '<row r="6"><c r="A6"><v>1234567.891</v></c><c r="B6"><v>123456789012</v></c><c r="C6"><v>0.1</v></c>'
+    '<c r="D6"><v>-0.000012345678</v></c></row>')
+
+cellsCsv = ('Name,"Value, with comma","say ""hi""",\r\n'
+            '1,2.5,TRUE,#DIV/0!\r\n'
+            ',,,\r\n'
+            '"multi\nline",,,FALSE\r\n'
+            ',,,\r\n'
+            '1234567.891,1.23457E+11,0.1,-1.2346E-05\r\n'
+            ',,,\r\n')
+
+
+def exportCsv(path, exportFolder, enumNum=6):
+    sheetSeconds = _exportNativeCsv(path, exportFolder, '.csv', enumNum)
+    return {number: open(os.path.join(exportFolder, '%d.csv' % number), 'rb').read() for number in sheetSeconds}
+
+
+def test_sampleExcelGolden(exportFolder):
+    camera = 'MOM BRING THE CAMERA,,MOM BRING THE CAMERA,,MOM BRING THE CAMERA\r\n'
+    assert exportCsv(os.path.join(rootFolder, 'SampleExcel.xlsx'), exportFolder) == {
+        1: b'IS THIS REAL\r\n' * 14,
+        2: b'MAN THIS IS AWESOME\r\n\r\n' * 8 + b'MAN THIS IS AWESOME\r\n',
+        3: ((camera + ',,,,\r\n' * 2) * 2 + camera).encode('cp1252'),
+    }
+
+
+def test_cellKindsEmptyRowsAndQuoting(tmp_path, exportFolder):
+    path = buildWorkbook(tmp_path / 'cells.xlsx', [('Data', cellsRows, 'A1:D7')], ['Name', 'multi\nline'])
+    assert exportCsv(path, exportFolder) == {1: cellsCsv.encode('cp1252')}
+
+
+def test_encodingOfTheCsvFormats(tmp_path, exportFolder):
+    path = buildWorkbook(tmp_path / 'accents.xlsx', [('Data', '<row r="1"><c r="A1" t="inlineStr"><is><t>café</t></is></c></row>', 'A1')])
+    assert exportCsv(path, exportFolder, 6) == {1: b'caf\xe9\r\n'}
+    assert exportCsv(path, exportFolder, 62) == {1: b'\xef\xbb\xbfcaf\xc3\xa9\r\n'}
+    assert exportCsv(path, exportFolder, 22) == {1: b'caf\x8e\r'}
+
+
+def test_missingOrWrongDimension(tmp_path, exportFolder):
+    rows = '<row r="2"><c r="B2"><v>1</v></c></row><row r="3"><c r="C3"><v>2</v></c></row>'
+    expected = {1: b'1,\r\n,2\r\n', 2: b'1,\r\n,2\r\n'}
+    path = buildWorkbook(tmp_path / 'dimension.xlsx', [('Missing', rows, None), ('Wrong', rows, 'B2')])
+    assert exportCsv(path, exportFolder) == expected
+
+
+@pytest.mark.parametrize('numberFormat', [14, 164])
+def test_formattedNumbersAreNotNative(tmp_path, exportFolder, numberFormat):
+    rows = '<row r="1"><c r="A1"><v>1</v></c><c r="B1" s="1"><v>45000.5</v></c></row>'
+    path = buildWorkbook(tmp_path / 'formatted.xlsx', [('Data', rows, 'A1:B1')], cellFormats=(0, numberFormat), numberFormats={164: '0.00%'})
+    with pytest.raises(_NativeUnsupported):
+        _exportNativeCsv(path, exportFolder, '.csv', 6)
+    assert os.listdir(exportFolder) == []
+
+
+def test_formattedNumbersExportedByExcel(tmp_path, pool, backend, exportFolder):
+    rows = '<row r="1"><c r="A1" s="1"><v>45000.5</v></c></row>'
+    path = buildWorkbook(tmp_path / 'dates.xlsx', [('Data', rows, 'A1')], cellFormats=(0, 14))
+    result = ExcelDocument(path, pool=pool).toCsv(exportFolder)
+    assert result.engine == 'office'
+    assert len(backend.opened) == 1
+
+
+def test_plainWorkbookDoesNotStartExcel(tmp_path, pool, backend, exportFolder):
+    path = buildWorkbook(tmp_path / 'cells.xlsx', [('Data', cellsRows, 'A1:D7')], ['Name', 'multi\nline'])
+    result = ExcelDocument(path, pool=pool).toCsv(exportFolder)
+    assert result.engine == 'native'
+    assert backend.dispatchCount == 0
+    assert open(os.path.join(result.folder, '1.csv'), 'rb').read() == cellsCsv.encode('cp1252')
+
+
+rowsXml = ''.join('<row r="%d"><c r="A%d"><v>%d</v></c><c r="B%d" t="inlineStr"><is><t>b%d</t></is></c><c r="C%d" t="b"><v>%d</v></c></row>'
+                  % (number, number, number, number, number, number, number % 2) for number in (1, 2, 3, 5))
+
+
+@pytest.fixture
+def rowsWorkbook(tmp_path):
+    return buildWorkbook(tmp_path / 'rows.xlsx', [('Data', rowsXml, 'A1:C6'), ('Other', '<row r="1"><c r="A1"><v>7</v></c></row>', 'A1')])
+
+
+def test_iterRowsSlicing(rowsWorkbook, pool, backend):
+    document = ExcelDocument(rowsWorkbook, pool=pool)
+    empty = (None, None, None)
+    assert list(document.iterRows()) == [(1, 'b1', True), (2, 'b2', False), (3, 'b3', True), empty, (5, 'b5', True), empty]
+    assert list(document.iterRows(stop=2)) == [(1, 'b1', True), (2, 'b2', False)]
+    assert list(document.iter_rows('Data', columns=['C', 1], start=2, stop=5)) == [(True, 3), (None, None), (True, 5)]
+    assert list(document.iterRows(2)) == [(7,)]
+    assert list(document.iterRows(start=10)) == list(document.iterRows(stop=0)) == []
+    assert backend.dispatchCount == 0
+
+
+@pytest.mark.parametrize('arguments, message', [
+    ({'start': -1}, 'start and stop'),
+    ({'stop': -1}, 'start and stop'),
+    ({'columns': [0]}, 'The columns'),
+    ({'sheet': 'Missing'}, 'no sheet'),
+    ({'sheet': 3}, 'no sheet'),
+])
+def test_iterRowsRaisesAtTheCall(rowsWorkbook, pool, arguments, message):
+    with pytest.raises(Exception, match=message):
+        ExcelDocument(rowsWorkbook, pool=pool).iterRows(**arguments)
+
+
+def test_iterRowsThroughExcel(rowsWorkbook, pool, backend):
+    document = ExcelDocument(rowsWorkbook, pool=pool, native=False)
+    with pytest.raises(Exception, match='start and stop'):
+        document.iterRows(start=-1)
+    assert backend.dispatchCount == 0
+    assert list(document.iterRows(columns=['B'], start=1, stop=3)) == [('b2',), ('b3',)]
+    assert len(backend.opened) == 1
+
+
+def test_sharedStringsSpillOverTheirBudget():
+    texts = ['text %d é' % index for index in range(3000)]
+    taken = []
+    strings = _SharedStrings((taken.append(text) or text for text in texts), maxMemory=1000, cacheSize=2)
+    assert strings[0] == 'text 0 é'
+    # Read by batches, not all at once.
+    assert len(taken) < len(texts)
+    assert strings.spilled
+    assert [strings[index] for index in (2999, 5, 1500, 5)] == ['text 2999 é', 'text 5 é', 'text 1500 é', 'text 5 é']
+    assert len(strings) == len(texts)
+    with pytest.raises(IndexError):
+        strings[len(texts)]
+    strings.close()
+
+    small = _SharedStrings(texts[:10], maxMemory=1000)
+    assert list(small[index] for index in range(10)) == texts[:10] and not small.spilled
+    small.close()
+
+
+def test_spilledSharedStringsExportTheSameCsv(tmp_path):
+    texts = ['shared string number %d' % index for index in range(500)]
+    # The last strings first: read from the file, not in order.
+    rows = ''.join('<row r="%d"><c r="A%d" t="s"><v>%d</v></c></row>' % (index + 1, index + 1, 499 - index) for index in range(500))
+    path = buildWorkbook(tmp_path / 'strings.xlsx', [('Data', rows, 'A1:A500')], texts)
+    with _XlsxReader(path, 1024) as reader:
+        assert reader.sharedStrings[499] == texts[499] and reader.sharedStrings.spilled
+    os.makedirs(str(tmp_path / 'memory'))
+    os.makedirs(str(tmp_path / 'file'))
+    inMemory = exportCsv(path, str(tmp_path / 'memory'))
+    assert _exportNativeCsv(path, str(tmp_path / 'file'), '.csv', 6, sharedStringsMemory=1024) is not None
+    assert open(str(tmp_path / 'file' / '1.csv'), 'rb').read() == inMemory[1] == ''.join(text + '\r\n' for text in reversed(texts)).encode('cp1252')